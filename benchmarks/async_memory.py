@@ -0,0 +1,96 @@
+"""Compare sync (threadpool) and async (event loop) memory recall routes.
+
+Both variants are bare FastAPI apps with the same recall route, header
+dependency and response model, and no middleware; they differ only in
+whether the handler is ``def`` (dispatched to anyio's threadpool) or
+``async def`` (awaiting ``LocalMemoryBackend`` on the event loop). Fires N
+concurrent GET /memory requests in-process through httpx's ASGI transport
+and reports throughput and latency percentiles for each variant.
+
+Usage:
+    uv run python -m benchmarks.async_memory [concurrency] [rounds]
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+
+import httpx
+from fastapi import FastAPI, Header
+
+from src.models import MemoryResponse
+from src.services.memory import get_memory
+from src.services.memory_backend import LocalMemoryBackend
+
+
+def build_sync_app() -> FastAPI:
+    """Recall route as a sync handler, run through the threadpool."""
+    sync_app = FastAPI()
+
+    @sync_app.get("/memory", response_model=MemoryResponse)
+    def memory_recall(
+        x_session_id: str | None = Header(default=None),
+    ) -> MemoryResponse:
+        return MemoryResponse(value=get_memory(x_session_id or ""), message="ok")
+
+    return sync_app
+
+
+def build_async_app() -> FastAPI:
+    """Recall route as a coroutine awaiting the in-process backend."""
+    async_app = FastAPI()
+    backend = LocalMemoryBackend()
+
+    @async_app.get("/memory", response_model=MemoryResponse)
+    async def memory_recall(
+        x_session_id: str | None = Header(default=None),
+    ) -> MemoryResponse:
+        value = await backend.get(x_session_id or "")
+        return MemoryResponse(value=value, message="ok")
+
+    return async_app
+
+
+async def run(app: FastAPI, concurrency: int, rounds: int) -> tuple[float, list[float]]:
+    """Return (requests/sec, per-request latencies in ms)."""
+    transport = httpx.ASGITransport(app=app)
+    latencies: list[float] = []
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+
+        async def one(i: int) -> None:
+            start = time.perf_counter()
+            response = await client.get("/memory", headers={"X-Session-ID": f"s{i}"})
+            latencies.append((time.perf_counter() - start) * 1000)
+            assert response.status_code == 200
+
+        started = time.perf_counter()
+        for _ in range(rounds):
+            await asyncio.gather(*(one(i) for i in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return concurrency * rounds / elapsed, latencies
+
+
+def report(name: str, rps: float, latencies: list[float]) -> None:
+    cuts = statistics.quantiles(latencies, n=100)
+    print(
+        f"{name:>6}: {rps:10.0f} req/s  p50={cuts[49]:7.2f}ms  "
+        f"p99={cuts[98]:7.2f}ms  max={max(latencies):7.2f}ms"
+    )
+
+
+def main() -> None:
+    concurrency = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    print(f"concurrency={concurrency} rounds={rounds}")
+    for name, app in (("sync", build_sync_app()), ("async", build_async_app())):
+        rps, latencies = asyncio.run(run(app, concurrency, rounds))
+        report(name, rps, latencies)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Cold-start report: per-module import time and time to first request.
+
+Runs each measurement in a fresh interpreter. The import report is parsed
+from ``python -X importtime``; time to first request covers importing the
+app, running the startup lifespan (including warmup) and serving
+GET /health. Exits non-zero when the budget is exceeded.
+
+Usage:
+    uv run python -m benchmarks.cold_start [budget_ms] [top_n]
+"""
+
+import subprocess
+import sys
+
+FIRST_REQUEST = """
+import time
+from starlette.testclient import TestClient
+started = time.perf_counter()
+from src.main import app
+with TestClient(app) as client:
+    assert client.get("/health").status_code == 200
+print((time.perf_counter() - started) * 1000)
+"""
+
+
+def import_report() -> list[tuple[int, int, str]]:
+    """Return (self_us, cumulative_us, module) for every import of src.main."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.main"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, module = line.removeprefix("import time:").split("|")
+        rows.append((int(own), int(cumulative), module.strip()))
+    return rows
+
+
+def time_to_first_request() -> float:
+    """Return milliseconds from importing the app to the first response."""
+    result = subprocess.run(
+        [sys.executable, "-c", FIRST_REQUEST],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout.strip())
+
+
+def main() -> int:
+    budget_ms = float(sys.argv[1]) if len(sys.argv) > 1 else 1500.0
+    top_n = int(sys.argv[2]) if len(sys.argv) > 2 else 15
+
+    rows = import_report()
+    print(f"Top {top_n} imports by cumulative time:")
+    for own, cumulative, module in sorted(rows, key=lambda r: -r[1])[:top_n]:
+        print(f"  {cumulative / 1000:8.1f}ms  (self {own / 1000:6.1f}ms)  {module}")
+    print("Project modules:")
+    for own, cumulative, module in rows:
+        if module.startswith("src"):
+            print(f"  {cumulative / 1000:8.1f}ms  (self {own / 1000:6.1f}ms)  {module}")
+
+    elapsed = time_to_first_request()
+    verdict = "OK" if elapsed <= budget_ms else "OVER BUDGET"
+    print(
+        f"Time to first request: {elapsed:.1f}ms (budget {budget_ms:.0f}ms) {verdict}"
+    )
+    return 0 if elapsed <= budget_ms else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
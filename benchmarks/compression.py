@@ -0,0 +1,56 @@
+"""Compare CPU time against bytes saved for each codec and level.
+
+Usage:
+    uv run python -m benchmarks.compression [records]
+"""
+
+import json
+import random
+import sys
+import time
+
+from src.compression import make_compressor
+
+CODECS = ("gzip", "br", "zstd")
+LEVELS = (1, 3, 6, 9)
+
+
+def payloads(records: int) -> dict[str, bytes]:
+    """Build batch-response and export-shaped bodies."""
+    rng = random.Random(0)
+    values = {
+        f"session-{index:06d}": round(rng.uniform(-1e6, 1e6), 2)
+        for index in range(records)
+    }
+    batch = json.dumps({"values": values, "message": "Batch applied to memory"})
+    export = "".join(
+        json.dumps({"session_id": session_id, "memory": value}, separators=(",", ":"))
+        + "\n"
+        for session_id, value in values.items()
+    )
+    return {"batch": batch.encode(), "export": export.encode()}
+
+
+def main() -> None:
+    """Print ratio and throughput per payload, codec and level."""
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    for name, body in payloads(records).items():
+        print(f"{name}: {len(body)} bytes")
+        for coding in CODECS:
+            for level in LEVELS:
+                compressor = make_compressor(coding, level)
+                if compressor is None:
+                    print(f"  {coding:5} not installed")
+                    break
+                started = time.perf_counter()
+                size = len(compressor.compress(body) + compressor.finish())
+                elapsed = time.perf_counter() - started
+                print(
+                    f"  {coding:5} level {level}: {size:9d} bytes "
+                    f"({len(body) / size:5.1f}x)  {elapsed * 1000:7.2f} ms  "
+                    f"{len(body) / elapsed / 1e6:7.1f} MB/s"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Compare requests/sec for POST /calculate via the router and the fast lane.
+
+Usage:
+    uv run python -m benchmarks.fast_lane [requests] [concurrency]
+"""
+
+import asyncio
+import sys
+import time
+from dataclasses import replace
+
+import httpx
+from starlette.types import ASGIApp
+
+from src import config
+from src.fastlane import CalculateFastLane
+from src.main import app
+from src.ratelimit import limiter
+
+BODY = b'{"operand1": 12.5, "operand2": 3.5, "operator": "*"}'
+HEADERS = {"content-type": "application/json"}
+
+
+async def run(target: ASGIApp, requests: int, concurrency: int) -> float:
+    """Return requests/sec for POST /calculate against an ASGI app."""
+    transport = httpx.ASGITransport(app=target)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+
+        async def worker(count: int) -> None:
+            for _ in range(count):
+                response = await client.post(
+                    "/calculate", content=BODY, headers=HEADERS
+                )
+                assert response.status_code == 200
+
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(worker(requests // concurrency) for _ in range(concurrency))
+        )
+        return requests / (time.perf_counter() - started)
+
+
+def main() -> None:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    print(f"requests={requests} concurrency={concurrency}")
+    # Every request comes from one client; measure routing, not 429s.
+    config.settings = replace(
+        config.settings, rate_limit_rate=0.0, rate_limit_routes=""
+    )
+    limiter.clear()
+    router_rps = asyncio.run(run(app, requests, concurrency))
+    fast_rps = asyncio.run(run(CalculateFastLane(app), requests, concurrency))
+    print(f"  router:    {router_rps:10.0f} req/s")
+    print(f"  fast lane: {fast_rps:10.0f} req/s  ({fast_rps / router_rps:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Measure MetricsMiddleware overhead relative to a full request.
+
+Usage:
+    uv run python -m benchmarks.metrics_overhead [requests]
+"""
+
+import asyncio
+import sys
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.main import app
+from src.metrics import MetricsMiddleware
+
+BODY = b'{"operand1": 12.5, "operand2": 3.5, "operator": "*"}'
+SCOPE = {
+    "type": "http",
+    "asgi": {"version": "3.0"},
+    "http_version": "1.1",
+    "method": "POST",
+    "scheme": "http",
+    "path": "/calculate",
+    "raw_path": b"/calculate",
+    "query_string": b"",
+    "root_path": "",
+    "headers": [(b"content-type", b"application/json")],
+    "client": ("127.0.0.1", 0),
+    "server": ("127.0.0.1", 80),
+}
+
+
+async def _receive() -> Message:
+    return {"type": "http.request", "body": BODY, "more_body": False}
+
+
+async def _send(message: Message) -> None:
+    pass
+
+
+async def _empty(scope: Scope, receive: Receive, send: Send) -> None:
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def per_request(target: ASGIApp, requests: int) -> float:
+    """Return mean seconds per in-process request."""
+    started = time.perf_counter()
+    for _ in range(requests):
+        await target(dict(SCOPE), _receive, _send)
+    return (time.perf_counter() - started) / requests
+
+
+def main() -> None:
+    """Print middleware cost as a share of a full POST /calculate."""
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    bare = asyncio.run(per_request(_empty, requests))
+    wrapped = asyncio.run(per_request(MetricsMiddleware(_empty), requests))
+    full = asyncio.run(per_request(app, requests // 10))
+    overhead = wrapped - bare
+    print(f"requests={requests}")
+    print(f"  middleware overhead: {overhead * 1e6:7.2f} us/request")
+    print(f"  full POST /calculate: {full * 1e6:7.2f} us/request")
+    print(f"  share of request:    {overhead / full:7.2%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Measure the per-request cost of a rate-limit check.
+
+Usage:
+    uv run python -m benchmarks.rate_limit [checks] [clients]
+"""
+
+import sys
+import time
+
+from src.ratelimit import RateLimiter, client_key
+
+
+def main() -> None:
+    """Report nanoseconds per key extraction and per bucket check."""
+    checks = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    clients = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+    limiter = RateLimiter()
+    scopes = [
+        {
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"x-session-id", f"session-{index}".encode()),
+            ],
+            "client": ("127.0.0.1", 0),
+        }
+        for index in range(clients)
+    ]
+    keys = [client_key(scope) for scope in scopes]
+    print(f"{checks} checks over {clients} clients")
+
+    started = time.perf_counter()
+    for index in range(checks):
+        client_key(scopes[index % clients])
+    elapsed = time.perf_counter() - started
+    print(f"  client key:   {elapsed / checks * 1e9:6.0f} ns")
+
+    started = time.perf_counter()
+    for index in range(checks):
+        limiter.check("/memory/add", keys[index % clients])
+    elapsed = time.perf_counter() - started
+    print(f"  bucket check: {elapsed / checks * 1e9:6.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
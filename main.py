@@ -1,5 +1,73 @@
-def main():
-    print("Hello from gbm-test-calc!")
+"""Production server launcher for the calculator API.
+
+Reads bind address, worker count and connection limits from ``CALC_SERVER_*``
+environment variables (see ``src.config``) and starts uvicorn, using uvloop
+and httptools when they are installed.
+"""
+
+import importlib.util
+import logging
+from typing import Any
+
+import uvicorn
+
+from src import config
+
+APP = "src.main:app"
+
+logger = logging.getLogger(__name__)
+
+
+def _installed(module: str) -> bool:
+    """Return whether an optional module can be imported."""
+    return importlib.util.find_spec(module) is not None
+
+
+def server_options(settings: config.Settings) -> dict[str, Any]:
+    """Build uvicorn keyword arguments from settings.
+
+    Client addresses are taken from X-Forwarded-For only when the peer is
+    one of ``server_forwarded_allow_ips``.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        Keyword arguments for ``uvicorn.run``
+    """
+    options: dict[str, Any] = {
+        "loop": "uvloop" if _installed("uvloop") else "asyncio",
+        "http": "httptools" if _installed("httptools") else "h11",
+        "workers": settings.server_workers,
+        "timeout_keep_alive": settings.server_keep_alive_s,
+        "backlog": settings.server_backlog,
+        "timeout_graceful_shutdown": settings.server_graceful_timeout_s,
+        "proxy_headers": True,
+        "forwarded_allow_ips": settings.server_forwarded_allow_ips,
+    }
+    if settings.server_uds:
+        options["uds"] = settings.server_uds
+    else:
+        options["host"] = settings.server_host
+        options["port"] = settings.server_port
+    if settings.server_limit_concurrency > 0:
+        options["limit_concurrency"] = settings.server_limit_concurrency
+    return options
+
+
+def main() -> None:
+    """Start the API server."""
+    settings = config.settings
+    if settings.server_workers > 1:
+        # Sessions, memory, history, rate-limit buckets and admission slots
+        # live in each worker's process; nothing is shared between them.
+        logger.warning(
+            "CALC_SERVER_WORKERS=%d starts independent processes: session "
+            "memory, history, rate limits and admission limits are per worker, "
+            "so clients must be pinned to one worker (e.g. sticky sessions)",
+            settings.server_workers,
+        )
+    uvicorn.run(APP, **server_options(settings))
 
 
 if __name__ == "__main__":
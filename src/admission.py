@@ -0,0 +1,217 @@
+"""Admission control: per-route-class concurrency limits with load shedding."""
+
+import asyncio
+import json
+from collections import deque
+from dataclasses import dataclass, field
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src import config
+
+# First path segments that are never queued or shed.
+EXEMPT = frozenset({"health", "ready", "metrics", "openapi.json", "docs", "redoc"})
+
+_OVERLOADED_BODY = json.dumps(
+    {"error": "Server overloaded, retry later", "code": "OVERLOADED"},
+    separators=(",", ":"),
+).encode()
+
+
+def parse_limits(spec: str) -> dict[str, int]:
+    """Parse ``class=limit`` pairs, e.g. ``"calculate=64,memory=128"``."""
+    limits: dict[str, int] = {}
+    for item in spec.split(","):
+        name, _, limit = item.partition("=")
+        if name.strip() and limit.strip():
+            limits[name.strip()] = int(limit)
+    return limits
+
+
+# Long-lived streams get their own class so they never hold the slots of
+# the short requests on the same prefix.
+_STREAM_CLASSES = {"/memory/events": "memory-events"}
+
+# First path segments served by the application's routers.
+_ROUTE_CLASSES = frozenset({"calculate", "memory", "history", "admin"}) | EXEMPT
+
+# Class shared by every path outside the known prefixes, so arbitrary
+# request paths cannot create unbounded per-class state.
+UNMATCHED = "unmatched"
+
+
+def route_class(path: str) -> str:
+    """Return the route class for a path.
+
+    Streams have their own class; other known routes are classed by their
+    first segment, and everything else falls into ``UNMATCHED``.
+    """
+    stream = _STREAM_CLASSES.get(path)
+    if stream is not None:
+        return stream
+    segment = path.lstrip("/").split("/", 1)[0]
+    return segment if segment in _ROUTE_CLASSES else UNMATCHED
+
+
+@dataclass
+class _RouteClassState:
+    """Slots and waiters for one route class."""
+
+    limit: int
+    in_flight: int = 0
+    admitted: int = 0
+    shed: int = 0
+    waiters: deque[asyncio.Future[None]] = field(default_factory=deque)
+
+
+@dataclass(frozen=True)
+class RouteClassStats:
+    """Point-in-time admission figures for one route class."""
+
+    limit: int
+    in_flight: int
+    queued: int
+    admitted: int
+    shed: int
+
+
+class AdmissionController:
+    """Track in-flight and queued requests per route class.
+
+    A request runs immediately while its class is under its concurrency
+    limit. Otherwise it waits in a FIFO queue for a released slot; once the
+    queue is full, or the wait exceeds the queue-time budget, the request
+    is shed so clients back off instead of timing out behind the backlog.
+    """
+
+    def __init__(self) -> None:
+        self._classes: dict[str, _RouteClassState] = {}
+
+    def _state(self, name: str) -> _RouteClassState:
+        state = self._classes.get(name)
+        if state is None:
+            settings = config.settings
+            limits = parse_limits(settings.admission_limits)
+            state = _RouteClassState(limits.get(name, settings.admission_max_in_flight))
+            self._classes[name] = state
+        return state
+
+    async def acquire(self, name: str) -> bool:
+        """Wait for a slot in a route class.
+
+        Args:
+            name: Route class
+
+        Returns:
+            True if admitted, False if the request should be shed
+        """
+        state = self._state(name)
+        if state.in_flight < state.limit and not state.waiters:
+            state.in_flight += 1
+            state.admitted += 1
+            return True
+        settings = config.settings
+        if len(state.waiters) >= settings.admission_max_queue:
+            state.shed += 1
+            return False
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        state.waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, settings.admission_queue_timeout_ms / 1000)
+        except asyncio.CancelledError:
+            # The caller never runs, so give back a slot already handed over.
+            if waiter.done() and not waiter.cancelled():
+                self.release(name)
+            elif waiter in state.waiters:
+                state.waiters.remove(waiter)
+            raise
+        except TimeoutError:
+            if not waiter.done() or waiter.cancelled():
+                if waiter in state.waiters:
+                    state.waiters.remove(waiter)
+                state.shed += 1
+                return False
+        state.admitted += 1
+        return True
+
+    def release(self, name: str) -> None:
+        """Free a slot, handing it straight to the oldest live waiter.
+
+        Args:
+            name: Route class
+        """
+        state = self._classes[name]
+        while state.waiters:
+            waiter = state.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        state.in_flight -= 1
+
+    def reset(self) -> None:
+        """Forget every idle route class and its counters.
+
+        Classes with requests in flight or queued are kept, so their slots
+        are still released to the right state.
+        """
+        self._classes = {
+            name: state
+            for name, state in self._classes.items()
+            if state.in_flight or state.waiters
+        }
+
+    def stats(self) -> dict[str, RouteClassStats]:
+        """Return admission figures for every route class seen so far."""
+        return {
+            name: RouteClassStats(
+                limit=state.limit,
+                in_flight=state.in_flight,
+                queued=len(state.waiters),
+                admitted=state.admitted,
+                shed=state.shed,
+            )
+            for name, state in self._classes.items()
+        }
+
+
+controller = AdmissionController()
+
+
+class AdmissionMiddleware:
+    """ASGI middleware applying admission control to HTTP requests."""
+
+    def __init__(
+        self, app: ASGIApp, admission: AdmissionController | None = None
+    ) -> None:
+        self.app = app
+        self.admission = admission or controller
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        name = route_class(scope["path"])
+        if name in EXEMPT:
+            await self.app(scope, receive, send)
+            return
+        if not await self.admission.acquire(name):
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 503,
+                    "headers": [
+                        (b"content-length", str(len(_OVERLOADED_BODY)).encode()),
+                        (b"content-type", b"application/json"),
+                        (
+                            b"retry-after",
+                            str(config.settings.admission_retry_after_s).encode(),
+                        ),
+                    ],
+                }
+            )
+            await send({"type": "http.response.body", "body": _OVERLOADED_BODY})
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.admission.release(name)
@@ -0,0 +1,73 @@
+"""HTTP validator helpers shared by cacheable endpoints."""
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Return whether an If-None-Match header matches an entity tag.
+
+    Uses the weak comparison RFC 9110 prescribes for If-None-Match, so
+    ``W/"x"`` matches ``"x"``.
+
+    Args:
+        if_none_match: Raw If-None-Match header value, if present
+        etag: Current entity tag, including quotes
+
+    Returns:
+        True if the client's cached representation is current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def _quality(params: str) -> float:
+    """Return the q-value in an Accept-Encoding entry's parameters (1 if absent)."""
+    for param in params.split(";"):
+        name, _, value = param.strip().partition("=")
+        if name.strip().lower() == "q":
+            try:
+                return float(value)
+            except ValueError:
+                return 1.0
+    return 1.0
+
+
+def accepts_encoding(accept_encoding: str | None, coding: str) -> bool:
+    """Return whether an Accept-Encoding header allows a content coding.
+
+    An entry naming the coding takes precedence over ``*``, wherever each
+    appears in the header, so ``*;q=0, gzip`` accepts gzip.
+
+    Args:
+        accept_encoding: Raw Accept-Encoding header value, if present
+        coding: Content coding name, e.g. "gzip"
+
+    Returns:
+        True if the coding, or failing that ``*``, is listed without ``q=0``
+    """
+    if not accept_encoding:
+        return False
+    wildcard: float | None = None
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if name == coding:
+            return _quality(params) > 0
+        if name == "*":
+            wildcard = _quality(params)
+    return wildcard is not None and wildcard > 0
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        if name.strip().lower() not in (coding, "*"):
+            continue
+        quality = params.strip().removeprefix("q=")
+        try:
+            return not params or float(quality) > 0
+        except ValueError:
+            return True
+    return False
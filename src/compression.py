@@ -0,0 +1,239 @@
+"""Accept-Encoding negotiation and response compression middleware."""
+
+import functools
+import zlib
+from typing import Any, Protocol
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src import config
+from src.caching import accepts_encoding
+from src.startup import optional_module
+
+# Media types worth compressing; everything else passes through untouched.
+_COMPRESSIBLE = ("application/json", "application/x-ndjson", "text/")
+# Events must reach subscribers as soon as they are written.
+_INCOMPRESSIBLE = ("text/event-stream",)
+
+
+class Compressor(Protocol):
+    """Incremental compressor for one response body."""
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk, possibly buffering output."""
+        ...
+
+    def flush(self) -> bytes:
+        """Emit everything compressed so far without ending the stream."""
+        ...
+
+    def finish(self) -> bytes:
+        """Emit the remaining output and end the stream."""
+        ...
+
+
+class _GzipCompressor:
+    def __init__(self, level: int) -> None:
+        self._stream = zlib.compressobj(min(level, 9), zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._stream.compress(data)
+
+    def flush(self) -> bytes:
+        return self._stream.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._stream.flush()
+
+
+class _BrotliCompressor:
+    def __init__(self, module: Any, level: int) -> None:
+        self._stream = module.Compressor(quality=min(level, 11))
+
+    def compress(self, data: bytes) -> bytes:
+        return bytes(self._stream.process(data))
+
+    def flush(self) -> bytes:
+        return bytes(self._stream.flush())
+
+    def finish(self) -> bytes:
+        return bytes(self._stream.finish())
+
+
+class _ZstdCompressor:
+    def __init__(self, module: Any, level: int) -> None:
+        self._module = module
+        self._stream = module.ZstdCompressor(level=min(level, 22)).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return bytes(self._stream.compress(data))
+
+    def flush(self) -> bytes:
+        return bytes(self._stream.flush(self._module.COMPRESSOBJ_FLUSH_BLOCK))
+
+    def finish(self) -> bytes:
+        return bytes(self._stream.flush(self._module.COMPRESSOBJ_FLUSH_FINISH))
+
+
+def make_compressor(coding: str, level: int) -> Compressor | None:
+    """Create a compressor for a content coding.
+
+    zstd and brotli are optional dependencies (``zstandard``, ``brotli``)
+    loaded on first use; gzip is always available.
+
+    Args:
+        coding: Content coding name: "zstd", "br" or "gzip"
+        level: Codec level on the codec's own scale, clamped to its maximum
+
+    Returns:
+        A compressor, or None if the codec is unknown or not installed
+    """
+    if coding == "gzip":
+        return _GzipCompressor(level)
+    if coding == "br":
+        brotli = optional_module("brotli")
+        return _BrotliCompressor(brotli, level) if brotli is not None else None
+    if coding == "zstd":
+        zstandard = optional_module("zstandard")
+        return _ZstdCompressor(zstandard, level) if zstandard is not None else None
+    return None
+
+
+def negotiate(accept_encoding: str | None, level: int) -> tuple[str, Compressor] | None:
+    """Pick the first server-preferred coding the client accepts.
+
+    Args:
+        accept_encoding: Raw Accept-Encoding header value, if present
+        level: Compression level for the chosen codec
+
+    Returns:
+        (coding, compressor), or None to send the body uncompressed
+    """
+    for coding in config.settings.compression_codecs.split(","):
+        coding = coding.strip()
+        if coding and accepts_encoding(accept_encoding, coding):
+            compressor = make_compressor(coding, level)
+            if compressor is not None:
+                return coding, compressor
+    return None
+
+
+def _add_vary(headers: MutableHeaders) -> None:
+    """Add Accept-Encoding to Vary unless the route already listed it."""
+    vary = headers.get("vary", "")
+    if "accept-encoding" not in (token.strip().lower() for token in vary.split(",")):
+        headers.add_vary_header("Accept-Encoding")
+
+
+@functools.cache
+def parse_levels(spec: str) -> tuple[tuple[str, int], ...]:
+    """Parse ``prefix=level`` pairs, longest prefix first.
+
+    e.g. ``"admin/memory/export=9,memory/batch=4"``.
+    """
+    levels: dict[str, int] = {}
+    for item in spec.split(","):
+        prefix, _, level = item.partition("=")
+        if prefix.strip() and level.strip():
+            levels[prefix.strip().strip("/")] = int(level)
+    return tuple(sorted(levels.items(), key=lambda item: len(item[0]), reverse=True))
+
+
+def route_level(path: str) -> int:
+    """Return the compression level for a path; longest prefix wins."""
+    settings = config.settings
+    stripped = path.strip("/")
+    for prefix, level in parse_levels(settings.compression_levels):
+        if stripped == prefix or stripped.startswith(prefix + "/"):
+            return level
+    return settings.compression_level
+
+
+class CompressionMiddleware:
+    """Compress JSON, NDJSON and text responses the client can decode.
+
+    Complete bodies smaller than ``compression_min_size`` are sent as-is,
+    since tiny responses such as /calculate results gain nothing. Streamed
+    bodies are compressed chunk by chunk and flushed after each one, so a
+    client receives data as soon as it is produced. Responses that already
+    carry a Content-Encoding are left alone, and strong ETags are weakened
+    on compressed responses because the bytes no longer match.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        level = route_level(scope["path"])
+        accept_encoding = Headers(scope=scope).get("accept-encoding")
+        if level <= 0 or not accept_encoding:
+            await self.app(scope, receive, send)
+            return
+
+        held: Message = {}
+        compressor: Compressor | None = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal held, compressor, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                content_type = headers.get("content-type", "")
+                passthrough = (
+                    "content-encoding" in headers
+                    or not content_type.startswith(_COMPRESSIBLE)
+                    or content_type.startswith(_INCOMPRESSIBLE)
+                )
+                if passthrough:
+                    await send(message)
+                else:
+                    held = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body: bytes = message.get("body", b"")
+            more_body: bool = message.get("more_body", False)
+            if compressor is None:
+                negotiated = None
+                if more_body or len(body) >= config.settings.compression_min_size:
+                    _add_vary(MutableHeaders(raw=held["headers"]))
+                    negotiated = negotiate(accept_encoding, level)
+                if negotiated is None:
+                    passthrough = True
+                    await send(held)
+                    await send(message)
+                    return
+                coding, compressor = negotiated
+                headers = MutableHeaders(raw=held["headers"])
+                headers["Content-Encoding"] = coding
+                etag = headers.get("etag")
+                if etag and not etag.startswith("W/"):
+                    headers["ETag"] = f"W/{etag}"
+                if more_body:
+                    del headers["Content-Length"]
+                else:
+                    body = compressor.compress(body) + compressor.finish()
+                    headers["Content-Length"] = str(len(body))
+                    await send(held)
+                    await send({"type": "http.response.body", "body": body})
+                    return
+                await send(held)
+
+            if more_body:
+                chunk = compressor.compress(body) + compressor.flush()
+            else:
+                chunk = compressor.compress(body) + compressor.finish()
+            await send(
+                {"type": "http.response.body", "body": chunk, "more_body": more_body}
+            )
+
+        await self.app(scope, receive, send_compressed)
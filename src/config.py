@@ -0,0 +1,221 @@
+"""Runtime configuration loaded from environment variables."""
+
+import os
+from dataclasses import dataclass
+
+_TRUE_VALUES = ("1", "true", "yes", "on")
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer environment variable, falling back to a default."""
+    raw = os.environ.get(name)
+    return int(raw) if raw else default
+
+
+def _env_str(name: str, default: str) -> str:
+    """Read a string environment variable, falling back to a default."""
+    return os.environ.get(name) or default
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a float environment variable, falling back to a default."""
+    raw = os.environ.get(name)
+    return float(raw) if raw else default
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Read a boolean environment variable; 1/true/yes/on mean true."""
+    raw = os.environ.get(name)
+    return raw.strip().lower() in _TRUE_VALUES if raw else default
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Application settings.
+
+    Every field can be overridden with a ``CALC_``-prefixed environment
+    variable, e.g. ``CALC_MEMORY_REGISTERS=16``.
+    """
+
+    memory_registers: int = 8
+    # Put a WriteCoalescer in front of the memory backend (src.services.coalescer).
+    memory_coalesce_writes: bool = False
+    coalesce_window_ms: float = 5.0
+    coalesce_max_pending: int = 64
+    # Serve GET /memory from a RecallNearCache (src.services.near_cache).
+    memory_near_cache: bool = False
+    near_cache_size: int = 10_000
+    near_cache_ttl_ms: float = 250.0
+    session_max: int = 100_000
+    session_idle_ttl_s: float = 3600.0
+    # "issue" mints a session id for header-less writes; "reject" answers 400.
+    anonymous_writes: str = "issue"
+    # Shared secret required in the X-Admin-Token header by every /admin
+    # route; empty (the default) disables the admin API.
+    admin_token: str = ""
+    export_chunk_size: int = 1000
+    import_batch_size: int = 5000
+    # Calculations kept per session; 0 turns history off.
+    history_size: int = 50
+    # Undoable memory operations kept per session; 0 turns undo/redo off.
+    journal_depth: int = 32
+    server_host: str = "127.0.0.1"
+    server_port: int = 8000
+    # Unix domain socket path; when set it replaces host/port.
+    server_uds: str = ""
+    server_workers: int = 1
+    server_keep_alive_s: int = 5
+    server_backlog: int = 2048
+    # Maximum concurrent connections before 503s; 0 means unlimited.
+    server_limit_concurrency: int = 0
+    server_graceful_timeout_s: int = 30
+    # Comma-separated proxy addresses or networks whose X-Forwarded-For and
+    # X-Forwarded-Proto headers are trusted for the client address; "*"
+    # trusts every peer.
+    server_forwarded_allow_ips: str = "127.0.0.1,::1"
+    # Serve POST /calculate from the raw-ASGI fast lane (src.fastlane).
+    fast_lane: bool = False
+    # Admission control: concurrent requests per route class (first path
+    # segment), with "class=limit" overrides, e.g. "calculate=64,memory=128".
+    admission_max_in_flight: int = 256
+    admission_limits: str = ""
+    admission_max_queue: int = 512
+    admission_queue_timeout_ms: float = 100.0
+    admission_retry_after_s: int = 1
+    # Token-bucket rate limit per client: the default rule's tokens per
+    # second and burst size (a rate of 0 disables it), plus
+    # "prefix=rate:burst" rules per route prefix. Clients are keyed by
+    # session (X-Session-ID, else the calc_session cookie), else by client
+    # IP, read from X-Forwarded-For when the peer is in
+    # server_forwarded_allow_ips. By default only memory writes are
+    # limited, to 200 requests/s in bursts of up to 400 per client and
+    # route; calculations, reads and everything else are not.
+    rate_limit_rate: float = 0.0
+    rate_limit_burst: int = 400
+    rate_limit_routes: str = (
+        "memory/add=200:400,memory/subtract=200:400,memory/batch=200:400"
+    )
+    # Responses kept for replay to retries carrying the same Idempotency-Key.
+    idempotency_cache_size: int = 10_000
+    idempotency_ttl_s: float = 600.0
+    # Cache-Control max-age for GET /calculate; results never change.
+    calculate_cache_max_age_s: int = 31_536_000
+    # GET /memory/events: events buffered per subscriber (oldest dropped
+    # first) and seconds between keep-alive comments.
+    memory_events_queue_size: int = 16
+    memory_events_heartbeat_s: float = 15.0
+    # Response compression: codecs in server preference order (zstd and br
+    # need the optional zstandard/brotli packages), the smallest complete
+    # body worth compressing, and the level on each codec's own scale with
+    # "prefix=level" overrides per route, e.g. "admin/memory/export=9";
+    # level 0 disables compression.
+    compression_codecs: str = "zstd,br,gzip"
+    compression_min_size: int = 1024
+    compression_level: int = 6
+    compression_levels: str = ""
+    # Rolling latency percentiles (GET /admin/latency): window length and
+    # the number of slices it advances by, plus SLO budgets as
+    # "name:/route-prefix=milliseconds".
+    latency_window_s: float = 60.0
+    latency_window_slices: int = 6
+    latency_slos: str = "AC-P01:/calculate=100,AC-P02:/memory=50"
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Build settings from the process environment."""
+        return cls(
+            memory_registers=_env_int("CALC_MEMORY_REGISTERS", cls.memory_registers),
+            memory_coalesce_writes=_env_bool(
+                "CALC_MEMORY_COALESCE_WRITES", cls.memory_coalesce_writes
+            ),
+            coalesce_window_ms=_env_float(
+                "CALC_COALESCE_WINDOW_MS", cls.coalesce_window_ms
+            ),
+            coalesce_max_pending=_env_int(
+                "CALC_COALESCE_MAX_PENDING", cls.coalesce_max_pending
+            ),
+            memory_near_cache=_env_bool(
+                "CALC_MEMORY_NEAR_CACHE", cls.memory_near_cache
+            ),
+            near_cache_size=_env_int("CALC_NEAR_CACHE_SIZE", cls.near_cache_size),
+            near_cache_ttl_ms=_env_float(
+                "CALC_NEAR_CACHE_TTL_MS", cls.near_cache_ttl_ms
+            ),
+            session_max=_env_int("CALC_SESSION_MAX", cls.session_max),
+            session_idle_ttl_s=_env_float(
+                "CALC_SESSION_IDLE_TTL_S", cls.session_idle_ttl_s
+            ),
+            anonymous_writes=_env_str("CALC_ANONYMOUS_WRITES", cls.anonymous_writes),
+            admin_token=_env_str("CALC_ADMIN_TOKEN", cls.admin_token),
+            export_chunk_size=_env_int("CALC_EXPORT_CHUNK_SIZE", cls.export_chunk_size),
+            import_batch_size=_env_int("CALC_IMPORT_BATCH_SIZE", cls.import_batch_size),
+            history_size=_env_int("CALC_HISTORY_SIZE", cls.history_size),
+            journal_depth=_env_int("CALC_JOURNAL_DEPTH", cls.journal_depth),
+            server_host=_env_str("CALC_SERVER_HOST", cls.server_host),
+            server_port=_env_int("CALC_SERVER_PORT", cls.server_port),
+            server_uds=_env_str("CALC_SERVER_UDS", cls.server_uds),
+            server_workers=_env_int("CALC_SERVER_WORKERS", cls.server_workers),
+            server_keep_alive_s=_env_int(
+                "CALC_SERVER_KEEP_ALIVE_S", cls.server_keep_alive_s
+            ),
+            server_backlog=_env_int("CALC_SERVER_BACKLOG", cls.server_backlog),
+            server_limit_concurrency=_env_int(
+                "CALC_SERVER_LIMIT_CONCURRENCY", cls.server_limit_concurrency
+            ),
+            server_graceful_timeout_s=_env_int(
+                "CALC_SERVER_GRACEFUL_TIMEOUT_S", cls.server_graceful_timeout_s
+            ),
+            server_forwarded_allow_ips=_env_str(
+                "CALC_SERVER_FORWARDED_ALLOW_IPS", cls.server_forwarded_allow_ips
+            ),
+            fast_lane=_env_bool("CALC_FAST_LANE", cls.fast_lane),
+            admission_max_in_flight=_env_int(
+                "CALC_ADMISSION_MAX_IN_FLIGHT", cls.admission_max_in_flight
+            ),
+            admission_limits=_env_str("CALC_ADMISSION_LIMITS", cls.admission_limits),
+            admission_max_queue=_env_int(
+                "CALC_ADMISSION_MAX_QUEUE", cls.admission_max_queue
+            ),
+            admission_queue_timeout_ms=_env_float(
+                "CALC_ADMISSION_QUEUE_TIMEOUT_MS", cls.admission_queue_timeout_ms
+            ),
+            admission_retry_after_s=_env_int(
+                "CALC_ADMISSION_RETRY_AFTER_S", cls.admission_retry_after_s
+            ),
+            rate_limit_rate=_env_float("CALC_RATE_LIMIT_RATE", cls.rate_limit_rate),
+            rate_limit_burst=_env_int("CALC_RATE_LIMIT_BURST", cls.rate_limit_burst),
+            rate_limit_routes=_env_str("CALC_RATE_LIMIT_ROUTES", cls.rate_limit_routes),
+            idempotency_cache_size=_env_int(
+                "CALC_IDEMPOTENCY_CACHE_SIZE", cls.idempotency_cache_size
+            ),
+            idempotency_ttl_s=_env_float(
+                "CALC_IDEMPOTENCY_TTL_S", cls.idempotency_ttl_s
+            ),
+            calculate_cache_max_age_s=_env_int(
+                "CALC_CALCULATE_CACHE_MAX_AGE_S", cls.calculate_cache_max_age_s
+            ),
+            memory_events_queue_size=_env_int(
+                "CALC_MEMORY_EVENTS_QUEUE_SIZE", cls.memory_events_queue_size
+            ),
+            memory_events_heartbeat_s=_env_float(
+                "CALC_MEMORY_EVENTS_HEARTBEAT_S", cls.memory_events_heartbeat_s
+            ),
+            compression_codecs=_env_str(
+                "CALC_COMPRESSION_CODECS", cls.compression_codecs
+            ),
+            compression_min_size=_env_int(
+                "CALC_COMPRESSION_MIN_SIZE", cls.compression_min_size
+            ),
+            compression_level=_env_int("CALC_COMPRESSION_LEVEL", cls.compression_level),
+            compression_levels=_env_str(
+                "CALC_COMPRESSION_LEVELS", cls.compression_levels
+            ),
+            latency_window_s=_env_float("CALC_LATENCY_WINDOW_S", cls.latency_window_s),
+            latency_window_slices=_env_int(
+                "CALC_LATENCY_WINDOW_SLICES", cls.latency_window_slices
+            ),
+            latency_slos=_env_str("CALC_LATENCY_SLOS", cls.latency_slos),
+        )
+
+
+settings = Settings.from_env()
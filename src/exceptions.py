@@ -4,6 +4,9 @@
 class CalculatorError(Exception):
     """Base exception for calculator errors."""
 
+    # HTTP status returned by the API's error handler.
+    status_code = 400
+
     def __init__(self, message: str, code: str) -> None:
         self.message = message
         self.code = code
@@ -29,3 +32,59 @@ class OverflowError(CalculatorError):
 
     def __init__(self) -> None:
         super().__init__("Calculation result overflow", "OVERFLOW")
+
+
+class InvalidRegisterError(CalculatorError):
+    """Raised when a memory register index is out of range."""
+
+    def __init__(self, index: int) -> None:
+        super().__init__(f"Invalid memory register: {index}", "INVALID_REGISTER")
+
+
+class SessionRequiredError(CalculatorError):
+    """Raised when a write arrives without a session and must be rejected."""
+
+    def __init__(self) -> None:
+        super().__init__("X-Session-ID header is required", "SESSION_REQUIRED")
+
+
+class InvalidImportRecordError(CalculatorError):
+    """Raised when a memory import line cannot be parsed."""
+
+    def __init__(self, line_number: int) -> None:
+        super().__init__(
+            f"Invalid memory record on line {line_number}", "INVALID_IMPORT_RECORD"
+        )
+
+
+class NothingToUndoError(CalculatorError):
+    """Raised when undo is requested with an empty journal."""
+
+    def __init__(self) -> None:
+        super().__init__("Nothing to undo", "NOTHING_TO_UNDO")
+
+
+class NothingToRedoError(CalculatorError):
+    """Raised when redo is requested with nothing undone."""
+
+    def __init__(self) -> None:
+        super().__init__("Nothing to redo", "NOTHING_TO_REDO")
+
+
+class IdempotencyKeyConflictError(CalculatorError):
+    """Raised when an Idempotency-Key is reused with a different request."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            "Idempotency-Key was already used with a different request",
+            "IDEMPOTENCY_KEY_CONFLICT",
+        )
+
+
+class AdminAccessDeniedError(CalculatorError):
+    """Raised when an admin request lacks a valid admin token."""
+
+    status_code = 403
+
+    def __init__(self) -> None:
+        super().__init__("A valid X-Admin-Token header is required", "ADMIN_FORBIDDEN")
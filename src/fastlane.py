@@ -0,0 +1,115 @@
+"""Raw-ASGI fast lane for POST /calculate."""
+
+import json
+
+from pydantic import ValidationError
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.exceptions import CalculatorError
+from src.metrics import ERRORS
+from src.models import CalculationRequest
+from src.routes.calculate import encoded_calculation
+from src.services.history import record_calculation
+
+
+def _start(status: int, body: bytes) -> Message:
+    """Response start message with the headers JSONResponse would send."""
+    return {
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-length", str(len(body)).encode()),
+            (b"content-type", b"application/json"),
+        ],
+    }
+
+
+class CalculateFastLane:
+    """Serve POST /calculate without routing or dependency resolution.
+
+    Reads the body bytes, validates them with the same pydantic model and
+    writes the body produced by the route's own ``encoded_calculation()``.
+    Anything outside the common case (non-JSON content type, session
+    cookie, validation errors, unexpected failures) is handed to the
+    wrapped application with the body replayed, so status codes and error
+    bodies are identical on both paths.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.handled = 0
+        self.delegated = 0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["path"] != "/calculate"
+            or scope["method"] != "POST"
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        session_id: str | None = None
+        is_json = False
+        for name, value in scope["headers"]:
+            if name == b"content-type":
+                is_json = value.split(b";", 1)[0].strip() == b"application/json"
+            elif name == b"x-session-id":
+                session_id = value.decode("latin-1")
+            elif name == b"cookie" and session_id is None:
+                # Session cookies are resolved by the regular dependency.
+                session_id = ""
+
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] != "http.request":
+                return
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+        if is_json and session_id != "":
+            handled = self._respond(body, session_id)
+            if handled is not None:
+                self.handled += 1
+                status, payload = handled
+                await send(_start(status, payload))
+                await send({"type": "http.response.body", "body": payload})
+                return
+
+        self.delegated += 1
+        replayed = False
+
+        async def replay() -> Message:
+            nonlocal replayed
+            if replayed:
+                return await receive()
+            replayed = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        await self.app(scope, replay, send)
+
+    @staticmethod
+    def _respond(body: bytes, session_id: str | None) -> tuple[int, bytes] | None:
+        """Compute the (status, body) response, or None to delegate."""
+        try:
+            request = CalculationRequest.model_validate_json(body)
+        except ValidationError:
+            return None
+        try:
+            result, payload = encoded_calculation(request)
+        except CalculatorError as exc:
+            ERRORS.inc(exc.code)
+            error = json.dumps(
+                {"error": exc.message, "code": exc.code},
+                ensure_ascii=False,
+                allow_nan=False,
+                separators=(",", ":"),
+            )
+            return 400, error.encode()
+        if session_id:
+            record_calculation(
+                session_id, request.operand1, request.operand2, request.operator, result
+            )
+        return 200, payload
@@ -0,0 +1,242 @@
+"""HDR-style latency histograms, rolling-window percentiles and SLO budgets."""
+
+import time
+from array import array
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+from src import config
+
+# Two significant decimal digits: 256 sub-buckets per power of two, so a
+# recorded value is reported within 1/128 (< 0.8%) of its true value.
+_SUB_BUCKET_BITS = 8
+_SUB_BUCKET_HALF_BITS = _SUB_BUCKET_BITS - 1
+_SUB_BUCKET_HALF = 1 << _SUB_BUCKET_HALF_BITS
+# Highest trackable latency in microseconds (about 67 s); slower requests
+# are recorded at this value so memory stays fixed.
+MAX_MICROS = (1 << 26) - 1
+_BUCKETS = (MAX_MICROS.bit_length() - _SUB_BUCKET_BITS) + 1
+_COUNTS_LEN = (_BUCKETS + 1) * _SUB_BUCKET_HALF
+
+PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+def _index(micros: int) -> int:
+    """Map a value to its counts slot (log-linear HDR layout)."""
+    bucket = max(0, micros.bit_length() - _SUB_BUCKET_BITS)
+    sub_bucket = micros >> bucket
+    return ((bucket + 1) << _SUB_BUCKET_HALF_BITS) + sub_bucket - _SUB_BUCKET_HALF
+
+
+def _highest_equivalent(index: int) -> int:
+    """Return the largest value that maps to a counts slot."""
+    bucket = (index >> _SUB_BUCKET_HALF_BITS) - 1
+    sub_bucket = (index & (_SUB_BUCKET_HALF - 1)) + _SUB_BUCKET_HALF
+    if bucket < 0:
+        sub_bucket -= _SUB_BUCKET_HALF
+        bucket = 0
+    return ((sub_bucket + 1) << bucket) - 1
+
+
+class LatencyHistogram:
+    """Fixed-size log-linear histogram of latencies in microseconds.
+
+    Counts live in one ``array('q')`` of about 2,500 slots (20 KB) covering
+    1 us to ~67 s at two significant digits. Histograms with the same
+    layout merge by adding counts, so per-worker histograms serialized with
+    ``to_bytes`` can be combined into a fleet-wide view.
+    """
+
+    def __init__(self) -> None:
+        self.counts = array("q", bytes(8 * _COUNTS_LEN))
+        self.total = 0
+        self.max_micros = 0
+
+    def record(self, micros: int) -> None:
+        """Record one latency in microseconds."""
+        micros = min(max(micros, 0), MAX_MICROS)
+        self.counts[_index(micros)] += 1
+        self.total += 1
+        if micros > self.max_micros:
+            self.max_micros = micros
+
+    def count_above(self, micros: int) -> int:
+        """Return how many recorded values exceed ``micros``."""
+        return sum(self.counts[_index(min(micros, MAX_MICROS)) + 1 :])
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram's counts into this one."""
+        counts = self.counts
+        for index, count in enumerate(other.counts):
+            if count:
+                counts[index] += count
+        self.total += other.total
+        self.max_micros = max(self.max_micros, other.max_micros)
+
+    def reset(self) -> None:
+        """Zero every count, reusing the allocation."""
+        self.counts[:] = array("q", bytes(8 * _COUNTS_LEN))
+        self.total = 0
+        self.max_micros = 0
+
+    def percentiles(self, percentiles: Iterable[float]) -> dict[float, int]:
+        """Return the value at each percentile, in microseconds.
+
+        Values are the highest value equivalent to the percentile's slot, so
+        they never understate latency. One pass over the counts answers
+        every percentile.
+
+        Args:
+            percentiles: Percentiles in 0..100, ascending
+
+        Returns:
+            Percentile -> latency in microseconds (0 when empty)
+        """
+        wanted = sorted(percentiles)
+        results = dict.fromkeys(wanted, 0)
+        if not self.total:
+            return results
+        targets = [max(1, -(-self.total * p // 100)) for p in wanted]
+        position = 0
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if not count:
+                continue
+            seen += count
+            while position < len(wanted) and seen >= targets[position]:
+                value = min(_highest_equivalent(index), self.max_micros)
+                results[wanted[position]] = value
+                position += 1
+            if position == len(wanted):
+                break
+        return results
+
+    def to_bytes(self) -> bytes:
+        """Serialize counts for merging in another process."""
+        return self.counts.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "LatencyHistogram":
+        """Rebuild a histogram serialized with ``to_bytes``."""
+        histogram = cls()
+        histogram.counts = array("q")
+        histogram.counts.frombytes(data)
+        histogram.total = sum(histogram.counts)
+        nonzero = [i for i, count in enumerate(histogram.counts) if count]
+        histogram.max_micros = _highest_equivalent(nonzero[-1]) if nonzero else 0
+        return histogram
+
+
+@dataclass(frozen=True)
+class SLO:
+    """Latency budget for routes under a path prefix."""
+
+    name: str
+    route_prefix: str
+    budget_ms: float
+
+
+def parse_slos(spec: str) -> list[SLO]:
+    """Parse ``name:/prefix=ms`` entries, e.g. ``"AC-P01:/calculate=100"``."""
+    slos = []
+    for item in spec.split(","):
+        target, _, budget = item.partition("=")
+        name, _, prefix = target.partition(":")
+        if name.strip() and prefix.strip() and budget.strip():
+            slos.append(SLO(name.strip(), prefix.strip(), float(budget)))
+    return slos
+
+
+def covers(prefix: str, route: str) -> bool:
+    """Return whether an SLO's route prefix covers a route template."""
+    return route == prefix or route.startswith(prefix.rstrip("/") + "/")
+
+
+class RollingLatency:
+    """Per-route latency histograms over a sliding time window.
+
+    The window is split into ``slices`` fixed intervals, each holding one
+    histogram per route; a slice is zeroed and reused when its interval
+    comes round again, so memory is fixed at routes x slices histograms.
+    Recording happens on the event loop, so no locking is needed.
+    """
+
+    def __init__(
+        self,
+        window: float | None = None,
+        slices: int | None = None,
+        slos: list[SLO] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        settings = config.settings
+        self.window = window if window is not None else settings.latency_window_s
+        self._slices = slices if slices is not None else settings.latency_window_slices
+        self._slice_length = self.window / self._slices
+        self.slos = slos if slos is not None else parse_slos(settings.latency_slos)
+        self._clock = clock
+        # Slot -> (interval number, route -> histogram).
+        self._ring: list[tuple[int, dict[str, LatencyHistogram]]] = [
+            (-1, {}) for _ in range(self._slices)
+        ]
+        # Route -> SLO covering it (None if unbudgeted), resolved once.
+        self._route_slo: dict[str, SLO | None] = {}
+        self.breaches = dict.fromkeys((slo.name for slo in self.slos), 0)
+
+    def _slo_for(self, route: str) -> SLO | None:
+        try:
+            return self._route_slo[route]
+        except KeyError:
+            slo = next((s for s in self.slos if covers(s.route_prefix, route)), None)
+            self._route_slo[route] = slo
+            return slo
+
+    def record(self, route: str, seconds: float) -> SLO | None:
+        """Record a request's latency.
+
+        Args:
+            route: Route template
+            seconds: Request duration
+
+        Returns:
+            The SLO whose budget the request exceeded, if any
+        """
+        interval = int(self._clock() // self._slice_length)
+        slot = interval % self._slices
+        stamp, histograms = self._ring[slot]
+        if stamp != interval:
+            for stale in histograms.values():
+                stale.reset()
+            self._ring[slot] = (interval, histograms)
+        current = histograms.get(route)
+        if current is None:
+            current = histograms[route] = LatencyHistogram()
+        current.record(int(seconds * 1_000_000))
+        slo = self._slo_for(route)
+        if slo is not None and seconds * 1000 > slo.budget_ms:
+            self.breaches[slo.name] += 1
+            return slo
+        return None
+
+    def reset(self) -> None:
+        """Discard every recorded latency and zero the SLO breach counts."""
+        self._ring = [(-1, {}) for _ in range(self._slices)]
+        self.breaches = dict.fromkeys(self.breaches, 0)
+
+    def snapshot(self) -> dict[str, LatencyHistogram]:
+        """Merge the live slices into one histogram per route."""
+        oldest = int(self._clock() // self._slice_length) - self._slices + 1
+        merged: dict[str, LatencyHistogram] = {}
+        for stamp, histograms in self._ring:
+            if stamp < oldest:
+                continue
+            for route, histogram in histograms.items():
+                if not histogram.total:
+                    continue
+                target = merged.get(route)
+                if target is None:
+                    target = merged[route] = LatencyHistogram()
+                target.merge(histogram)
+        return merged
+
+
+recorder = RollingLatency()
@@ -1,17 +1,53 @@
 """FastAPI calculator application."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
+from src import config, startup
+from src.admission import AdmissionMiddleware
+from src.compression import CompressionMiddleware
 from src.exceptions import CalculatorError
+from src.fastlane import CalculateFastLane
+from src.metrics import ERRORS, MetricsMiddleware
+from src.metrics import router as metrics_router
+from src.openapi import router as openapi_router
+from src.ratelimit import RateLimitMiddleware
+from src.routes.admin import router as admin_router
 from src.routes.calculate import router as calculate_router
+from src.routes.history import router as history_router
 from src.routes.memory import router as memory_router
+from src.services.memory_backend import get_backend, layered_backend, set_backend
+from src.warmup import warm_up
+
+startup.mark("imports")
+
+set_backend(layered_backend(get_backend()))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Warm every route before the worker reports ready."""
+    app.state.ready = False
+    app.state.warmup_seconds = await warm_up(app)
+    startup.record("warmup", app.state.warmup_seconds)
+    app.state.ready = True
+    yield
+
 
 app = FastAPI(
     title="Calculator API",
     description="REST API for basic arithmetic operations and memory management",
     version="1.0.0",
+    lifespan=lifespan,
+    # Schema and docs are served from precomputed bytes by src.openapi.
+    openapi_url=None,
+    docs_url=None,
+    redoc_url=None,
 )
+startup.mark("app")
 
 
 @app.exception_handler(CalculatorError)
@@ -19,17 +55,43 @@ async def calculator_error_handler(
     request: Request, exc: CalculatorError
 ) -> JSONResponse:
     """Handle calculator-specific errors."""
+    ERRORS.inc(exc.code)
     return JSONResponse(
-        status_code=400,
+        status_code=exc.status_code,
         content={"error": exc.message, "code": exc.code},
     )
 
 
 app.include_router(calculate_router)
 app.include_router(memory_router)
+app.include_router(history_router)
+app.include_router(admin_router)
+app.include_router(openapi_router)
+app.include_router(metrics_router)
+# Innermost, so shed and rate-limited responses skip compression entirely.
+app.add_middleware(CompressionMiddleware)
+if config.settings.fast_lane:
+    app.add_middleware(CalculateFastLane)
+app.add_middleware(AdmissionMiddleware)
+# Outside admission, so rate-limited requests never occupy an admission slot.
+app.add_middleware(RateLimitMiddleware)
+# Outermost, so latency and status cover shed and rate-limited requests too.
+app.add_middleware(MetricsMiddleware)
+startup.mark("routers")
 
 
 @app.get("/health")
 def health_check() -> dict[str, str]:
     """Health check endpoint."""
     return {"status": "healthy"}
+
+
+@app.get("/ready")
+async def readiness_check(request: Request) -> JSONResponse:
+    """Readiness endpoint; reports ready only once startup warmup has run."""
+    state = request.app.state
+    if not getattr(state, "ready", False):
+        return JSONResponse(status_code=503, content={"status": "starting"})
+    return JSONResponse(
+        content={"status": "ready", "warmup_ms": state.warmup_seconds * 1000}
+    )
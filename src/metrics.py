@@ -0,0 +1,332 @@
+"""Prometheus metrics: lightweight collectors, ASGI instrumentation, /metrics."""
+
+import abc
+import bisect
+import math
+import threading
+import time
+from collections.abc import Callable, Iterator
+
+from fastapi import APIRouter
+from fastapi.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src import latency
+from src.services.memory import memory_entry_counts
+from src.services.session import active_session_count
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Latency bucket upper bounds in seconds.
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+
+# (metric name suffix, label pairs, value) as rendered by the exposition.
+Sample = tuple[str, tuple[tuple[str, str], ...], float]
+
+
+class _Metric(abc.ABC):
+    """Base collector: a name, help text, label names and a lock."""
+
+    kind = ""
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: tuple[str, ...] = ()
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def _labels(self, values: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+        return tuple(zip(self.labelnames, values, strict=True))
+
+    @abc.abstractmethod
+    def samples(self) -> Iterator[Sample]:
+        """Yield the samples to expose for this metric."""
+
+    def reset(self) -> None:
+        """Forget recorded values; gauges report current state and keep theirs."""
+
+
+class Counter(_Metric):
+    """Monotonically increasing count per label set.
+
+    Names carry the ``_total`` suffix, so the HELP and TYPE lines name the
+    same series as the samples.
+    """
+
+    kind = "counter"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: tuple[str, ...] = ()
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        """Increment the counter for a label set, given in labelnames order."""
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        """Return the current count for a label set."""
+        return self._values.get(labels, 0.0)
+
+    def samples(self) -> Iterator[Sample]:
+        with self._lock:
+            values = list(self._values.items())
+        for labels, value in values:
+            yield "", self._labels(labels), value
+
+    def reset(self) -> None:
+        """Drop every label set's count."""
+        with self._lock:
+            self._values.clear()
+
+
+class Gauge(_Metric):
+    """Value that goes up and down, or is read from a callback at scrape."""
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        function: Callable[[], float] | None = None,
+    ) -> None:
+        super().__init__(name, documentation)
+        self._value = 0.0
+        self._function = function
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the gauge."""
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrease the gauge."""
+        with self._lock:
+            self._value -= amount
+
+    def value(self) -> float:
+        """Return the current value."""
+        return self._function() if self._function is not None else self._value
+
+    def samples(self) -> Iterator[Sample]:
+        yield "", (), self.value()
+
+
+class Histogram(_Metric):
+    """Cumulative-bucket histogram per label set."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = buckets
+        # Label set -> per-bucket counts (last slot is +Inf), then sum.
+        self._series: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        """Record an observation for a label set, given in labelnames order."""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][index] += 1
+            series[1][0] += value
+
+    def count(self, *labels: str) -> int:
+        """Return the number of observations for a label set."""
+        series = self._series.get(labels)
+        return sum(series[0]) if series is not None else 0
+
+    def samples(self) -> Iterator[Sample]:
+        with self._lock:
+            series = [
+                (labels, list(counts), total[0])
+                for labels, (counts, total) in self._series.items()
+            ]
+        for labels, counts, total in series:
+            base = self._labels(labels)
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts, strict=True):
+                cumulative += count
+                le = "+Inf" if bound == math.inf else repr(bound)
+                yield "_bucket", (*base, ("le", le)), cumulative
+            yield "_count", base, cumulative
+            yield "_sum", base, total
+
+    def reset(self) -> None:
+        """Drop every label set's observations."""
+        with self._lock:
+            self._series.clear()
+
+
+REGISTRY: list[_Metric] = []
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format(value: float) -> str:
+    """Spell a sample value the way the exposition format expects."""
+    if math.isnan(value):
+        return "NaN"
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    return repr(value)
+
+
+def render() -> str:
+    """Render every registered metric in the Prometheus text format."""
+    lines: list[str] = []
+    for metric in REGISTRY:
+        lines.append(f"# HELP {metric.name} {metric.documentation}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        for suffix, labels, value in metric.samples():
+            label_text = ",".join(f'{k}="{_escape(v)}"' for k, v in labels)
+            name = metric.name + suffix
+            lines.append(
+                f"{name}{{{label_text}}} {_format(value)}"
+                if labels
+                else f"{name} {_format(value)}"
+            )
+    lines.append("")
+    return "\n".join(lines)
+
+
+def reset() -> None:
+    """Forget every recorded count and observation, e.g. after warmup."""
+    for metric in REGISTRY:
+        metric.reset()
+
+
+REQUEST_DURATION = Histogram(
+    "calc_http_request_duration_seconds",
+    "HTTP request latency; _count is the request count.",
+    ("method", "route", "status"),
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "calc_http_requests_in_flight", "HTTP requests currently being served."
+)
+CALCULATIONS = Counter(
+    "calc_calculations_total", "Calculations performed, by operator.", ("operator",)
+)
+ERRORS = Counter(
+    "calc_errors_total", "Calculator errors returned, by error code.", ("code",)
+)
+SLO_BREACHES = Counter(
+    "calc_slo_breaches_total",
+    "Requests slower than their latency budget, by SLO.",
+    ("slo",),
+)
+Gauge(
+    "calc_memory_entries",
+    "Sessions holding a memory value.",
+    lambda: memory_entry_counts()[0],
+)
+Gauge(
+    "calc_register_entries",
+    "Sessions holding memory registers.",
+    lambda: memory_entry_counts()[1],
+)
+Gauge("calc_active_sessions", "Sessions currently holding state.", active_session_count)
+
+
+class MetricsMiddleware:
+    """Record latency, status and in-flight counts for every HTTP request.
+
+    Requests are labelled with their route template (``/memory/registers/
+    {index}``) rather than the raw path, so label cardinality is bounded.
+    Requests answered before routing (fast lane, admission, rate limit)
+    use the path when it is a static route, otherwise "unmatched".
+    Latencies also feed the rolling percentile histograms and SLO budgets
+    in ``src.latency``, except for event streams, whose duration is the
+    subscription's lifetime. What startup warmup records is reset before
+    the worker reports ready.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self._static_paths: frozenset[str] | None = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        status = 500
+        streaming = False
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status, streaming
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                streaming = any(
+                    name == b"content-type" and value.startswith(b"text/event-stream")
+                    for name, value in message["headers"]
+                )
+            await send(message)
+
+        REQUESTS_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            REQUESTS_IN_FLIGHT.dec()
+            route = self._route(scope)
+            REQUEST_DURATION.observe(elapsed, scope["method"], route, str(status))
+            if not streaming:
+                breached = latency.recorder.record(route, elapsed)
+                if breached is not None:
+                    SLO_BREACHES.inc(breached.name)
+
+    def _route(self, scope: Scope) -> str:
+        route = scope.get("route")
+        if route is not None:
+            return str(route.path)
+        if self._static_paths is None:
+            app = scope.get("app")
+            self._static_paths = frozenset(
+                path
+                for path in (getattr(r, "path", "") for r in getattr(app, "routes", ()))
+                if path and "{" not in path
+            )
+        path: str = scope["path"]
+        return path if path in self._static_paths else "unmatched"
+
+
+router = APIRouter(include_in_schema=False)
+
+
+@router.get("/metrics")
+async def metrics() -> Response:
+    """Expose every metric in the Prometheus text format."""
+    return Response(render(), media_type=CONTENT_TYPE)
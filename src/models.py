@@ -1,6 +1,10 @@
 """Pydantic models for calculator API requests and responses."""
 
-from pydantic import BaseModel
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+MAX_BATCH_OPERATIONS = 10_000
 
 
 class CalculationRequest(BaseModel):
@@ -18,6 +22,24 @@ class CalculationResponse(BaseModel):
     expression: str
 
 
+class HistoryEntryResponse(BaseModel):
+    """A single recorded calculation."""
+
+    operand1: float
+    operand2: float
+    operator: str
+    result: float
+
+
+class HistoryResponse(BaseModel):
+    """Response model for a page of calculation history."""
+
+    entries: list[HistoryEntryResponse]
+    total: int
+    offset: int
+    limit: int
+
+
 class MemoryValueRequest(BaseModel):
     """Request model for memory operations requiring a value."""
 
@@ -31,6 +53,155 @@ class MemoryResponse(BaseModel):
     message: str
 
 
+class MemoryRegistersResponse(BaseModel):
+    """Response model for bulk register recall."""
+
+    values: list[float]
+    message: str
+
+
+class MemoryOperation(BaseModel):
+    """Single memory operation within a batch."""
+
+    op: Literal["add", "subtract"]
+    value: float
+    session_id: str | None = None
+
+
+class MemoryBatchRequest(BaseModel):
+    """Request model for batched memory operations."""
+
+    operations: list[MemoryOperation] = Field(max_length=MAX_BATCH_OPERATIONS)
+
+
+class MemoryBatchResponse(BaseModel):
+    """Response model for batched memory operations."""
+
+    values: dict[str, float]
+    message: str
+
+
+class MemoryStoreStatsResponse(BaseModel):
+    """Response model for memory store introspection."""
+
+    active_sessions: int
+    memory_entries: int
+    register_entries: int
+    approx_bytes: int
+    inserts: int
+    updates: int
+    deletes: int
+    insert_rate: float
+    update_rate: float
+    delete_rate: float
+    evicted_capacity: int
+    evicted_idle: int
+    ended: int
+    session_age_distribution: dict[str, int]
+
+
+class NearCacheStatsResponse(BaseModel):
+    """Hit ratio and staleness of the memory recall near-cache."""
+
+    entries: int
+    hits: int
+    misses: int
+    hit_ratio: float
+    expired: int
+    invalidations: int
+    evictions: int
+    mean_served_age_ms: float
+    max_served_age_ms: float
+
+
+class CoalescerStatsResponse(BaseModel):
+    """Writes saved by the memory write coalescer."""
+
+    operations: int
+    backend_calls: int
+
+
+class MemoryBackendStatsResponse(BaseModel):
+    """Layers in front of the memory backend and their figures."""
+
+    layers: list[str]
+    near_cache: NearCacheStatsResponse | None
+    coalescer: CoalescerStatsResponse | None
+
+
+class MemoryRecord(BaseModel):
+    """One session's memory state in a streaming export or import."""
+
+    session_id: str
+    memory: float | None = None
+    registers: list[float] | None = None
+
+
+class MemoryImportResponse(BaseModel):
+    """Response model for bulk memory import."""
+
+    imported: int
+    message: str
+
+
+class AdmissionClassStats(BaseModel):
+    """Admission figures for one route class."""
+
+    limit: int
+    in_flight: int
+    queued: int
+    admitted: int
+    shed: int
+
+
+class RateLimitRuleStats(BaseModel):
+    """Rate-limit figures for one rule."""
+
+    rule: str
+    rate: float
+    burst: int
+    tracked_clients: int
+    limited: int
+
+
+class RoutePercentiles(BaseModel):
+    """Latency percentiles for one route over the rolling window."""
+
+    count: int
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    p999_ms: float
+    max_ms: float
+
+
+class SLOStatus(BaseModel):
+    """Latency budget compliance for one SLO."""
+
+    route_prefix: str
+    budget_ms: float
+    window_requests: int
+    window_breaches: int
+    total_breaches: int
+
+
+class LatencyReport(BaseModel):
+    """Rolling-window latency percentiles per route and SLO status."""
+
+    window_s: float
+    routes: dict[str, RoutePercentiles]
+    slos: dict[str, SLOStatus]
+
+
+class StartupReportResponse(BaseModel):
+    """Cold-start phase durations in milliseconds (0.0 until recorded)."""
+
+    imports: float = 0.0
+    app: float = 0.0
+    routers: float = 0.0
+    warmup: float = 0.0
+
+
 class ErrorResponse(BaseModel):
     """Response model for error responses."""
 
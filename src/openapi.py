@@ -0,0 +1,91 @@
+"""OpenAPI schema served as precomputed, compressed bytes."""
+
+import gzip
+import hashlib
+import json
+from dataclasses import dataclass
+
+from fastapi import APIRouter, FastAPI, Request, Response
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
+from fastapi.responses import HTMLResponse
+
+from src.caching import accepts_encoding, etag_matches
+
+OPENAPI_URL = "/openapi.json"
+
+router = APIRouter(include_in_schema=False)
+
+
+@dataclass(frozen=True)
+class OpenAPIDocument:
+    """Encoded OpenAPI schema and its gzip form, each with its entity tag.
+
+    The two are different representations, so they carry different strong
+    ETags; a cache never answers a gzip request with identity bytes.
+    """
+
+    body: bytes
+    gzipped: bytes
+    etag: str
+    gzip_etag: str
+
+
+_document: OpenAPIDocument | None = None
+
+
+def build_openapi_document(app: FastAPI) -> OpenAPIDocument:
+    """Generate, encode and compress the schema once.
+
+    Called during startup so no request ever pays for schema generation;
+    the result is reused until the process exits.
+
+    Args:
+        app: Application whose routes and models define the schema
+
+    Returns:
+        Precomputed OpenAPI document
+    """
+    global _document
+    body = json.dumps(app.openapi(), separators=(",", ":")).encode()
+    digest = hashlib.sha256(body).hexdigest()[:32]
+    _document = OpenAPIDocument(
+        body=body,
+        gzipped=gzip.compress(body, compresslevel=9, mtime=0),
+        etag=f'"{digest}"',
+        gzip_etag=f'"{digest}-gzip"',
+    )
+    return _document
+
+
+@router.get(OPENAPI_URL)
+async def openapi_json(request: Request) -> Response:
+    """Serve the precomputed schema, honouring If-None-Match per encoding."""
+    document = _document or build_openapi_document(request.app)
+    gzipped = accepts_encoding(request.headers.get("accept-encoding"), "gzip")
+    headers = {
+        "ETag": document.gzip_etag if gzipped else document.etag,
+        "Cache-Control": "public, no-cache",
+        "Vary": "Accept-Encoding",
+    }
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    if gzipped:
+        headers["Content-Encoding"] = "gzip"
+        return Response(
+            document.gzipped, media_type="application/json", headers=headers
+        )
+    return Response(document.body, media_type="application/json", headers=headers)
+
+
+@router.get("/docs")
+async def swagger_ui(request: Request) -> HTMLResponse:
+    """Swagger UI backed by the precomputed schema."""
+    return get_swagger_ui_html(
+        openapi_url=OPENAPI_URL, title=f"{request.app.title} - Swagger UI"
+    )
+
+
+@router.get("/redoc")
+async def redoc(request: Request) -> HTMLResponse:
+    """ReDoc backed by the precomputed schema."""
+    return get_redoc_html(openapi_url=OPENAPI_URL, title=f"{request.app.title} - ReDoc")
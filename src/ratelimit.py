@@ -0,0 +1,344 @@
+"""Per-client token-bucket rate limiting."""
+
+import functools
+import ipaddress
+import json
+import math
+import time
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from starlette.requests import cookie_parser
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src import config
+from src.admission import EXEMPT, route_class
+from src.routes.dependencies import SESSION_COOKIE
+from src.services.session import register_eviction_hook
+
+_RATE_LIMITED_BODY = json.dumps(
+    {"error": "Rate limit exceeded, retry later", "code": "RATE_LIMITED"},
+    separators=(",", ":"),
+).encode()
+
+_SESSION_PREFIX = "s:"
+
+# Bound on remembered path -> rule matches; paths embed register indexes, so
+# the cache must not grow with arbitrary client input.
+_MAX_CACHED_PATHS = 1024
+
+# Upper bound on idle buckets reclaimed when a new client arrives, so one
+# request never pays for a large backlog of expirations.
+_MAX_SWEEP = 64
+
+
+def parse_rules(spec: str) -> dict[str, tuple[float, int]]:
+    """Parse ``prefix=rate:burst`` pairs, e.g. ``"memory/add=20:40"``."""
+    rules: dict[str, tuple[float, int]] = {}
+    for item in spec.split(","):
+        prefix, _, limit = item.partition("=")
+        rate, _, burst = limit.partition(":")
+        if prefix.strip() and rate.strip():
+            rules[prefix.strip().strip("/")] = (
+                float(rate),
+                int(burst) if burst.strip() else max(1, math.ceil(float(rate))),
+            )
+    return rules
+
+
+@dataclass(frozen=True)
+class RateLimitStats:
+    """Point-in-time figures for one rate-limit rule."""
+
+    rule: str
+    rate: float
+    burst: int
+    tracked_clients: int
+    limited: int
+
+
+class TokenBuckets:
+    """Lazily refilled token buckets for one rule, one per client.
+
+    Bucket state lives in two parallel ``array('d')`` columns (tokens and
+    last-refill time) indexed by a slot number, so an active client costs a
+    dict entry and 16 bytes. Tokens are refilled on access rather than by a
+    timer. A bucket left alone long enough to refill completely is
+    indistinguishable from a new one, so its slot is reclaimed.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = float(burst)
+        self.limited = 0
+        self._full_after = burst / rate
+        # Client key -> slot, least recently used first.
+        self._slots: OrderedDict[str, int] = OrderedDict()
+        self._tokens = array("d")
+        self._stamps = array("d")
+        self._free: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def take(self, key: str, now: float) -> float:
+        """Take one token from a client's bucket.
+
+        Args:
+            key: Client key
+            now: Current monotonic time in seconds
+
+        Returns:
+            0.0 if a token was taken, otherwise seconds until one is available
+        """
+        slot = self._slots.get(key)
+        stamps = self._stamps
+        if slot is None:
+            slot = self._allocate(key, now)
+            tokens = self.burst
+        else:
+            self._slots.move_to_end(key)
+            tokens = self._tokens[slot] + (now - stamps[slot]) * self.rate
+            if tokens > self.burst:
+                tokens = self.burst
+        stamps[slot] = now
+        if tokens >= 1.0:
+            self._tokens[slot] = tokens - 1.0
+            return 0.0
+        self._tokens[slot] = tokens
+        self.limited += 1
+        return (1.0 - tokens) / self.rate
+
+    def reset(self, key: str) -> None:
+        """Refill a client's bucket; its slot is reclaimed by a later sweep."""
+        slot = self._slots.get(key)
+        if slot is not None:
+            # Lock-free: a racing take() at worst overwrites the stamp.
+            self._stamps[slot] = -math.inf
+
+    def _allocate(self, key: str, now: float) -> int:
+        """Reclaim refilled buckets, then assign a slot to a new client."""
+        for _ in range(_MAX_SWEEP):
+            if not self._slots:
+                break
+            oldest, slot = next(iter(self._slots.items()))
+            if now - self._stamps[slot] < self._full_after:
+                break
+            del self._slots[oldest]
+            self._free.append(slot)
+        if self._free:
+            slot = self._free.pop()
+        else:
+            slot = len(self._tokens)
+            self._tokens.append(0.0)
+            self._stamps.append(0.0)
+        self._slots[key] = slot
+        return slot
+
+
+class RateLimiter:
+    """Map request paths to their rule and charge the client's bucket.
+
+    The default rule (``rate_limit_rate``/``rate_limit_burst``) covers every
+    path without a more specific ``rate_limit_routes`` entry; the longest
+    matching path prefix wins. A client shares one bucket across all paths
+    covered by the same rule. A rate of 0 disables a rule.
+    """
+
+    def __init__(self) -> None:
+        self._rules: list[tuple[str, TokenBuckets | None]] | None = None
+        # Path -> matching rule's buckets, so steady-state checks skip the
+        # prefix walk.
+        self._by_path: dict[str, TokenBuckets | None] = {}
+
+    def _load_rules(self) -> list[tuple[str, TokenBuckets | None]]:
+        settings = config.settings
+        specs = parse_rules(settings.rate_limit_routes)
+        specs.setdefault("", (settings.rate_limit_rate, settings.rate_limit_burst))
+        rules = [
+            (prefix, TokenBuckets(rate, burst) if rate > 0 else None)
+            for prefix, (rate, burst) in specs.items()
+        ]
+        # Longest prefix first so the most specific rule matches.
+        rules.sort(key=lambda rule: len(rule[0]), reverse=True)
+        self._rules = rules
+        return rules
+
+    def check(self, path: str, key: str) -> float:
+        """Charge one request against the rule covering ``path``.
+
+        Args:
+            path: Request path
+            key: Client key (session id or client address)
+
+        Returns:
+            0.0 if the request may proceed, otherwise seconds to wait
+        """
+        try:
+            buckets = self._by_path[path]
+        except KeyError:
+            buckets = self._match(path)
+        if buckets is None:
+            return 0.0
+        return buckets.take(key, time.monotonic())
+
+    def _match(self, path: str) -> TokenBuckets | None:
+        """Find the rule covering a path and remember it."""
+        rules = self._rules or self._load_rules()
+        stripped = path.strip("/")
+        match = None
+        for prefix, buckets in rules:
+            if not prefix or stripped == prefix or stripped.startswith(prefix + "/"):
+                match = buckets
+                break
+        if len(self._by_path) < _MAX_CACHED_PATHS:
+            self._by_path[path] = match
+        return match
+
+    def reset(self, key: str) -> None:
+        """Refill every bucket held by a client.
+
+        Args:
+            key: Client key
+        """
+        for _, buckets in self._rules or ():
+            if buckets is not None:
+                buckets.reset(key)
+
+    def clear(self) -> None:
+        """Drop every client's buckets and reload the rules from settings."""
+        self._rules = None
+        self._by_path.clear()
+
+    def stats(self) -> list[RateLimitStats]:
+        """Return figures for every enabled rule."""
+        rules = self._rules or self._load_rules()
+        return [
+            RateLimitStats(
+                rule=prefix or "*",
+                rate=buckets.rate,
+                burst=int(buckets.burst),
+                tracked_clients=len(buckets),
+                limited=buckets.limited,
+            )
+            for prefix, buckets in rules
+            if buckets is not None
+        ]
+
+
+limiter = RateLimiter()
+
+
+def _reset_session(session_id: str) -> None:
+    """Drop an ended or evicted session's rate-limit state."""
+    limiter.reset(_SESSION_PREFIX + session_id)
+
+
+register_eviction_hook(_reset_session)
+
+
+@functools.cache
+def _trusted_proxies(
+    spec: str,
+) -> tuple[bool, tuple[ipaddress.IPv4Network | ipaddress.IPv6Network, ...]]:
+    """Parse ``server_forwarded_allow_ips`` into (trust all, networks)."""
+    items = [item.strip() for item in spec.split(",") if item.strip()]
+    networks = []
+    for item in items:
+        try:
+            networks.append(ipaddress.ip_network(item, strict=False))
+        except ValueError:
+            continue
+    return "*" in items, tuple(networks)
+
+
+def _is_trusted(host: str) -> bool:
+    """Return whether a peer address is a trusted proxy."""
+    trust_all, networks = _trusted_proxies(config.settings.server_forwarded_allow_ips)
+    if trust_all:
+        return True
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return any(address in network for network in networks)
+
+
+def client_address(scope: Scope, forwarded_for: str | None) -> str:
+    """Return the client IP, looking through trusted proxies.
+
+    When the peer is a trusted proxy, the client is the rightmost
+    X-Forwarded-For entry that is not itself trusted, the same address
+    uvicorn's proxy-header handling picks. Untrusted peers' headers are
+    ignored, since anyone can send them.
+
+    Args:
+        scope: ASGI connection scope
+        forwarded_for: X-Forwarded-For header value, if any
+
+    Returns:
+        Client IP address, or "" if the server did not report one
+    """
+    client = scope.get("client")
+    host = str(client[0]) if client else ""
+    if forwarded_for is None or not _is_trusted(host):
+        return host
+    hops = [hop.strip() for hop in forwarded_for.split(",") if hop.strip()]
+    for hop in reversed(hops):
+        if not _is_trusted(hop):
+            return hop
+    return hops[0] if hops else host
+
+
+def client_key(scope: Scope) -> str:
+    """Key a request by session, falling back to client IP.
+
+    The session comes from the X-Session-ID header, else the session
+    cookie, matching how routes resolve it, so browser clients get one
+    bucket per session rather than one per address.
+    """
+    cookie: str | None = None
+    forwarded_for: str | None = None
+    value: bytes
+    for name, value in scope["headers"]:
+        if name == b"x-session-id":
+            return _SESSION_PREFIX + value.decode("latin-1")
+        if name == b"cookie":
+            cookie = value.decode("latin-1")
+        elif name == b"x-forwarded-for":
+            forwarded_for = value.decode("latin-1")
+    if cookie is not None:
+        session_id = cookie_parser(cookie).get(SESSION_COOKIE)
+        if session_id:
+            return _SESSION_PREFIX + session_id
+    return "ip:" + client_address(scope, forwarded_for)
+
+
+class RateLimitMiddleware:
+    """ASGI middleware answering 429 once a client's bucket is empty."""
+
+    def __init__(self, app: ASGIApp, rate_limiter: RateLimiter | None = None) -> None:
+        self.app = app
+        self.limiter = rate_limiter or limiter
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or route_class(scope["path"]) in EXEMPT:
+            await self.app(scope, receive, send)
+            return
+        wait = self.limiter.check(scope["path"], client_key(scope))
+        if not wait:
+            await self.app(scope, receive, send)
+            return
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [
+                    (b"content-length", str(len(_RATE_LIMITED_BODY)).encode()),
+                    (b"content-type", b"application/json"),
+                    (b"retry-after", str(max(1, math.ceil(wait))).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": _RATE_LIMITED_BODY})
@@ -0,0 +1,230 @@
+"""Admin endpoints for operational introspection."""
+
+import json
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+
+from src import config, latency, startup
+from src.admission import controller
+from src.exceptions import InvalidImportRecordError
+from src.models import (
+    AdmissionClassStats,
+    CoalescerStatsResponse,
+    LatencyReport,
+    MemoryBackendStatsResponse,
+    MemoryImportResponse,
+    MemoryRecord,
+    MemoryStoreStatsResponse,
+    NearCacheStatsResponse,
+    RateLimitRuleStats,
+    RoutePercentiles,
+    SLOStatus,
+    StartupReportResponse,
+)
+from src.ratelimit import limiter
+from src.routes.dependencies import require_admin
+from src.services.memory import SessionRecord, memory_store_stats
+from src.services.memory_backend import backend_layers, find_layer, get_backend
+from src.services.session import session_stats
+
+# Every route exposes or rewrites all sessions' state; see require_admin.
+router = APIRouter(
+    prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin)]
+)
+
+
+@router.get("/memory/stats", response_model=MemoryStoreStatsResponse)
+async def memory_stats() -> MemoryStoreStatsResponse:
+    """Report memory store size, byte usage, write rates and evictions."""
+    store = memory_store_stats()
+    sessions = session_stats()
+    return MemoryStoreStatsResponse(
+        active_sessions=sessions.active_sessions,
+        memory_entries=store.memory_entries,
+        register_entries=store.register_entries,
+        approx_bytes=store.approx_bytes,
+        inserts=store.inserts,
+        updates=store.updates,
+        deletes=store.deletes,
+        insert_rate=store.insert_rate,
+        update_rate=store.update_rate,
+        delete_rate=store.delete_rate,
+        evicted_capacity=sessions.evicted_capacity,
+        evicted_idle=sessions.evicted_idle,
+        ended=sessions.ended,
+        session_age_distribution=sessions.age_distribution,
+    )
+
+
+@router.get("/memory/backend", response_model=MemoryBackendStatsResponse)
+async def memory_backend_stats() -> MemoryBackendStatsResponse:
+    """Report the memory backend's layers, cache hit ratio and coalescing."""
+    from src.services.coalescer import WriteCoalescer
+    from src.services.near_cache import RecallNearCache
+
+    backend = get_backend()
+    near_cache = coalescer = None
+    cache = find_layer(backend, RecallNearCache)
+    if cache is not None:
+        near_cache = NearCacheStatsResponse(
+            entries=len(cache),
+            hits=cache.stats.hits,
+            misses=cache.stats.misses,
+            hit_ratio=cache.stats.hit_ratio,
+            expired=cache.stats.expired,
+            invalidations=cache.stats.invalidations,
+            evictions=cache.stats.evictions,
+            mean_served_age_ms=cache.stats.mean_served_age * 1000,
+            max_served_age_ms=cache.stats.served_age_max * 1000,
+        )
+    writes = find_layer(backend, WriteCoalescer)
+    if writes is not None:
+        coalescer = CoalescerStatsResponse(
+            operations=writes.stats.operations,
+            backend_calls=writes.stats.backend_calls,
+        )
+    return MemoryBackendStatsResponse(
+        layers=[type(layer).__name__ for layer in backend_layers(backend)],
+        near_cache=near_cache,
+        coalescer=coalescer,
+    )
+
+
+@router.get("/admission", response_model=dict[str, AdmissionClassStats])
+async def admission_stats() -> dict[str, AdmissionClassStats]:
+    """Report in-flight, queued, admitted and shed requests per route class."""
+    return {
+        name: AdmissionClassStats(
+            limit=stats.limit,
+            in_flight=stats.in_flight,
+            queued=stats.queued,
+            admitted=stats.admitted,
+            shed=stats.shed,
+        )
+        for name, stats in controller.stats().items()
+    }
+
+
+@router.get("/rate-limit", response_model=list[RateLimitRuleStats])
+async def rate_limit_stats() -> list[RateLimitRuleStats]:
+    """Report tracked clients and limited requests per rate-limit rule."""
+    return [
+        RateLimitRuleStats(
+            rule=stats.rule,
+            rate=stats.rate,
+            burst=stats.burst,
+            tracked_clients=stats.tracked_clients,
+            limited=stats.limited,
+        )
+        for stats in limiter.stats()
+    ]
+
+
+@router.get("/latency", response_model=LatencyReport)
+async def latency_report() -> LatencyReport:
+    """Report rolling-window latency percentiles per route and SLO breaches."""
+    recorder = latency.recorder
+    histograms = recorder.snapshot()
+    routes = {}
+    for route, histogram in sorted(histograms.items()):
+        values = histogram.percentiles(latency.PERCENTILES)
+        p50, p90, p99, p999 = (values[p] / 1000 for p in latency.PERCENTILES)
+        routes[route] = RoutePercentiles(
+            count=histogram.total,
+            p50_ms=p50,
+            p90_ms=p90,
+            p99_ms=p99,
+            p999_ms=p999,
+            max_ms=histogram.max_micros / 1000,
+        )
+    slos = {}
+    for slo in recorder.slos:
+        budget_micros = int(slo.budget_ms * 1000)
+        covered = [
+            histogram
+            for route, histogram in histograms.items()
+            if latency.covers(slo.route_prefix, route)
+        ]
+        slos[slo.name] = SLOStatus(
+            route_prefix=slo.route_prefix,
+            budget_ms=slo.budget_ms,
+            window_requests=sum(histogram.total for histogram in covered),
+            window_breaches=sum(h.count_above(budget_micros) for h in covered),
+            total_breaches=recorder.breaches[slo.name],
+        )
+    return LatencyReport(window_s=recorder.window, routes=routes, slos=slos)
+
+
+@router.get("/startup", response_model=StartupReportResponse)
+async def startup_phases() -> StartupReportResponse:
+    """Report cold-start phase durations in milliseconds."""
+    return StartupReportResponse.model_validate(startup.startup_report())
+
+
+async def _export_lines() -> AsyncIterator[bytes]:
+    """Encode exported records as NDJSON, one chunk per yielded block."""
+    chunks = get_backend().export_records(config.settings.export_chunk_size)
+    async for chunk in chunks:
+        lines = []
+        for session_id, memory, registers in chunk:
+            record: dict[str, object] = {"session_id": session_id}
+            if memory is not None:
+                record["memory"] = memory
+            if registers is not None:
+                record["registers"] = registers
+            lines.append(json.dumps(record, separators=(",", ":")))
+        lines.append("")
+        yield "\n".join(lines).encode()
+
+
+@router.get("/memory/export", response_class=StreamingResponse)
+async def memory_export() -> StreamingResponse:
+    """Stream every session's memory state as NDJSON.
+
+    Records are produced chunk by chunk, so neither the store nor the
+    response is materialized in full.
+    """
+    return StreamingResponse(_export_lines(), media_type="application/x-ndjson")
+
+
+def _parse_record(line: bytes, line_number: int) -> SessionRecord:
+    """Validate one NDJSON line into a store record."""
+    try:
+        record = MemoryRecord.model_validate_json(line)
+    except ValidationError as exc:
+        raise InvalidImportRecordError(line_number) from exc
+    return (record.session_id, record.memory, record.registers)
+
+
+@router.post("/memory/import", response_model=MemoryImportResponse)
+async def memory_import(request: Request) -> MemoryImportResponse:
+    """Load NDJSON memory records streamed in the request body.
+
+    Records are applied in batches as they arrive. A malformed line stops
+    the import with 400; batches before it stay applied.
+    """
+    backend = get_backend()
+    batch_size = config.settings.import_batch_size
+    batch: list[SessionRecord] = []
+    imported = 0
+    line_number = 0
+    pending = b""
+
+    async for chunk in request.stream():
+        *lines, pending = (pending + chunk).split(b"\n")
+        for line in lines:
+            line_number += 1
+            if line.strip():
+                batch.append(_parse_record(line, line_number))
+            if len(batch) >= batch_size:
+                imported += await backend.import_records(batch)
+                batch = []
+    if pending.strip():
+        batch.append(_parse_record(pending, line_number + 1))
+    if batch:
+        imported += await backend.import_records(batch)
+
+    return MemoryImportResponse(imported=imported, message="Memory imported")
@@ -1,23 +1,130 @@
 """Calculate endpoint for arithmetic operations."""
 
-from fastapi import APIRouter
+import hashlib
+from urllib.parse import quote
 
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import RedirectResponse
+from pydantic import TypeAdapter
+
+from src import config
+from src.caching import etag_matches
+from src.metrics import CALCULATIONS
 from src.models import CalculationRequest, CalculationResponse
+from src.routes.dependencies import get_session_id
 from src.services.calculator import calculate
+from src.services.history import record_calculation
 
 router = APIRouter()
 
+_RESPONSE_ADAPTER = TypeAdapter(CalculationResponse)
+
+# Bumped whenever the response encoding changes, so GET /calculate ETags
+# derived from inputs alone never match a representation that has changed.
+_RESPONSE_VERSION = "1"
+
+
+def encoded_calculation(request: CalculationRequest) -> tuple[float, bytes]:
+    """Compute a calculation and its JSON response body.
+
+    Args:
+        request: Calculation request with operands and operator
+
+    Returns:
+        The numeric result and the encoded CalculationResponse
+
+    Raises:
+        CalculatorError: If the calculation fails
+    """
+    result = calculate(request.operand1, request.operand2, request.operator)
+    expression = f"{request.operand1} {request.operator} {request.operand2} = {result}"
+    response = CalculationResponse(result=result, expression=expression)
+    CALCULATIONS.inc(request.operator)
+    return result, _RESPONSE_ADAPTER.dump_json(response)
+
 
 @router.post("/calculate", response_model=CalculationResponse)
-def calculate_endpoint(request: CalculationRequest) -> CalculationResponse:
+def calculate_endpoint(
+    request: CalculationRequest,
+    session_id: str | None = Depends(get_session_id),
+) -> Response:
     """Perform arithmetic calculation.
 
+    Calculations made with a session are recorded in its history.
+
     Args:
         request: Calculation request with operands and operator
+        session_id: Caller's session, if any
 
     Returns:
         Calculation response with result and expression
     """
-    result = calculate(request.operand1, request.operand2, request.operator)
-    expression = f"{request.operand1} {request.operator} {request.operand2} = {result}"
-    return CalculationResponse(result=result, expression=expression)
+    result, body = encoded_calculation(request)
+    if session_id:
+        record_calculation(
+            session_id, request.operand1, request.operand2, request.operator, result
+        )
+    return Response(content=body, media_type="application/json")
+
+
+def canonical_query(request: CalculationRequest) -> str:
+    """Return the canonical GET /calculate query string for a request.
+
+    Parameters appear in a fixed order, operands in Python's shortest
+    round-trip ``repr`` and the operator percent-encoded, so every spelling
+    of the same calculation maps to one cacheable URL.
+    """
+    return (
+        f"operand1={request.operand1!r}&operand2={request.operand2!r}"
+        f"&operator={quote(request.operator, safe='')}"
+    )
+
+
+def calculation_etag(query: str) -> str:
+    """Strong entity tag for a canonical query: results are pure functions."""
+    digest = hashlib.sha256(f"{_RESPONSE_VERSION}?{query}".encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+@router.get("/calculate", response_model=CalculationResponse)
+def calculate_query(
+    request: Request,
+    operand1: float,
+    operand2: float,
+    operator: str,
+) -> Response:
+    """Perform arithmetic calculation from query parameters.
+
+    The cacheable form of POST /calculate: non-canonical query strings are
+    redirected to the canonical URL, responses carry a long-lived
+    Cache-Control header and a strong ETag computed from the inputs, and a
+    matching If-None-Match is answered with 304 without calculating.
+    Calculations made this way are not recorded in session history.
+
+    Args:
+        request: Incoming request
+        operand1: First operand
+        operand2: Second operand
+        operator: Arithmetic operator; ``+`` must be sent as ``%2B``
+
+    Returns:
+        Calculation response, 304 Not Modified or a redirect
+    """
+    calculation = CalculationRequest(
+        operand1=operand1, operand2=operand2, operator=operator
+    )
+    query = canonical_query(calculation)
+    headers = {
+        "Cache-Control": (
+            f"public, max-age={config.settings.calculate_cache_max_age_s}, immutable"
+        )
+    }
+    if request.url.query != query:
+        return RedirectResponse(
+            f"{request.url.path}?{query}", status_code=308, headers=headers
+        )
+    headers["ETag"] = calculation_etag(query)
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    _, body = encoded_calculation(calculation)
+    return Response(content=body, media_type="application/json", headers=headers)
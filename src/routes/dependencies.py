@@ -0,0 +1,58 @@
+"""Shared request dependencies for API routes."""
+
+import secrets
+
+from fastapi import Cookie, Depends, Header, Response
+
+from src import config
+from src.exceptions import AdminAccessDeniedError, SessionRequiredError
+from src.services.session import issue_session_id
+
+SESSION_COOKIE = "calc_session"
+
+
+def get_session_id(
+    x_session_id: str | None = Header(default=None),
+    calc_session: str | None = Cookie(default=None),
+) -> str | None:
+    """Get session ID from header, falling back to the session cookie.
+
+    Anonymous callers get None; reads treat them as an empty session
+    without allocating any state.
+    """
+    return x_session_id or calc_session or None
+
+
+def start_session(response: Response) -> str:
+    """Issue a session ID for an anonymous write, or reject the write.
+
+    The new ID is returned in the X-Session-ID response header and the
+    session cookie so the client can read its state back.
+    """
+    if config.settings.anonymous_writes == "reject":
+        raise SessionRequiredError()
+    session_id = issue_session_id()
+    response.headers["X-Session-ID"] = session_id
+    response.set_cookie(SESSION_COOKIE, session_id, httponly=True, samesite="lax")
+    return session_id
+
+
+def require_session_id(
+    response: Response,
+    session_id: str | None = Depends(get_session_id),
+) -> str:
+    """Get session ID for a write, starting a session for anonymous callers."""
+    return session_id or start_session(response)
+
+
+def require_admin(x_admin_token: str | None = Header(default=None)) -> None:
+    """Reject admin requests without the configured admin token.
+
+    Admin routes expose every session's state, so they are refused
+    outright while no token is configured.
+    """
+    token = config.settings.admin_token
+    if not token or x_admin_token is None:
+        raise AdminAccessDeniedError()
+    if not secrets.compare_digest(x_admin_token.encode(), token.encode()):
+        raise AdminAccessDeniedError()
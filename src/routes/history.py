@@ -0,0 +1,42 @@
+"""History endpoints for per-session calculation history."""
+
+from fastapi import APIRouter, Depends, Query
+
+from src.models import HistoryEntryResponse, HistoryResponse
+from src.routes.dependencies import get_session_id
+from src.services.history import clear_history, get_history
+
+router = APIRouter(prefix="/history", tags=["history"])
+
+MAX_PAGE_SIZE = 100
+
+
+@router.get("", response_model=HistoryResponse)
+async def history_list(
+    offset: int = Query(default=0, ge=0),
+    limit: int = Query(default=20, ge=1, le=MAX_PAGE_SIZE),
+    session_id: str | None = Depends(get_session_id),
+) -> HistoryResponse:
+    """List recent calculations for the session, newest first."""
+    entries, total = get_history(session_id, offset, limit)
+    return HistoryResponse(
+        entries=[
+            HistoryEntryResponse(
+                operand1=operand1, operand2=operand2, operator=operator, result=result
+            )
+            for operand1, operator, operand2, result in entries
+        ],
+        total=total,
+        offset=offset,
+        limit=limit,
+    )
+
+
+@router.delete("", response_model=HistoryResponse)
+async def history_clear(
+    session_id: str | None = Depends(get_session_id),
+) -> HistoryResponse:
+    """Clear the session's calculation history."""
+    if session_id:
+        clear_history(session_id)
+    return HistoryResponse(entries=[], total=0, offset=0, limit=0)
@@ -1,64 +1,338 @@
 """Memory endpoints for calculator memory operations."""
 
+import json
 import uuid
+from collections.abc import AsyncIterator
 
-from fastapi import APIRouter, Header
+from fastapi import APIRouter, Depends, Header, Response
+from fastapi.responses import StreamingResponse
 
-from src.models import MemoryResponse, MemoryValueRequest
-from src.services.memory import (
-    add_to_memory,
-    clear_memory,
-    get_memory,
-    subtract_from_memory,
+from src import config
+from src.caching import etag_matches
+from src.exceptions import (
+    NothingToRedoError,
+    NothingToUndoError,
+    SessionRequiredError,
 )
+from src.models import (
+    MemoryBatchRequest,
+    MemoryBatchResponse,
+    MemoryRegistersResponse,
+    MemoryResponse,
+    MemoryValueRequest,
+)
+from src.routes.dependencies import get_session_id, require_session_id, start_session
+from src.services.idempotency import idempotency_cache
+from src.services.journal import (
+    OP_ADD,
+    OP_CLEAR,
+    OP_SUBTRACT,
+    OPERATION_NAMES,
+    pop_redo,
+    pop_undo,
+    record_operation,
+)
+from src.services.memory_backend import get_backend
+from src.services.memory_events import broker
 
 router = APIRouter(prefix="/memory", tags=["memory"])
 
+# Handlers are coroutines so they run on the event loop instead of paying a
+# threadpool dispatch. Every read and write goes through the MemoryBackend
+# returned by get_backend(): in-process operations never block (large
+# batches move to a worker thread), and remote backends are awaited.
+
+# Distinguishes this process's memory versions from those of earlier runs,
+# so an ETag issued before a restart never matches.
+_BOOT_ID = uuid.uuid4().hex[:12]
+
+# Maximum accepted Idempotency-Key length.
+MAX_IDEMPOTENCY_KEY_LENGTH = 255
+
+
+async def _apply_once(
+    response: Response,
+    idempotency_key: str | None,
+    session_id: str | None,
+    op: int,
+    delta: float,
+) -> float:
+    """Apply a journaled memory increment, at most once per Idempotency-Key.
+
+    Keys are scoped to the session and operation. A duplicate replays the
+    first result without touching the backend or the journal. A key needs
+    an existing session: an anonymous retry would start another session
+    and apply the write again, so anonymous keyed writes are rejected.
 
-def get_session_id(x_session_id: str | None = Header(default=None)) -> str:
-    """Get or generate session ID from header."""
-    if x_session_id:
-        return x_session_id
-    return str(uuid.uuid4())
+    Raises:
+        SessionRequiredError: If an Idempotency-Key arrives without a
+            session, or anonymous writes are rejected
+    """
+    if session_id is None:
+        if idempotency_key is not None:
+            raise SessionRequiredError()
+        session_id = start_session(response)
+
+    target = session_id
+
+    async def apply() -> float:
+        new_value = await get_backend().increment(target, delta)
+        record_operation(target, op, delta)
+        return new_value
+
+    if idempotency_key is None:
+        return await apply()
+    new_value, replayed = await idempotency_cache.run(
+        (target, op, idempotency_key), delta, apply
+    )
+    if replayed:
+        response.headers["Idempotent-Replayed"] = "true"
+    return new_value
 
 
 @router.post("/add", response_model=MemoryResponse)
-def memory_add(
+async def memory_add(
     request: MemoryValueRequest,
-    x_session_id: str | None = Header(default=None),
+    response: Response,
+    session_id: str | None = Depends(get_session_id),
+    idempotency_key: str | None = Header(
+        default=None, max_length=MAX_IDEMPOTENCY_KEY_LENGTH
+    ),
 ) -> MemoryResponse:
-    """Add value to memory."""
-    session_id = get_session_id(x_session_id)
-    new_value = add_to_memory(session_id, request.value)
+    """Add value to memory.
+
+    Retries carrying the same Idempotency-Key replay the first response.
+    """
+    new_value = await _apply_once(
+        response, idempotency_key, session_id, OP_ADD, request.value
+    )
     return MemoryResponse(value=new_value, message="Value added to memory")
 
 
 @router.post("/subtract", response_model=MemoryResponse)
-def memory_subtract(
+async def memory_subtract(
     request: MemoryValueRequest,
-    x_session_id: str | None = Header(default=None),
+    response: Response,
+    session_id: str | None = Depends(get_session_id),
+    idempotency_key: str | None = Header(
+        default=None, max_length=MAX_IDEMPOTENCY_KEY_LENGTH
+    ),
 ) -> MemoryResponse:
-    """Subtract value from memory."""
-    session_id = get_session_id(x_session_id)
-    new_value = subtract_from_memory(session_id, request.value)
+    """Subtract value from memory.
+
+    Retries carrying the same Idempotency-Key replay the first response.
+    """
+    new_value = await _apply_once(
+        response, idempotency_key, session_id, OP_SUBTRACT, -request.value
+    )
     return MemoryResponse(value=new_value, message="Value subtracted from memory")
 
 
+@router.post("/batch", response_model=MemoryBatchResponse)
+async def memory_batch(
+    request: MemoryBatchRequest,
+    response: Response,
+    session_id: str | None = Depends(get_session_id),
+) -> MemoryBatchResponse:
+    """Apply a batch of add/subtract operations, atomically per session.
+
+    Operations without an explicit session_id use the caller's session.
+    """
+    if session_id is None and any(op.session_id is None for op in request.operations):
+        session_id = start_session(response)
+    default_session_id = session_id or ""
+    values = await get_backend().apply_batch(
+        [
+            (op.session_id or default_session_id, op.op, op.value)
+            for op in request.operations
+        ]
+    )
+    return MemoryBatchResponse(values=values, message="Batch applied to memory")
+
+
 @router.get("", response_model=MemoryResponse)
-def memory_recall(
-    x_session_id: str | None = Header(default=None),
-) -> MemoryResponse:
-    """Recall current memory value."""
-    session_id = get_session_id(x_session_id)
-    value = get_memory(session_id)
+async def memory_recall(
+    response: Response,
+    session_id: str | None = Depends(get_session_id),
+    if_none_match: str | None = Header(default=None),
+) -> MemoryResponse | Response:
+    """Recall current memory value.
+
+    The response carries an ETag built from the session's memory version;
+    a poll whose If-None-Match still matches gets 304 with no body.
+    """
+    value, version = await get_backend().recall(session_id) if session_id else (0.0, 0)
+    headers = {
+        "ETag": f'"{_BOOT_ID}-{version}"',
+        "Cache-Control": "private, no-cache",
+        "Vary": "X-Session-ID, Cookie",
+    }
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
     return MemoryResponse(value=value, message="Memory recalled")
 
 
+def _sse_event(version: int, value: float) -> bytes:
+    """Encode one memory change as a Server-Sent Event."""
+    data = json.dumps({"value": value, "version": version}, separators=(",", ":"))
+    # Version 0 means the session has never been written; it gets no id,
+    # so a reconnect does not resume from it.
+    event_id = f"id: {version}\n" if version else ""
+    return f"{event_id}event: memory\ndata: {data}\n\n".encode()
+
+
+def _parse_event_id(last_event_id: str | None) -> int | None:
+    """Return a Last-Event-ID header as a version, or None if it is not one."""
+    if last_event_id is None:
+        return None
+    try:
+        return int(last_event_id)
+    except ValueError:
+        return None
+
+
+async def _memory_events(
+    session_id: str, last_event_id: int | None = None
+) -> AsyncIterator[bytes]:
+    """Yield the current value, then every change, with keep-alive comments.
+
+    The snapshot is skipped when the client reconnects with the current
+    version as its Last-Event-ID; it already holds that value.
+    """
+    subscription = broker.subscribe(session_id)
+    try:
+        # Events queued meanwhile that are no newer than the snapshot are
+        # dropped.
+        value, version = await get_backend().recall(session_id)
+        subscription.last_version = version
+        if not version or version != last_event_id:
+            yield _sse_event(version, value)
+        heartbeat = config.settings.memory_events_heartbeat_s
+        while True:
+            events = await subscription.next_events(heartbeat)
+            if not events:
+                yield b": keep-alive\n\n"
+                continue
+            yield b"".join(_sse_event(version, value) for version, value in events)
+    finally:
+        broker.unsubscribe(subscription)
+
+
+@router.get("/events", response_class=StreamingResponse)
+async def memory_events(
+    session_id: str | None = Depends(get_session_id),
+    last_event_id: str | None = Header(default=None),
+) -> StreamingResponse:
+    """Stream the session's memory value as Server-Sent Events.
+
+    The first event carries the current value; one follows every add,
+    subtract or clear, in increasing version order. Each event's id is the
+    memory version used by the GET /memory ETag. A reconnect whose
+    Last-Event-ID is still current skips the snapshot. Slow consumers lose
+    the oldest queued events, never the latest value.
+    """
+    if session_id is None:
+        raise SessionRequiredError()
+    return StreamingResponse(
+        _memory_events(session_id, _parse_event_id(last_event_id)),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.delete("", response_model=MemoryResponse)
-def memory_clear(
-    x_session_id: str | None = Header(default=None),
+async def memory_clear(
+    session_id: str | None = Depends(get_session_id),
 ) -> MemoryResponse:
-    """Clear memory for session."""
-    session_id = get_session_id(x_session_id)
-    clear_memory(session_id)
+    """Clear memory for session.
+
+    Clearing an empty memory is not journaled, so it leaves no state.
+    """
+    if session_id:
+        previous = await get_backend().clear(session_id)
+        if previous:
+            record_operation(session_id, OP_CLEAR, -previous)
     return MemoryResponse(value=0.0, message="Memory cleared")
+
+
+@router.post("/undo", response_model=MemoryResponse)
+async def memory_undo(
+    session_id: str | None = Depends(get_session_id),
+) -> MemoryResponse:
+    """Reverse the most recent add, subtract or clear."""
+    entry = pop_undo(session_id) if session_id else None
+    if session_id is None or entry is None:
+        raise NothingToUndoError()
+    op, delta = entry
+    new_value = await get_backend().increment(session_id, -delta)
+    return MemoryResponse(value=new_value, message=f"Undid {OPERATION_NAMES[op]}")
+
+
+@router.post("/redo", response_model=MemoryResponse)
+async def memory_redo(
+    session_id: str | None = Depends(get_session_id),
+) -> MemoryResponse:
+    """Reapply the most recently undone operation."""
+    entry = pop_redo(session_id) if session_id else None
+    if session_id is None or entry is None:
+        raise NothingToRedoError()
+    op, delta = entry
+    new_value = await get_backend().increment(session_id, delta)
+    return MemoryResponse(value=new_value, message=f"Redid {OPERATION_NAMES[op]}")
+
+
+@router.get("/registers", response_model=MemoryRegistersResponse)
+async def registers_recall(
+    session_id: str | None = Depends(get_session_id),
+) -> MemoryRegistersResponse:
+    """Recall every memory register M1..Mn."""
+    values = await get_backend().get_registers(session_id)
+    return MemoryRegistersResponse(values=values, message="Registers recalled")
+
+
+@router.delete("/registers", response_model=MemoryRegistersResponse)
+async def registers_clear(
+    session_id: str | None = Depends(get_session_id),
+) -> MemoryRegistersResponse:
+    """Clear every memory register for session."""
+    backend = get_backend()
+    if session_id:
+        await backend.clear_registers(session_id)
+    return MemoryRegistersResponse(
+        values=await backend.get_registers(session_id), message="Registers cleared"
+    )
+
+
+@router.get("/registers/{index}", response_model=MemoryResponse)
+async def register_recall(
+    index: int,
+    session_id: str | None = Depends(get_session_id),
+) -> MemoryResponse:
+    """Recall a single memory register."""
+    value = await get_backend().get_register(session_id, index)
+    return MemoryResponse(value=value, message=f"Register M{index} recalled")
+
+
+@router.post("/registers/{index}/add", response_model=MemoryResponse)
+async def register_add(
+    index: int,
+    request: MemoryValueRequest,
+    session_id: str = Depends(require_session_id),
+) -> MemoryResponse:
+    """Add value to a memory register."""
+    new_value = await get_backend().increment_register(session_id, index, request.value)
+    return MemoryResponse(value=new_value, message=f"Value added to M{index}")
+
+
+@router.post("/registers/{index}/subtract", response_model=MemoryResponse)
+async def register_subtract(
+    index: int,
+    request: MemoryValueRequest,
+    session_id: str = Depends(require_session_id),
+) -> MemoryResponse:
+    """Subtract value from a memory register."""
+    new_value = await get_backend().increment_register(
+        session_id, index, -request.value
+    )
+    return MemoryResponse(value=new_value, message=f"Value subtracted from M{index}")
@@ -0,0 +1,138 @@
+"""Write coalescing for memory increments in front of a backend."""
+
+import asyncio
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+from src import config
+from src.services.memory import BatchOperation, SessionRecord
+from src.services.memory_backend import ForwardingBackend, MemoryBackend
+
+
+@dataclass
+class _PendingIncrement:
+    """Deltas accumulated for one session during the current window."""
+
+    future: asyncio.Future[float]
+    timer: asyncio.TimerHandle | None = None
+    delta: float = 0.0
+    count: int = 0
+
+
+@dataclass
+class CoalescerStats:
+    """Counters describing how much work the coalescer saved."""
+
+    operations: int = 0
+    backend_calls: int = 0
+
+
+class WriteCoalescer(ForwardingBackend):
+    """Aggregate concurrent increments per session into one backend call.
+
+    Add and subtract commute, so every delta that arrives for a session
+    within the coalescing window (or until the size threshold is reached)
+    is summed and written with a single ``backend.increment``. All callers
+    that contributed to the flush receive the post-flush value.
+
+    The coalescer is itself a ``MemoryBackend``. Reads pass straight
+    through and do not see deltas still waiting for their flush. A clear
+    flushes the session's pending deltas and waits for backend writes in
+    flight, so increments submitted before it are never applied after it;
+    batches and imports are ordered the same way.
+    """
+
+    def __init__(
+        self,
+        backend: MemoryBackend,
+        window: float | None = None,
+        max_pending: int | None = None,
+    ) -> None:
+        super().__init__(backend)
+        self._window = (
+            window if window is not None else config.settings.coalesce_window_ms / 1000
+        )
+        self._max_pending = (
+            max_pending
+            if max_pending is not None
+            else config.settings.coalesce_max_pending
+        )
+        self._pending: dict[str, _PendingIncrement] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self.stats = CoalescerStats()
+
+    async def increment(self, session_id: str, delta: float) -> float:
+        """Add delta to a session's memory and return the post-flush value."""
+        return await self._submit(session_id, delta)
+
+    async def clear(self, session_id: str) -> float:
+        """Clear a session once its earlier increments have been written."""
+        await self._drain((session_id,))
+        return await self.backend.clear(session_id)
+
+    async def apply_batch(
+        self, operations: Sequence[BatchOperation]
+    ) -> dict[str, float]:
+        """Apply a batch once the sessions' earlier increments have been written."""
+        await self._drain({operation[0] for operation in operations})
+        return await self.backend.apply_batch(operations)
+
+    async def import_records(self, records: Sequence[SessionRecord]) -> int:
+        """Import records once the sessions' earlier increments have been written."""
+        await self._drain({record[0] for record in records})
+        return await self.backend.import_records(records)
+
+    async def flush_all(self) -> None:
+        """Flush every pending session and wait for the backend writes."""
+        for session_id in list(self._pending):
+            self._flush(session_id)
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def reset_stats(self) -> None:
+        """Zero the operation and backend-call counters."""
+        self.stats = CoalescerStats()
+
+    async def _drain(self, session_ids: Iterable[str]) -> None:
+        """Flush the sessions and wait for every backend write in flight."""
+        for session_id in session_ids:
+            self._flush(session_id)
+        if self._tasks:
+            await asyncio.wait(set(self._tasks))
+
+    async def _submit(self, session_id: str, delta: float) -> float:
+        pending = self._pending.get(session_id)
+        if pending is None:
+            loop = asyncio.get_running_loop()
+            pending = _PendingIncrement(future=loop.create_future())
+            pending.timer = loop.call_later(self._window, self._flush, session_id)
+            self._pending[session_id] = pending
+        pending.delta += delta
+        pending.count += 1
+        self.stats.operations += 1
+        future = pending.future
+        if pending.count >= self._max_pending:
+            self._flush(session_id)
+        return await asyncio.shield(future)
+
+    def _flush(self, session_id: str) -> None:
+        pending = self._pending.pop(session_id, None)
+        if pending is None:
+            return
+        if pending.timer is not None:
+            pending.timer.cancel()
+        task = asyncio.ensure_future(self._apply(session_id, pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        # A write cancelled before or during the backend call never settles
+        # the future; cancel it so the waiting callers are released.
+        task.add_done_callback(lambda _: pending.future.cancel())
+
+    async def _apply(self, session_id: str, pending: _PendingIncrement) -> None:
+        self.stats.backend_calls += 1
+        try:
+            value = await self.backend.increment(session_id, pending.delta)
+        except Exception as exc:
+            pending.future.set_exception(exc)
+        else:
+            pending.future.set_result(value)
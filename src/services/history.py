@@ -0,0 +1,125 @@
+"""Per-session calculation history in fixed-size ring buffers."""
+
+import threading
+from array import array
+
+from src import config
+from src.services.session import register_eviction_hook, touch
+
+OPERATORS = "+-*/"
+_OPERATOR_CODES = {operator: code for code, operator in enumerate(OPERATORS)}
+
+# (operand1, operator, operand2, result)
+HistoryEntry = tuple[float, str, float, float]
+
+
+class _HistoryRing:
+    """Preallocated ring of the last N calculations for one session.
+
+    Operands and results live in parallel arrays of doubles and operators
+    in an array of small-int codes, so a session's history costs about
+    25 bytes per slot regardless of how many calculations it has made.
+    """
+
+    __slots__ = ("operand1", "operand2", "result", "operator", "head", "count")
+
+    def __init__(self, capacity: int) -> None:
+        zeros = bytes(8 * capacity)
+        self.operand1 = array("d", zeros)
+        self.operand2 = array("d", zeros)
+        self.result = array("d", zeros)
+        self.operator = array("b", bytes(capacity))
+        self.head = 0
+        self.count = 0
+
+    def append(
+        self, operand1: float, operator_code: int, operand2: float, result: float
+    ) -> None:
+        capacity = len(self.result)
+        slot = self.head
+        self.operand1[slot] = operand1
+        self.operand2[slot] = operand2
+        self.result[slot] = result
+        self.operator[slot] = operator_code
+        self.head = (slot + 1) % capacity
+        if self.count < capacity:
+            self.count += 1
+
+    def newest_first(self, offset: int, limit: int) -> list[HistoryEntry]:
+        capacity = len(self.result)
+        entries: list[HistoryEntry] = []
+        for i in range(offset, min(offset + limit, self.count)):
+            slot = (self.head - 1 - i) % capacity
+            entries.append(
+                (
+                    self.operand1[slot],
+                    OPERATORS[self.operator[slot]],
+                    self.operand2[slot],
+                    self.result[slot],
+                )
+            )
+        return entries
+
+
+_history_store: dict[str, _HistoryRing] = {}
+_lock = threading.Lock()
+
+
+def record_calculation(
+    session_id: str, operand1: float, operand2: float, operator: str, result: float
+) -> None:
+    """Record a successful calculation in the session's history.
+
+    A ``history_size`` of 0 or less turns history off.
+
+    Args:
+        session_id: Unique session identifier
+        operand1: First operand
+        operand2: Second operand
+        operator: Arithmetic operator (+, -, *, /)
+        result: Result of the calculation
+    """
+    size = config.settings.history_size
+    if size <= 0:
+        return
+    touch(session_id)
+    code = _OPERATOR_CODES[operator]
+    with _lock:
+        ring = _history_store.get(session_id)
+        if ring is None:
+            ring = _HistoryRing(size)
+            _history_store[session_id] = ring
+        ring.append(operand1, code, operand2, result)
+
+
+def get_history(
+    session_id: str | None, offset: int, limit: int
+) -> tuple[list[HistoryEntry], int]:
+    """Get a page of a session's history, newest first.
+
+    Args:
+        session_id: Unique session identifier, or None for anonymous callers
+        offset: Number of newest entries to skip
+        limit: Maximum entries to return
+
+    Returns:
+        Tuple of (entries, total entries held for the session)
+    """
+    with _lock:
+        ring = _history_store.get(session_id) if session_id else None
+        if ring is None:
+            return [], 0
+        return ring.newest_first(offset, limit), ring.count
+
+
+def clear_history(session_id: str) -> None:
+    """Clear a session's history.
+
+    Args:
+        session_id: Unique session identifier
+    """
+    with _lock:
+        _history_store.pop(session_id, None)
+
+
+register_eviction_hook(clear_history)
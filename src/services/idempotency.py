@@ -0,0 +1,117 @@
+"""Bounded TTL cache replaying responses for repeated Idempotency-Keys."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+
+from src import config
+from src.exceptions import IdempotencyKeyConflictError
+
+
+@dataclass
+class IdempotencyStats:
+    """Counters for an idempotency cache."""
+
+    executed: int = 0
+    replayed: int = 0
+    conflicts: int = 0
+    evictions: int = 0
+
+
+class IdempotencyCache:
+    """Run each keyed mutation once and replay its result for duplicates.
+
+    Entries hold a future for the first request's result, so a duplicate
+    that arrives while the original is still running waits for it instead
+    of executing again. Entries expire after a fixed TTL and the oldest are
+    evicted beyond ``max_size``; since every entry shares the TTL, insertion
+    order is also expiry order. A failed mutation is forgotten so that a
+    retry can run it again.
+    """
+
+    def __init__(
+        self,
+        max_size: int | None = None,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        settings = config.settings
+        self._max_size = (
+            max_size if max_size is not None else settings.idempotency_cache_size
+        )
+        self._ttl = ttl if ttl is not None else settings.idempotency_ttl_s
+        self._clock = clock
+        # Key -> (expiry time, request fingerprint, result future).
+        self._entries: OrderedDict[
+            Hashable, tuple[float, Hashable, asyncio.Future[float]]
+        ] = OrderedDict()
+        self.stats = IdempotencyStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def run(
+        self,
+        key: Hashable,
+        fingerprint: Hashable,
+        operation: Callable[[], Awaitable[float]],
+    ) -> tuple[float, bool]:
+        """Execute ``operation`` once per key within the TTL.
+
+        Args:
+            key: Idempotency key, scoped by the caller to session and route
+            fingerprint: Request parameters the key was first used with
+            operation: Coroutine function performing the mutation
+
+        Returns:
+            The operation's result and whether it was replayed
+
+        Raises:
+            IdempotencyKeyConflictError: If the key was used with different
+                request parameters
+        """
+        now = self._clock()
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            _, stored_fingerprint, result = entry
+            if stored_fingerprint != fingerprint:
+                self.stats.conflicts += 1
+                raise IdempotencyKeyConflictError()
+            value = await asyncio.shield(result)
+            self.stats.replayed += 1
+            return value, True
+
+        result = asyncio.get_running_loop().create_future()
+        self._store(key, (now + self._ttl, fingerprint, result), now)
+        try:
+            value = await operation()
+        except BaseException as exc:
+            if self._entries.get(key, (0.0, None, None))[2] is result:
+                del self._entries[key]
+            result.set_exception(exc)
+            # Waiters re-raise it; without waiters it must not be reported.
+            result.exception()
+            raise
+        result.set_result(value)
+        self.stats.executed += 1
+        return value, False
+
+    def _store(
+        self,
+        key: Hashable,
+        entry: tuple[float, Hashable, asyncio.Future[float]],
+        now: float,
+    ) -> None:
+        self._entries.pop(key, None)
+        while self._entries:
+            oldest = next(iter(self._entries.values()))
+            if oldest[0] > now and len(self._entries) < self._max_size:
+                break
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+        self._entries[key] = entry
+
+
+idempotency_cache = IdempotencyCache()
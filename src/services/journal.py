@@ -0,0 +1,128 @@
+"""Per-session undo/redo journal for memory operations."""
+
+import threading
+from array import array
+
+from src import config
+from src.services.session import register_eviction_hook, touch
+
+OP_ADD = 0
+OP_SUBTRACT = 1
+OP_CLEAR = 2
+
+OPERATION_NAMES = ("add", "subtract", "clear")
+
+
+class _Journal:
+    """Bounded (op-code, delta) journal for one session.
+
+    Every operation is stored as the signed delta it applied to memory, so
+    undo applies ``-delta`` and redo applies ``delta`` in O(1). A clear is
+    journaled as minus the value it discarded. Undo entries live in a ring
+    that drops the oldest entry once ``depth`` is reached; redo entries are
+    a stack that is emptied whenever a new operation is recorded.
+    """
+
+    __slots__ = ("ops", "deltas", "head", "count", "redo_ops", "redo_deltas")
+
+    def __init__(self, depth: int) -> None:
+        self.ops = array("b", bytes(depth))
+        self.deltas = array("d", bytes(8 * depth))
+        self.head = 0
+        self.count = 0
+        self.redo_ops = array("b")
+        self.redo_deltas = array("d")
+
+    def push(self, op: int, delta: float) -> None:
+        depth = len(self.ops)
+        self.ops[self.head] = op
+        self.deltas[self.head] = delta
+        self.head = (self.head + 1) % depth
+        self.count = min(self.count + 1, depth)
+
+    def pop(self) -> tuple[int, float] | None:
+        if not self.count:
+            return None
+        self.head = (self.head - 1) % len(self.ops)
+        self.count -= 1
+        return self.ops[self.head], self.deltas[self.head]
+
+
+_journal_store: dict[str, _Journal] = {}
+_lock = threading.Lock()
+
+
+def record_operation(session_id: str, op: int, delta: float) -> None:
+    """Journal a memory operation and discard anything that could be redone.
+
+    The session is touched so its journal is evicted with the rest of its
+    state. A ``journal_depth`` of 0 or less turns journaling off.
+
+    Args:
+        session_id: Unique session identifier
+        op: Operation code (OP_ADD, OP_SUBTRACT or OP_CLEAR)
+        delta: Signed change the operation applied to memory
+    """
+    depth = config.settings.journal_depth
+    if depth <= 0:
+        return
+    touch(session_id)
+    with _lock:
+        journal = _journal_store.get(session_id)
+        if journal is None:
+            journal = _Journal(depth)
+            _journal_store[session_id] = journal
+        journal.push(op, delta)
+        del journal.redo_ops[:]
+        del journal.redo_deltas[:]
+
+
+def pop_undo(session_id: str) -> tuple[int, float] | None:
+    """Take the newest journaled operation and move it to the redo stack.
+
+    Args:
+        session_id: Unique session identifier
+
+    Returns:
+        (op, delta) of the operation to reverse, or None if nothing to undo
+    """
+    with _lock:
+        journal = _journal_store.get(session_id)
+        entry = journal.pop() if journal is not None else None
+        if journal is None or entry is None:
+            return None
+        journal.redo_ops.append(entry[0])
+        journal.redo_deltas.append(entry[1])
+        return entry
+
+
+def pop_redo(session_id: str) -> tuple[int, float] | None:
+    """Take the most recently undone operation back onto the journal.
+
+    Args:
+        session_id: Unique session identifier
+
+    Returns:
+        (op, delta) of the operation to reapply, or None if nothing to redo
+    """
+    with _lock:
+        journal = _journal_store.get(session_id)
+        if journal is None or not journal.redo_ops:
+            return None
+        op = journal.redo_ops.pop()
+        delta = journal.redo_deltas.pop()
+        journal.push(op, delta)
+        return op, delta
+
+
+def clear_journal(session_id: str) -> None:
+    """Drop a session's journal.
+
+    Args:
+        session_id: Unique session identifier
+    """
+    with _lock:
+        _journal_store.pop(session_id, None)
+
+
+register_eviction_hook(clear_journal)
@@ -1,6 +1,131 @@
 """Memory service for session-based calculator memory."""
 
+import itertools
+import sys
+import threading
+import time
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+
+from src import config
+from src.exceptions import InvalidRegisterError
+from src.services.session import register_eviction_hook, touch
+
 _memory_store: dict[str, float] = {}
+_register_store: dict[str, array[float]] = {}
+# Session id -> version of its memory value, drawn from one process-wide
+# counter so versions only ever increase. A clear stores a new version like
+# any other write. Sessions never written, or evicted, have no entry and
+# report version 0, which always denotes 0.0.
+_versions: dict[str, int] = {}
+_next_version = itertools.count(1).__next__
+# Receives (session_id, new value, new version) for every change.
+ChangeListener = Callable[[str, float, int], None]
+# Replaced, never mutated, so _notify can iterate without the lock.
+_change_listeners: list[ChangeListener] = []
+_lock = threading.Lock()
+
+# Entries inspected when estimating per-entry byte usage.
+_SIZE_SAMPLE = 32
+
+# Minimum length in seconds of the fixed windows write rates are measured over.
+_RATE_WINDOW_S = 10.0
+
+
+@dataclass
+class _StoreCounters:
+    """Cumulative write counters across the memory and register stores."""
+
+    inserts: int = 0
+    updates: int = 0
+    deletes: int = 0
+
+
+@dataclass
+class _RateWindow:
+    """Write counters at the start of the current rate window. Guarded by _lock."""
+
+    started: float
+    base: _StoreCounters
+    # Rates measured over the last completed window, if any.
+    rates: tuple[float, float, float] | None = None
+
+
+@dataclass(frozen=True)
+class MemoryStoreStats:
+    """Point-in-time view of the memory stores."""
+
+    memory_entries: int
+    register_entries: int
+    approx_bytes: int
+    inserts: int
+    updates: int
+    deletes: int
+    insert_rate: float
+    update_rate: float
+    delete_rate: float
+
+
+# (session_id, op, value) with op "add" or "subtract", as applied in batches.
+BatchOperation = tuple[str, str, float]
+
+# (session_id, memory value, register values) as moved by export/import.
+SessionRecord = tuple[str, float | None, list[float] | None]
+
+_counters = _StoreCounters()
+_rate_window = _RateWindow(started=time.monotonic(), base=_StoreCounters())
+
+
+def _put(session_id: str, value: float) -> int:
+    """Store a memory value, counting inserts and updates. Caller holds _lock.
+
+    Returns:
+        The value's new version
+    """
+    if session_id in _memory_store:
+        _counters.updates += 1
+    else:
+        _counters.inserts += 1
+    _memory_store[session_id] = value
+    version = _versions[session_id] = _next_version()
+    return version
+
+
+def _drop(session_id: str) -> None:
+    """Remove a memory value and its version. Caller holds _lock."""
+    if _memory_store.pop(session_id, None) is not None:
+        _counters.deletes += 1
+    _versions.pop(session_id, None)
+
+
+def register_change_listener(listener: ChangeListener) -> Callable[[], None]:
+    """Register a callback invoked after every change to a memory value.
+
+    Listeners receive (session_id, new value, new version) after the store
+    lock is released, on whichever thread made the change, so they must be
+    cheap and thread-safe.
+
+    Args:
+        listener: Callable receiving each change
+
+    Returns:
+        Callable that unregisters the listener
+    """
+    global _change_listeners
+    _change_listeners = [*_change_listeners, listener]
+
+    def unregister() -> None:
+        global _change_listeners
+        _change_listeners = [other for other in _change_listeners if other != listener]
+
+    return unregister
+
+
+def _notify(session_id: str, value: float, version: int) -> None:
+    """Report a change to every listener."""
+    for listener in _change_listeners:
+        listener(session_id, value, version)
 
 
 def get_memory(session_id: str) -> float:
@@ -15,6 +140,38 @@ def get_memory(session_id: str) -> float:
     return _memory_store.get(session_id, 0.0)
 
 
+def recall_memory(session_id: str) -> tuple[float, int]:
+    """Get a session's memory value together with its version.
+
+    Both are read under the store lock, so the value is exactly the one
+    the version labels.
+
+    Args:
+        session_id: Unique session identifier
+
+    Returns:
+        (value, version); (0.0, 0) for sessions never written
+    """
+    with _lock:
+        return _memory_store.get(session_id, 0.0), _versions.get(session_id, 0)
+
+
+def get_memory_version(session_id: str) -> int:
+    """Get the version of a session's memory value.
+
+    The version changes with every add, subtract, set or clear. Read it
+    before the value: a value read afterwards is never older than the
+    version it is labelled with.
+
+    Args:
+        session_id: Unique session identifier
+
+    Returns:
+        Current version (0 for sessions never written, or evicted)
+    """
+    return _versions.get(session_id, 0)
+
+
 def set_memory(session_id: str, value: float) -> None:
     """Set memory value for session.
 
@@ -22,7 +179,11 @@ def set_memory(session_id: str, value: float) -> None:
         session_id: Unique session identifier
         value: New memory value
     """
-    _memory_store[session_id] = value
+    touch(session_id)
+    with _lock:
+        version = _put(session_id, value)
+    if _change_listeners:
+        _notify(session_id, value, version)
 
 
 def add_to_memory(session_id: str, value: float) -> float:
@@ -35,9 +196,12 @@ def add_to_memory(session_id: str, value: float) -> float:
     Returns:
         New memory value
     """
-    current = get_memory(session_id)
-    new_value = current + value
-    set_memory(session_id, new_value)
+    touch(session_id)
+    with _lock:
+        new_value = _memory_store.get(session_id, 0.0) + value
+        version = _put(session_id, new_value)
+    if _change_listeners:
+        _notify(session_id, new_value, version)
     return new_value
 
 
@@ -51,16 +215,329 @@ def subtract_from_memory(session_id: str, value: float) -> float:
     Returns:
         New memory value
     """
-    current = get_memory(session_id)
-    new_value = current - value
-    set_memory(session_id, new_value)
+    touch(session_id)
+    with _lock:
+        new_value = _memory_store.get(session_id, 0.0) - value
+        version = _put(session_id, new_value)
+    if _change_listeners:
+        _notify(session_id, new_value, version)
     return new_value
 
 
-def clear_memory(session_id: str) -> None:
+def clear_memory(session_id: str) -> float:
     """Clear memory for session.
 
+    Cleared sessions hold no entry; recall of a missing entry returns 0.0.
+
+    Args:
+        session_id: Unique session identifier
+
+    Returns:
+        The value that was cleared (0.0 if there was none)
+    """
+    with _lock:
+        if session_id not in _versions:
+            return 0.0
+        previous = _memory_store.pop(session_id, None)
+        if previous is not None:
+            _counters.deletes += 1
+        version = _versions[session_id] = _next_version()
+    if _change_listeners:
+        _notify(session_id, 0.0, version)
+    return previous or 0.0
+
+
+def apply_memory_batch(operations: Iterable[BatchOperation]) -> dict[str, float]:
+    """Apply a batch of memory operations grouped by session.
+
+    Add and subtract commute, so each session's operations are folded into a
+    single delta before the store is touched. Every session's delta is then
+    applied inside one critical section.
+
+    Args:
+        operations: (session_id, op, value) triples where op is "add" or
+            "subtract"
+
+    Returns:
+        Final memory value for each session in the batch
+    """
+    deltas: dict[str, float] = {}
+    for session_id, op, value in operations:
+        delta = value if op == "add" else -value
+        deltas[session_id] = deltas.get(session_id, 0.0) + delta
+
+    results: dict[str, float] = {}
+    for session_id, delta in deltas.items():
+        touch(session_id)
+        with _lock:
+            new_value = _memory_store.get(session_id, 0.0) + delta
+            version = _put(session_id, new_value)
+        if _change_listeners:
+            _notify(session_id, new_value, version)
+        results[session_id] = new_value
+    return results
+
+
+def _check_register(index: int) -> int:
+    """Validate a 1-based register index and return its array offset."""
+    if not 1 <= index <= config.settings.memory_registers:
+        raise InvalidRegisterError(index)
+    return index - 1
+
+
+def get_register(session_id: str | None, index: int) -> float:
+    """Get the value of one memory register.
+
+    Args:
+        session_id: Unique session identifier, or None for anonymous callers
+        index: 1-based register index (M1..Mn)
+
+    Returns:
+        Register value (0.0 if the session has no registers yet)
+
+    Raises:
+        InvalidRegisterError: If index is outside 1..n
+    """
+    offset = _check_register(index)
+    registers = _register_store.get(session_id) if session_id else None
+    if registers is None or offset >= len(registers):
+        return 0.0
+    return registers[offset]
+
+
+def get_registers(session_id: str | None) -> list[float]:
+    """Get every memory register for a session in one call.
+
+    Args:
+        session_id: Unique session identifier, or None for anonymous callers
+
+    Returns:
+        Register values M1..Mn
+    """
+    registers = _register_store.get(session_id) if session_id else None
+    if registers is None:
+        return [0.0] * config.settings.memory_registers
+    return registers.tolist()
+
+
+def add_to_register(session_id: str, index: int, value: float) -> float:
+    """Add value to a memory register.
+
+    Registers are allocated lazily as one fixed-size array of doubles per
+    session, so n registers cost 8n bytes plus a single array header.
+
+    Args:
+        session_id: Unique session identifier
+        index: 1-based register index (M1..Mn)
+        value: Value to add (negative to subtract)
+
+    Returns:
+        New register value
+
+    Raises:
+        InvalidRegisterError: If index is outside 1..n
+    """
+    offset = _check_register(index)
+    touch(session_id)
+    with _lock:
+        registers = _register_store.get(session_id)
+        if registers is None:
+            registers = array("d", bytes(8 * config.settings.memory_registers))
+            _register_store[session_id] = registers
+            _counters.inserts += 1
+        else:
+            _counters.updates += 1
+        registers[offset] += value
+        return registers[offset]
+
+
+def subtract_from_register(session_id: str, index: int, value: float) -> float:
+    """Subtract value from a memory register.
+
+    Args:
+        session_id: Unique session identifier
+        index: 1-based register index (M1..Mn)
+        value: Value to subtract
+
+    Returns:
+        New register value
+
+    Raises:
+        InvalidRegisterError: If index is outside 1..n
+    """
+    return add_to_register(session_id, index, -value)
+
+
+def clear_registers(session_id: str) -> None:
+    """Clear every memory register for a session.
+
     Args:
         session_id: Unique session identifier
     """
-    _memory_store[session_id] = 0.0
+    with _lock:
+        if _register_store.pop(session_id, None) is not None:
+            _counters.deletes += 1
+
+
+def _approx_store_bytes(store: dict[str, float] | dict[str, array[float]]) -> int:
+    """Estimate a store's footprint from the dict table and sampled entries."""
+    total = sys.getsizeof(store)
+    sample = list(itertools.islice(store.items(), _SIZE_SAMPLE))
+    if sample:
+        sampled = sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in sample)
+        total += sampled * len(store) // len(sample)
+    return total
+
+
+def memory_entry_counts() -> tuple[int, int]:
+    """Return the number of memory and register entries, without sampling."""
+    return len(_memory_store), len(_register_store)
+
+
+def memory_store_stats() -> MemoryStoreStats:
+    """Report store size, approximate bytes and write rates.
+
+    Byte usage is extrapolated from a fixed-size sample of entries, so the
+    cost does not grow with the number of sessions. Rates are per second
+    over the last completed window of at least ``_RATE_WINDOW_S`` seconds
+    (over the first window so far until one completes). Windows are shared
+    process-wide, so concurrent callers see the same rates and never
+    shorten each other's interval.
+
+    Returns:
+        Snapshot of the memory and register stores
+    """
+    now = time.monotonic()
+    with _lock:
+        current = _StoreCounters(
+            _counters.inserts, _counters.updates, _counters.deletes
+        )
+        approx_bytes = _approx_store_bytes(_memory_store) + _approx_store_bytes(
+            _register_store
+        )
+        memory_entries = len(_memory_store)
+        register_entries = len(_register_store)
+        elapsed = now - _rate_window.started
+        base = _rate_window.base
+        window_rates = (
+            (current.inserts - base.inserts) / max(elapsed, 1e-9),
+            (current.updates - base.updates) / max(elapsed, 1e-9),
+            (current.deletes - base.deletes) / max(elapsed, 1e-9),
+        )
+        if elapsed >= _RATE_WINDOW_S:
+            _rate_window.started = now
+            _rate_window.base = current
+            _rate_window.rates = window_rates
+        insert_rate, update_rate, delete_rate = _rate_window.rates or window_rates
+    return MemoryStoreStats(
+        memory_entries=memory_entries,
+        register_entries=register_entries,
+        approx_bytes=approx_bytes,
+        inserts=current.inserts,
+        updates=current.updates,
+        deletes=current.deletes,
+        insert_rate=insert_rate,
+        update_rate=update_rate,
+        delete_rate=delete_rate,
+    )
+
+
+def reset_store_stats() -> None:
+    """Zero the write counters and start a new rate window."""
+    global _counters
+    with _lock:
+        _counters = _StoreCounters()
+        _rate_window.started = time.monotonic()
+        _rate_window.base = _StoreCounters()
+        _rate_window.rates = None
+
+
+def iter_memory_records(chunk_size: int) -> Iterator[list[SessionRecord]]:
+    """Yield every session's memory state in chunks.
+
+    Only the session ids are snapshotted up front; values are read one chunk
+    at a time under the lock, so writers are never blocked for the whole
+    export. Sessions deleted after the snapshot are skipped.
+
+    Args:
+        chunk_size: Maximum records per yielded chunk
+
+    Yields:
+        Lists of (session_id, memory, registers) records
+    """
+    with _lock:
+        session_ids = list(_memory_store.keys() | _register_store.keys())
+    for start in range(0, len(session_ids), chunk_size):
+        chunk: list[SessionRecord] = []
+        with _lock:
+            for session_id in session_ids[start : start + chunk_size]:
+                memory = _memory_store.get(session_id)
+                registers = _register_store.get(session_id)
+                if memory is None and registers is None:
+                    continue
+                chunk.append(
+                    (
+                        session_id,
+                        memory,
+                        registers.tolist() if registers is not None else None,
+                    )
+                )
+        if chunk:
+            yield chunk
+
+
+def import_memory_records(records: Iterable[SessionRecord]) -> int:
+    """Load a batch of exported records, overwriting existing state.
+
+    The whole batch is written in one critical section. Records holding
+    neither a memory value nor registers are skipped and do not start a
+    session.
+
+    Args:
+        records: (session_id, memory, registers) records
+
+    Returns:
+        Number of records imported
+    """
+    batch = [
+        record for record in records if record[1] is not None or record[2] is not None
+    ]
+    for session_id, _, _ in batch:
+        touch(session_id)
+    size = config.settings.memory_registers
+    changes: list[tuple[str, float, int]] = []
+    with _lock:
+        for session_id, memory, registers in batch:
+            if memory is not None:
+                changes.append((session_id, memory, _put(session_id, memory)))
+            if registers is not None:
+                values = array("d", registers[:size])
+                values.extend([0.0] * (size - len(values)))
+                if session_id in _register_store:
+                    _counters.updates += 1
+                else:
+                    _counters.inserts += 1
+                _register_store[session_id] = values
+    if _change_listeners:
+        for change in changes:
+            _notify(*change)
+    return len(batch)
+
+
+def _evict_session(session_id: str) -> None:
+    """Drop all memory state for an evicted session.
+
+    The reset is announced with a fresh version, so listeners still see
+    versions increase, but no version is kept for the evicted session.
+    """
+    with _lock:
+        had_version = session_id in _versions
+        _drop(session_id)
+        if _register_store.pop(session_id, None) is not None:
+            _counters.deletes += 1
+        version = _next_version() if had_version else 0
+    if version and _change_listeners:
+        _notify(session_id, 0.0, version)
+
+
+register_eviction_hook(_evict_session)
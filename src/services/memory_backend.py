@@ -0,0 +1,369 @@
+"""Storage backends for session memory."""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable, Sequence
+from typing import Protocol, TypeVar
+
+from src import config
+from src.services.memory import (
+    BatchOperation,
+    ChangeListener,
+    SessionRecord,
+    add_to_memory,
+    add_to_register,
+    apply_memory_batch,
+    clear_memory,
+    clear_registers,
+    get_memory,
+    get_memory_version,
+    get_register,
+    get_registers,
+    import_memory_records,
+    iter_memory_records,
+    recall_memory,
+    register_change_listener,
+)
+
+LayerT = TypeVar("LayerT")
+
+# Batches with more operations (or import records) than this are applied on
+# a worker thread, so a large batch never stalls the event loop.
+_INLINE_BATCH_SIZE = 64
+
+
+class MemoryBackend(Protocol):
+    """Storage interface for per-session memory values.
+
+    Remote or durable stores implement these coroutines; callers layer
+    coalescing and caching on top without knowing where values live.
+    """
+
+    async def get(self, session_id: str) -> float:
+        """Return the memory value for a session (0.0 if unset)."""
+        ...
+
+    async def increment(self, session_id: str, delta: float) -> float:
+        """Add delta to a session's memory and return the new value."""
+        ...
+
+    async def clear(self, session_id: str) -> float:
+        """Reset a session's memory and return the value it held.
+
+        Reading and resetting happen in one step, so no write can land
+        between them.
+        """
+        ...
+
+    async def version(self, session_id: str) -> int:
+        """Return a counter that changes whenever the session's memory does.
+
+        Sessions without a stored value report 0.
+        """
+        ...
+
+    async def recall(self, session_id: str) -> tuple[float, int]:
+        """Return a session's (value, version) from a single read.
+
+        Conditional reads use this, so the value is never newer or older
+        than the version in its ETag, and caches count one lookup.
+        """
+        ...
+
+    async def apply_batch(
+        self, operations: Sequence[BatchOperation]
+    ) -> dict[str, float]:
+        """Apply (session_id, op, value) operations, atomically per session.
+
+        Returns:
+            Final memory value for each session in the batch
+        """
+        ...
+
+    async def get_register(self, session_id: str | None, index: int) -> float:
+        """Return one 1-based register (0.0 for anonymous callers).
+
+        Raises:
+            InvalidRegisterError: If index is outside 1..n
+        """
+        ...
+
+    async def get_registers(self, session_id: str | None) -> list[float]:
+        """Return registers M1..Mn (all 0.0 for anonymous callers)."""
+        ...
+
+    async def increment_register(
+        self, session_id: str, index: int, delta: float
+    ) -> float:
+        """Add delta to a 1-based register and return its new value.
+
+        Raises:
+            InvalidRegisterError: If index is outside 1..n
+        """
+        ...
+
+    async def clear_registers(self, session_id: str) -> None:
+        """Reset every register of a session."""
+        ...
+
+    def export_records(self, chunk_size: int) -> AsyncIterator[list[SessionRecord]]:
+        """Yield every session's (session_id, memory, registers) in chunks.
+
+        Implementations must not hold the whole store, or a lock over it,
+        for the duration of the export.
+        """
+        ...
+
+    async def import_records(self, records: Sequence[SessionRecord]) -> int:
+        """Overwrite sessions with exported records and return how many applied.
+
+        Records without a memory value or registers are skipped.
+        """
+        ...
+
+    def subscribe(self, listener: ChangeListener) -> Callable[[], None]:
+        """Call listener with (session_id, value, version) after every change.
+
+        Changes made by other workers are included, e.g. through the
+        store's pub/sub channel. The listener may run on any thread.
+
+        Returns:
+            Callable that stops the notifications
+        """
+        ...
+
+
+class LocalMemoryBackend:
+    """Backend over the in-process memory store.
+
+    Operations complete without I/O, so the coroutines never suspend,
+    except for large batches, which run on a worker thread.
+    """
+
+    async def get(self, session_id: str) -> float:
+        """Return the memory value for a session (0.0 if unset)."""
+        return get_memory(session_id)
+
+    async def increment(self, session_id: str, delta: float) -> float:
+        """Add delta to a session's memory and return the new value."""
+        return add_to_memory(session_id, delta)
+
+    async def clear(self, session_id: str) -> float:
+        """Reset a session's memory and return the value it held."""
+        return clear_memory(session_id)
+
+    async def version(self, session_id: str) -> int:
+        """Return the version of a session's memory value."""
+        return get_memory_version(session_id)
+
+    async def recall(self, session_id: str) -> tuple[float, int]:
+        """Return a session's (value, version), read under one lock."""
+        return recall_memory(session_id)
+
+    async def apply_batch(
+        self, operations: Sequence[BatchOperation]
+    ) -> dict[str, float]:
+        """Apply operations, off the event loop when the batch is large."""
+        if len(operations) > _INLINE_BATCH_SIZE:
+            return await asyncio.to_thread(apply_memory_batch, operations)
+        return apply_memory_batch(operations)
+
+    async def get_register(self, session_id: str | None, index: int) -> float:
+        """Return one 1-based register (0.0 for anonymous callers)."""
+        return get_register(session_id, index)
+
+    async def get_registers(self, session_id: str | None) -> list[float]:
+        """Return registers M1..Mn (all 0.0 for anonymous callers)."""
+        return get_registers(session_id)
+
+    async def increment_register(
+        self, session_id: str, index: int, delta: float
+    ) -> float:
+        """Add delta to a 1-based register and return its new value."""
+        return add_to_register(session_id, index, delta)
+
+    async def clear_registers(self, session_id: str) -> None:
+        """Reset every register of a session."""
+        clear_registers(session_id)
+
+    async def export_records(
+        self, chunk_size: int
+    ) -> AsyncIterator[list[SessionRecord]]:
+        """Yield the store chunk by chunk, each read under a short lock."""
+        for chunk in iter_memory_records(chunk_size):
+            yield chunk
+
+    async def import_records(self, records: Sequence[SessionRecord]) -> int:
+        """Import records, off the event loop when the batch is large."""
+        if len(records) > _INLINE_BATCH_SIZE:
+            return await asyncio.to_thread(import_memory_records, records)
+        return import_memory_records(records)
+
+    def subscribe(self, listener: ChangeListener) -> Callable[[], None]:
+        """Call listener after every change to the in-process store."""
+        return register_change_listener(listener)
+
+
+class ForwardingBackend:
+    """Base for layers that wrap another backend.
+
+    Every operation is passed to ``backend`` unchanged; layers override
+    the operations they add behaviour to.
+    """
+
+    def __init__(self, backend: MemoryBackend) -> None:
+        self.backend = backend
+
+    async def get(self, session_id: str) -> float:
+        """Return the memory value for a session (0.0 if unset)."""
+        return await self.backend.get(session_id)
+
+    async def increment(self, session_id: str, delta: float) -> float:
+        """Add delta to a session's memory and return the new value."""
+        return await self.backend.increment(session_id, delta)
+
+    async def clear(self, session_id: str) -> float:
+        """Reset a session's memory and return the value it held."""
+        return await self.backend.clear(session_id)
+
+    async def version(self, session_id: str) -> int:
+        """Return the version of a session's memory value."""
+        return await self.backend.version(session_id)
+
+    async def recall(self, session_id: str) -> tuple[float, int]:
+        """Return a session's (value, version) from a single read."""
+        return await self.backend.recall(session_id)
+
+    async def apply_batch(
+        self, operations: Sequence[BatchOperation]
+    ) -> dict[str, float]:
+        """Apply (session_id, op, value) operations, atomically per session."""
+        return await self.backend.apply_batch(operations)
+
+    async def get_register(self, session_id: str | None, index: int) -> float:
+        """Return one 1-based register (0.0 for anonymous callers)."""
+        return await self.backend.get_register(session_id, index)
+
+    async def get_registers(self, session_id: str | None) -> list[float]:
+        """Return registers M1..Mn (all 0.0 for anonymous callers)."""
+        return await self.backend.get_registers(session_id)
+
+    async def increment_register(
+        self, session_id: str, index: int, delta: float
+    ) -> float:
+        """Add delta to a 1-based register and return its new value."""
+        return await self.backend.increment_register(session_id, index, delta)
+
+    async def clear_registers(self, session_id: str) -> None:
+        """Reset every register of a session."""
+        await self.backend.clear_registers(session_id)
+
+    def export_records(self, chunk_size: int) -> AsyncIterator[list[SessionRecord]]:
+        """Yield every session's (session_id, memory, registers) in chunks."""
+        return self.backend.export_records(chunk_size)
+
+    async def import_records(self, records: Sequence[SessionRecord]) -> int:
+        """Overwrite sessions with exported records and return how many applied."""
+        return await self.backend.import_records(records)
+
+    def subscribe(self, listener: ChangeListener) -> Callable[[], None]:
+        """Call listener after every change to the wrapped backend."""
+        return self.backend.subscribe(listener)
+
+    def reset_stats(self) -> None:
+        """Zero the layer's counters; layers without any have nothing to do."""
+
+
+def layered_backend(backend: MemoryBackend) -> MemoryBackend:
+    """Wrap a store in the layers enabled by settings.
+
+    Layer modules are imported only when enabled.
+
+    Args:
+        backend: Backend that holds the values
+
+    Returns:
+        The backend, behind a ``RecallNearCache`` if ``memory_near_cache``
+        is set and a ``WriteCoalescer`` if ``memory_coalesce_writes`` is
+    """
+    settings = config.settings
+    if settings.memory_near_cache:
+        from src.services.near_cache import RecallNearCache
+
+        backend = RecallNearCache(backend)
+    if settings.memory_coalesce_writes:
+        from src.services.coalescer import WriteCoalescer
+
+        backend = WriteCoalescer(backend)
+    return backend
+
+
+def backend_layers(backend: MemoryBackend) -> list[MemoryBackend]:
+    """Return a backend chain from the outermost layer to the store."""
+    layers = [backend]
+    while isinstance(backend, ForwardingBackend):
+        backend = backend.backend
+        layers.append(backend)
+    return layers
+
+
+def find_layer(backend: MemoryBackend, layer: type[LayerT]) -> LayerT | None:
+    """Return the first layer of a given type in a backend chain.
+
+    Args:
+        backend: Outermost backend
+        layer: Layer class to look for
+
+    Returns:
+        The layer, or None if the chain does not contain one
+    """
+    for candidate in backend_layers(backend):
+        if isinstance(candidate, layer):
+            return candidate
+    return None
+
+
+_backend_listeners: list[ChangeListener] = []
+
+
+def _dispatch(session_id: str, value: float, version: int) -> None:
+    """Forward a change reported by the active backend to every listener."""
+    for listener in _backend_listeners:
+        listener(session_id, value, version)
+
+
+_backend: MemoryBackend = LocalMemoryBackend()
+_unsubscribe = _backend.subscribe(_dispatch)
+
+
+def get_backend() -> MemoryBackend:
+    """Return the backend used by the memory routes."""
+    return _backend
+
+
+def set_backend(backend: MemoryBackend) -> None:
+    """Replace the backend used by the memory routes.
+
+    Listeners registered with ``register_backend_listener`` move to the
+    new backend's change feed.
+
+    Args:
+        backend: Backend instance, e.g. a remote store wrapped by
+            ``layered_backend``
+    """
+    global _backend, _unsubscribe
+    _unsubscribe()
+    _backend = backend
+    _unsubscribe = backend.subscribe(_dispatch)
+
+
+def register_backend_listener(listener: ChangeListener) -> None:
+    """Call listener for every change reported by the active backend.
+
+    The listener follows ``set_backend``, so it sees changes from whichever
+    backend serves the memory routes, including other workers' writes to a
+    shared store.
+
+    Args:
+        listener: Callable receiving (session_id, value, version)
+    """
+    _backend_listeners.append(listener)
@@ -0,0 +1,165 @@
+"""Fan-out of memory changes to per-session event subscribers."""
+
+import asyncio
+import threading
+from collections import deque
+from dataclasses import dataclass
+
+from src import config
+from src.services.memory_backend import register_backend_listener
+
+# (version, value) as delivered to subscribers.
+MemoryEvent = tuple[int, float]
+
+
+class Subscription:
+    """One subscriber's bounded event queue.
+
+    The queue keeps the newest ``max_queue`` events; when a slow consumer
+    falls behind, the oldest undelivered events are dropped, which is safe
+    because every event carries the full current value.
+
+    Versions increase with every change, so events are delivered in version
+    order: an event no newer than ``last_version`` (one that lost a race
+    with a later change, or predates the value the consumer already has)
+    is discarded.
+    """
+
+    def __init__(
+        self, session_id: str, loop: asyncio.AbstractEventLoop, max_queue: int
+    ) -> None:
+        self.session_id = session_id
+        self.loop = loop
+        self.dropped = 0
+        self.last_version = 0
+        self._events: deque[MemoryEvent] = deque(maxlen=max_queue)
+        self._ready = asyncio.Event()
+
+    def push(self, event: MemoryEvent) -> None:
+        """Queue an event, dropping the oldest if full. Loop thread only."""
+        if len(self._events) == self._events.maxlen:
+            self.dropped += 1
+        self._events.append(event)
+        self._ready.set()
+
+    async def next_events(self, timeout: float) -> list[MemoryEvent]:
+        """Wait up to ``timeout`` seconds and drain queued events.
+
+        Returns:
+            Queued events newer than ``last_version``, in version order;
+            empty if the wait timed out or only stale events arrived
+        """
+        if not self._events:
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except TimeoutError:
+                return []
+        self._ready.clear()
+        events = []
+        for event in self._events:
+            if event[0] > self.last_version:
+                events.append(event)
+                self.last_version = event[0]
+        self._events.clear()
+        return events
+
+
+@dataclass(frozen=True)
+class MemoryEventStats:
+    """Point-in-time broker figures."""
+
+    sessions: int
+    subscribers: int
+    published: int
+    dropped: int
+
+
+class MemoryEventBroker:
+    """Broadcast memory changes to the subscribers of each session.
+
+    A change is scheduled once per event loop with subscribers for the
+    session, never once per subscriber: changes made on the loop's own
+    thread are delivered inline, changes from worker threads through a
+    single ``call_soon_threadsafe``. Sessions without subscribers cost one
+    dict lookup.
+    """
+
+    def __init__(self) -> None:
+        self._subscribers: dict[str, set[Subscription]] = {}
+        self._lock = threading.Lock()
+        self._published = 0
+        self._dropped_closed = 0
+
+    def subscribe(self, session_id: str, max_queue: int | None = None) -> Subscription:
+        """Start receiving a session's changes on the running event loop.
+
+        Args:
+            session_id: Session to follow
+            max_queue: Queue bound, defaulting to ``memory_events_queue_size``
+
+        Returns:
+            Subscription to read events from; pass it to ``unsubscribe``
+        """
+        subscription = Subscription(
+            session_id,
+            asyncio.get_running_loop(),
+            max_queue or config.settings.memory_events_queue_size,
+        )
+        with self._lock:
+            self._subscribers.setdefault(session_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Stop delivering events to a subscription."""
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.session_id)
+            if subscribers is None or subscription not in subscribers:
+                return
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.session_id]
+            self._dropped_closed += subscription.dropped
+
+    def publish(self, session_id: str, value: float, version: int) -> None:
+        """Broadcast a change to the session's subscribers, from any thread."""
+        subscribers = self._subscribers.get(session_id)
+        if not subscribers:
+            return
+        with self._lock:
+            loops = {subscription.loop for subscription in subscribers}
+            self._published += 1
+        event = (version, value)
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        for loop in loops:
+            if loop is running:
+                self._deliver(loop, session_id, event)
+            elif not loop.is_closed():
+                loop.call_soon_threadsafe(self._deliver, loop, session_id, event)
+
+    def _deliver(
+        self, loop: asyncio.AbstractEventLoop, session_id: str, event: MemoryEvent
+    ) -> None:
+        """Push an event to every subscriber of a session on one loop."""
+        with self._lock:
+            subscribers = list(self._subscribers.get(session_id, ()))
+        for subscription in subscribers:
+            if subscription.loop is loop:
+                subscription.push(event)
+
+    def stats(self) -> MemoryEventStats:
+        """Return subscriber and delivery counts."""
+        with self._lock:
+            live = [s for subs in self._subscribers.values() for s in subs]
+            return MemoryEventStats(
+                sessions=len(self._subscribers),
+                subscribers=len(live),
+                published=self._published,
+                dropped=self._dropped_closed + sum(s.dropped for s in live),
+            )
+
+
+broker = MemoryEventBroker()
+register_backend_listener(broker.publish)
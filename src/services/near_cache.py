@@ -0,0 +1,169 @@
+"""Per-worker read-through near-cache for memory recall."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+from src import config
+from src.services.memory import BatchOperation, SessionRecord
+from src.services.memory_backend import ForwardingBackend, MemoryBackend
+
+
+@dataclass
+class NearCacheStats:
+    """Hit ratio and staleness counters for a near-cache."""
+
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    invalidations: int = 0
+    evictions: int = 0
+    served_age_total: float = 0.0
+    served_age_max: float = 0.0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of recalls answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def mean_served_age(self) -> float:
+        """Average age in seconds of values served from the cache."""
+        return self.served_age_total / self.hits if self.hits else 0.0
+
+
+class RecallNearCache(ForwardingBackend):
+    """Bounded, TTL-limited recall cache in front of a memory backend.
+
+    Each entry holds a value together with its version, filled from one
+    backend ``recall``. ``get``, ``version`` and ``recall`` are answered
+    from the same entry, so a conditional read never pairs a cached value
+    with a newer version's ETag; ``recall`` answers both in one lookup,
+    so a recall counts once in the hit ratio.
+
+    Writes made through the cache go to the backend and drop the local
+    entry immediately. Writes made elsewhere, e.g. by other workers,
+    arrive through the backend's change feed, which the cache subscribes
+    to. Every invalidation bumps a generation stamp; a fill that raced
+    with one is not stored, so a value read before a remote write can
+    never outlive the notification.
+    """
+
+    def __init__(
+        self,
+        backend: MemoryBackend,
+        max_size: int | None = None,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(backend)
+        self._max_size = (
+            max_size if max_size is not None else config.settings.near_cache_size
+        )
+        self._ttl = ttl if ttl is not None else config.settings.near_cache_ttl_ms / 1000
+        self._clock = clock
+        # Session id -> (value, version, stored at).
+        self._entries: OrderedDict[str, tuple[float, int, float]] = OrderedDict()
+        self._generation = 0
+        # Change notifications may arrive on any thread.
+        self._lock = threading.Lock()
+        self.stats = NearCacheStats()
+        self._unsubscribe = backend.subscribe(self._on_change)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, session_id: str) -> float:
+        """Recall a session's memory, serving from the cache when fresh."""
+        return (await self._lookup(session_id))[0]
+
+    async def version(self, session_id: str) -> int:
+        """Return the version of the value ``get`` would serve."""
+        return (await self._lookup(session_id))[1]
+
+    async def recall(self, session_id: str) -> tuple[float, int]:
+        """Return (value, version) from one cache lookup."""
+        return await self._lookup(session_id)
+
+    async def increment(self, session_id: str, delta: float) -> float:
+        """Write through to the backend and drop the cached value."""
+        value = await self.backend.increment(session_id, delta)
+        self.invalidate(session_id)
+        return value
+
+    async def clear(self, session_id: str) -> float:
+        """Clear through to the backend and drop the cached value."""
+        previous = await self.backend.clear(session_id)
+        self.invalidate(session_id)
+        return previous
+
+    async def apply_batch(
+        self, operations: Sequence[BatchOperation]
+    ) -> dict[str, float]:
+        """Write the batch through and drop every affected cached value."""
+        values = await self.backend.apply_batch(operations)
+        for session_id in values:
+            self.invalidate(session_id)
+        return values
+
+    async def import_records(self, records: Sequence[SessionRecord]) -> int:
+        """Import through to the backend and drop every affected cached value."""
+        imported = await self.backend.import_records(records)
+        for session_id, _, _ in records:
+            self.invalidate(session_id)
+        return imported
+
+    def invalidate(self, session_id: str) -> None:
+        """Drop a session's cached value after a local or remote write."""
+        with self._lock:
+            self._generation += 1
+            if self._entries.pop(session_id, None) is not None:
+                self.stats.invalidations += 1
+
+    def reset_stats(self) -> None:
+        """Zero the hit, miss and staleness counters."""
+        with self._lock:
+            self.stats = NearCacheStats()
+
+    def close(self) -> None:
+        """Stop following the backend's change feed."""
+        self._unsubscribe()
+
+    def _on_change(self, session_id: str, value: float, version: int) -> None:
+        self.invalidate(session_id)
+
+    async def _lookup(self, session_id: str) -> tuple[float, int]:
+        """Return a session's (value, version), filling the cache on a miss."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is not None:
+                value, version, stored_at = entry
+                age = now - stored_at
+                if age < self._ttl:
+                    self._entries.move_to_end(session_id)
+                    self.stats.hits += 1
+                    self.stats.served_age_total += age
+                    self.stats.served_age_max = max(self.stats.served_age_max, age)
+                    return value, version
+                del self._entries[session_id]
+                self.stats.expired += 1
+            self.stats.misses += 1
+            generation = self._generation
+
+        value, version = await self.backend.recall(session_id)
+        with self._lock:
+            if generation == self._generation:
+                self._store(session_id, value, version, self._clock())
+        return value, version
+
+    def _store(self, session_id: str, value: float, version: int, now: float) -> None:
+        """Cache an entry, evicting the least recently used. Caller holds _lock."""
+        self._entries[session_id] = (value, version, now)
+        self._entries.move_to_end(session_id)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
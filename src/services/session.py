@@ -0,0 +1,182 @@
+"""Session lifecycle: issuing ids, tracking activity and evicting idle state."""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from src import config
+
+# Session id -> monotonic time of the last write, least recently used first.
+_sessions: OrderedDict[str, float] = OrderedDict()
+# Session id -> minute the session was created, and live sessions per minute.
+# Age distribution walks the per-minute counts, never the sessions.
+_created_minute: dict[str, int] = {}
+_created_per_minute: dict[int, int] = {}
+_eviction_hooks: list[Callable[[str], None]] = []
+_lock = threading.Lock()
+
+# Age buckets reported by session_stats, as (label, upper bound in minutes).
+_AGE_BUCKETS: tuple[tuple[str, float], ...] = (
+    ("lt_1m", 1),
+    ("lt_5m", 5),
+    ("lt_15m", 15),
+    ("lt_1h", 60),
+    ("lt_6h", 360),
+    ("gte_6h", float("inf")),
+)
+
+
+@dataclass
+class _EvictionCounters:
+    """Cumulative counts of sessions dropped, by reason."""
+
+    capacity: int = 0
+    idle: int = 0
+    ended: int = 0
+
+
+@dataclass(frozen=True)
+class SessionStats:
+    """Point-in-time view of live sessions."""
+
+    active_sessions: int
+    evicted_capacity: int
+    evicted_idle: int
+    ended: int
+    age_distribution: dict[str, int]
+
+
+_evictions = _EvictionCounters()
+
+# Upper bound on idle sessions swept by a single touch, so one request never
+# pays for a large backlog of expirations.
+_MAX_SWEEP = 64
+
+
+def issue_session_id() -> str:
+    """Mint a new session identifier for an anonymous client."""
+    return str(uuid.uuid4())
+
+
+def register_eviction_hook(hook: Callable[[str], None]) -> None:
+    """Register a callback that drops a session's state when it is evicted.
+
+    Every store keyed by session id registers one hook, so all per-session
+    state shares the same eviction policy.
+
+    Args:
+        hook: Callable receiving the evicted session id
+    """
+    _eviction_hooks.append(hook)
+
+
+def touch(session_id: str) -> None:
+    """Record a write for a session and evict sessions over the limits.
+
+    Sessions beyond ``session_max`` are evicted least recently written
+    first; sessions idle for longer than ``session_idle_ttl_s`` are swept
+    from the cold end of the LRU.
+
+    Args:
+        session_id: Unique session identifier
+    """
+    settings = config.settings
+    now = time.monotonic()
+    evicted: list[str] = []
+    with _lock:
+        if session_id in _sessions:
+            _sessions.move_to_end(session_id)
+        else:
+            minute = int(now // 60)
+            _created_minute[session_id] = minute
+            _created_per_minute[minute] = _created_per_minute.get(minute, 0) + 1
+        _sessions[session_id] = now
+        while len(_sessions) > settings.session_max:
+            oldest = _sessions.popitem(last=False)[0]
+            _forget(oldest)
+            _evictions.capacity += 1
+            evicted.append(oldest)
+        ttl = settings.session_idle_ttl_s
+        if ttl > 0:
+            while _sessions and len(evicted) < _MAX_SWEEP:
+                oldest, last_write = next(iter(_sessions.items()))
+                if now - last_write < ttl:
+                    break
+                del _sessions[oldest]
+                _forget(oldest)
+                _evictions.idle += 1
+                evicted.append(oldest)
+    for evicted_id in evicted:
+        _run_eviction_hooks(evicted_id)
+
+
+def end_session(session_id: str) -> None:
+    """Forget a session and drop all of its state.
+
+    Args:
+        session_id: Unique session identifier
+    """
+    with _lock:
+        if _sessions.pop(session_id, None) is not None:
+            _forget(session_id)
+            _evictions.ended += 1
+    _run_eviction_hooks(session_id)
+
+
+def active_session_count() -> int:
+    """Return the number of sessions currently holding state."""
+    return len(_sessions)
+
+
+def session_stats() -> SessionStats:
+    """Report live sessions, eviction counts and the session age distribution.
+
+    Ages are bucketed by creation minute, so the cost depends on how many
+    distinct minutes live sessions were created in, not on session count.
+
+    Returns:
+        Snapshot of session lifecycle state
+    """
+    now_minute = int(time.monotonic() // 60)
+    distribution = dict.fromkeys((label for label, _ in _AGE_BUCKETS), 0)
+    with _lock:
+        per_minute = list(_created_per_minute.items())
+        active = len(_sessions)
+    for minute, count in per_minute:
+        age = now_minute - minute
+        for label, upper in _AGE_BUCKETS:
+            if age < upper:
+                distribution[label] += count
+                break
+    return SessionStats(
+        active_sessions=active,
+        evicted_capacity=_evictions.capacity,
+        evicted_idle=_evictions.idle,
+        ended=_evictions.ended,
+        age_distribution=distribution,
+    )
+
+
+def reset_session_stats() -> None:
+    """Zero the eviction counters; live sessions are kept."""
+    global _evictions
+    with _lock:
+        _evictions = _EvictionCounters()
+
+
+def _forget(session_id: str) -> None:
+    """Drop a session's creation bookkeeping. Caller holds _lock."""
+    minute = _created_minute.pop(session_id)
+    remaining = _created_per_minute[minute] - 1
+    if remaining:
+        _created_per_minute[minute] = remaining
+    else:
+        del _created_per_minute[minute]
+
+
+def _run_eviction_hooks(session_id: str) -> None:
+    for hook in _eviction_hooks:
+        hook(session_id)
@@ -0,0 +1,61 @@
+"""Cold-start instrumentation and lazy loading of optional subsystems."""
+
+import functools
+import importlib
+import time
+from types import ModuleType
+
+import src
+
+_phases: dict[str, float] = {}
+_last_mark = src.IMPORT_STARTED
+
+
+def mark(phase: str) -> None:
+    """Record the time since the previous mark as a named startup phase.
+
+    The first mark is measured from the moment the ``src`` package began
+    importing.
+
+    Args:
+        phase: Phase name, e.g. "imports" or "routers"
+    """
+    global _last_mark
+    now = time.perf_counter()
+    _phases[phase] = now - _last_mark
+    _last_mark = now
+
+
+def record(phase: str, seconds: float) -> None:
+    """Record a startup phase that was timed elsewhere.
+
+    Args:
+        phase: Phase name
+        seconds: Phase duration
+    """
+    _phases[phase] = seconds
+
+
+def startup_report() -> dict[str, float]:
+    """Return startup phase durations in milliseconds, in recording order."""
+    return {phase: seconds * 1000 for phase, seconds in _phases.items()}
+
+
+@functools.cache
+def optional_module(name: str) -> ModuleType | None:
+    """Import an optional dependency on first use.
+
+    Heavy or optional subsystems (compression codecs, metrics exporters)
+    go through here instead of a module-level import, so they cost nothing
+    at startup and nothing at all when unused.
+
+    Args:
+        name: Fully qualified module name
+
+    Returns:
+        The module, or None if it is not installed
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
@@ -0,0 +1,141 @@
+"""Startup warmup that drives the public API routes once before the worker is ready."""
+
+import json
+import logging
+import time
+from typing import Any
+
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Message
+
+from src import latency, metrics
+from src.admission import controller
+from src.openapi import build_openapi_document
+from src.ratelimit import limiter
+from src.services.memory import reset_store_stats
+from src.services.memory_backend import (
+    ForwardingBackend,
+    backend_layers,
+    get_backend,
+)
+from src.services.session import end_session, reset_session_stats
+
+logger = logging.getLogger(__name__)
+
+WARMUP_SESSION = "__warmup__"
+
+# (method, path, JSON body) exercising validation, serialization and error
+# handling for each calculator, memory and history route. Errors are expected
+# for the failure cases. Not covered: GET /memory/events, whose stream never
+# ends on its own; the /admin routes, which need the operator's admin token;
+# and /ready, /metrics and the docs pages, which are not on the request path.
+_WARMUP_REQUESTS: tuple[tuple[str, str, Any], ...] = (
+    ("POST", "/calculate", {"operand1": 1.0, "operand2": 2.0, "operator": "+"}),
+    ("POST", "/calculate", {"operand1": 1.0, "operand2": 0.0, "operator": "/"}),
+    ("POST", "/calculate", {"operand1": 1.0}),
+    ("GET", "/calculate?operand1=1.0&operand2=2.0&operator=%2B", None),
+    ("POST", "/memory/add", {"value": 1.0}),
+    ("POST", "/memory/subtract", {"value": 1.0}),
+    ("POST", "/memory/batch", {"operations": [{"op": "add", "value": 1.0}]}),
+    ("GET", "/memory", None),
+    ("DELETE", "/memory", None),
+    ("POST", "/memory/undo", None),
+    ("POST", "/memory/redo", None),
+    ("POST", "/memory/registers/1/add", {"value": 1.0}),
+    ("POST", "/memory/registers/1/subtract", {"value": 1.0}),
+    ("GET", "/memory/registers/1", None),
+    ("GET", "/memory/registers", None),
+    ("DELETE", "/memory/registers", None),
+    ("GET", "/history", None),
+    ("DELETE", "/history", None),
+    ("GET", "/health", None),
+)
+
+
+async def _request(app: ASGIApp, method: str, path: str, body: Any) -> int:
+    """Send one in-process HTTP request through the ASGI app."""
+    payload = b"" if body is None else json.dumps(body).encode()
+    path, _, query = path.partition("?")
+    headers = [
+        (b"x-session-id", WARMUP_SESSION.encode()),
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(payload)).encode()),
+    ]
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": headers,
+        "client": ("127.0.0.1", 0),
+        "server": ("127.0.0.1", 80),
+    }
+    sent = False
+    status = 0
+
+    async def receive() -> Message:
+        nonlocal sent
+        if sent:
+            return {"type": "http.disconnect"}
+        sent = True
+        return {"type": "http.request", "body": payload, "more_body": False}
+
+    async def send(message: Message) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+def _reset_stats() -> None:
+    """Forget the counters and client state left behind by warmup traffic.
+
+    Runs before the lifespan completes, so no real request has been counted
+    yet; what remains afterwards describes real traffic only.
+    """
+    reset_store_stats()
+    reset_session_stats()
+    latency.recorder.reset()
+    metrics.reset()
+    limiter.clear()
+    controller.reset()
+    for layer in backend_layers(get_backend()):
+        if isinstance(layer, ForwardingBackend):
+            layer.reset_stats()
+
+
+async def warm_up(app: FastAPI) -> float:
+    """Exercise the API routes in-process so first real requests hit warm paths.
+
+    Builds and encodes the OpenAPI document, then exercises validators,
+    the dependency graph and response serializers for each route listed in
+    ``_WARMUP_REQUESTS``. Finally
+    it drops the warmup session's state and resets the stats that warmup
+    traffic touched.
+
+    Args:
+        app: ASGI application to warm
+
+    Returns:
+        Warmup duration in seconds
+    """
+    start = time.perf_counter()
+    build_openapi_document(app)
+    try:
+        for method, path, body in _WARMUP_REQUESTS:
+            status = await _request(app, method, path, body)
+            if status >= 500:
+                logger.warning("Warmup %s %s returned %d", method, path, status)
+    finally:
+        end_session(WARMUP_SESSION)
+        _reset_stats()
+    elapsed = time.perf_counter() - start
+    logger.info("Warmup completed in %.1fms", elapsed * 1000)
+    return elapsed
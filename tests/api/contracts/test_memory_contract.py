@@ -45,3 +45,19 @@ class TestMemoryContract:
         assert "value" in data
         assert data["value"] == 0.0
         assert "message" in data
+
+    def test_memory_batch_response_schema(
+        self, client: TestClient, session_headers: dict[str, str]
+    ) -> None:
+        """POST /memory/batch response matches MemoryBatchResponse schema."""
+        response = client.post(
+            "/memory/batch",
+            json={"operations": [{"op": "add", "value": 1.0}]},
+            headers=session_headers,
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert isinstance(data["values"], dict)
+        assert all(isinstance(v, (int, float)) for v in data["values"].values())
+        assert "message" in data
+        assert isinstance(data["message"], str)
@@ -2,6 +2,7 @@
 
 import uuid
 from collections.abc import Generator
+from dataclasses import replace
 from typing import Any
 
 import pytest
@@ -33,3 +34,18 @@ def client(app: Any) -> Generator[TestClient, None, None]:
     """Test client for the FastAPI application."""
     with TestClient(app) as c:
         yield c
+
+
+ADMIN_TOKEN = "test-admin-token"
+
+
+@pytest.fixture
+def admin_client(app: Any, monkeypatch: pytest.MonkeyPatch) -> Generator[TestClient]:
+    """Test client sending a valid admin token."""
+    from src import config
+
+    monkeypatch.setattr(
+        config, "settings", replace(config.settings, admin_token=ADMIN_TOKEN)
+    )
+    with TestClient(app, headers={"X-Admin-Token": ADMIN_TOKEN}) as c:
+        yield c
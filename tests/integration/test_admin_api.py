@@ -0,0 +1,205 @@
+"""Integration tests for admin API endpoints."""
+
+from dataclasses import replace
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+class TestAdminAPI:
+    """Tests for operational introspection endpoints."""
+
+    def test_memory_stats_reports_store(
+        self, admin_client: TestClient, session_headers: dict[str, str]
+    ) -> None:
+        """GET /admin/memory/stats reflects writes to the store."""
+        before = admin_client.get("/admin/memory/stats").json()
+        admin_client.post("/memory/add", json={"value": 1.0}, headers=session_headers)
+        admin_client.post("/memory/add", json={"value": 1.0}, headers=session_headers)
+        admin_client.delete("/memory", headers=session_headers)
+        response = admin_client.get("/admin/memory/stats")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["inserts"] == before["inserts"] + 1
+        assert data["updates"] == before["updates"] + 1
+        assert data["deletes"] == before["deletes"] + 1
+        assert data["active_sessions"] >= 1
+        assert data["approx_bytes"] > 0
+        assert sum(data["session_age_distribution"].values()) == data["active_sessions"]
+
+    def test_memory_export_import_round_trip(
+        self, admin_client: TestClient, session_headers: dict[str, str]
+    ) -> None:
+        """Exported NDJSON can be imported back after the session is cleared."""
+        import json
+
+        session_id = session_headers["X-Session-ID"]
+        admin_client.post("/memory/add", json={"value": 12.5}, headers=session_headers)
+        admin_client.post(
+            "/memory/registers/2/add", json={"value": 3.0}, headers=session_headers
+        )
+
+        export = admin_client.get("/admin/memory/export")
+        assert export.status_code == 200
+        assert export.headers["content-type"] == "application/x-ndjson"
+        lines = [line for line in export.text.splitlines() if session_id in line]
+        assert len(lines) == 1
+        record = json.loads(lines[0])
+        assert record["memory"] == 12.5
+        assert record["registers"][1] == 3.0
+
+        admin_client.delete("/memory", headers=session_headers)
+        admin_client.delete("/memory/registers", headers=session_headers)
+        response = admin_client.post("/admin/memory/import", content=lines[0] + "\n")
+        assert response.status_code == 200
+        assert response.json()["imported"] == 1
+        assert (
+            admin_client.get("/memory", headers=session_headers).json()["value"] == 12.5
+        )
+        registers = admin_client.get(
+            "/memory/registers", headers=session_headers
+        ).json()
+        assert registers["values"][1] == 3.0
+
+    def test_memory_import_rejects_malformed_line(
+        self, admin_client: TestClient
+    ) -> None:
+        """A malformed NDJSON line returns 400 with its line number."""
+        body = '{"session_id": "import-ok", "memory": 1.0}\nnot json\n'
+        response = admin_client.post("/admin/memory/import", content=body)
+        assert response.status_code == 400
+        data = response.json()
+        assert data["code"] == "INVALID_IMPORT_RECORD"
+        assert "line 2" in data["error"]
+
+    def test_admission_stats_reports_route_classes(
+        self, admin_client: TestClient
+    ) -> None:
+        """Admission stats count admitted requests per route class."""
+        admin_client.post("/calculate", json={"a": 1, "b": 2, "operator": "+"})
+        response = admin_client.get("/admin/admission")
+        assert response.status_code == 200
+        calculate = response.json()["calculate"]
+        assert calculate["admitted"] >= 1
+        assert calculate["limit"] >= 1
+
+    def test_rate_limit_returns_429_with_retry_after(
+        self,
+        admin_client: TestClient,
+        session_headers: dict[str, str],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A client over its route budget gets 429; others are unaffected."""
+        from src import config, ratelimit
+
+        monkeypatch.setattr(
+            config,
+            "settings",
+            replace(
+                config.settings,
+                rate_limit_rate=0.0,
+                rate_limit_routes="memory/add=0.5:1",
+            ),
+        )
+        monkeypatch.setattr(ratelimit.limiter, "_rules", None)
+        monkeypatch.setattr(ratelimit.limiter, "_by_path", {})
+        body = {"value": 1.0}
+        first = admin_client.post("/memory/add", json=body, headers=session_headers)
+        assert first.status_code == 200
+        second = admin_client.post("/memory/add", json=body, headers=session_headers)
+        assert second.status_code == 429
+        assert second.json()["code"] == "RATE_LIMITED"
+        assert second.headers["retry-after"] == "2"
+        other = admin_client.post(
+            "/memory/add", json=body, headers={"X-Session-ID": "other-client"}
+        )
+        assert other.status_code == 200
+        stats = admin_client.get("/admin/rate-limit").json()
+        assert stats[0]["rule"] == "memory/add"
+        assert stats[0]["limited"] == 1
+
+    def test_memory_export_is_compressed(
+        self, admin_client: TestClient, session_headers: dict[str, str]
+    ) -> None:
+        """Streamed exports are gzip-encoded for clients that accept it."""
+        admin_client.post("/memory/add", json={"value": 1.0}, headers=session_headers)
+        response = admin_client.get(
+            "/admin/memory/export", headers={"Accept-Encoding": "gzip"}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert session_headers["X-Session-ID"] in response.text
+
+    def test_memory_backend_reports_near_cache(
+        self, admin_client: TestClient, session_id: str, session_headers: dict[str, str]
+    ) -> None:
+        """GET /admin/memory/backend reports the layers and cache hit ratio."""
+        from src.services.memory import add_to_memory
+        from src.services.memory_backend import (
+            LocalMemoryBackend,
+            get_backend,
+            set_backend,
+        )
+        from src.services.near_cache import RecallNearCache
+
+        original = get_backend()
+        cache = RecallNearCache(LocalMemoryBackend(), ttl=60.0)
+        set_backend(cache)
+        try:
+            first = admin_client.get("/memory", headers=session_headers)
+            admin_client.post(
+                "/memory/add", json={"value": 2.0}, headers=session_headers
+            )
+            add_to_memory(session_id, 1.0)
+            second = admin_client.get(
+                "/memory",
+                headers={**session_headers, "If-None-Match": first.headers["ETag"]},
+            )
+            third = admin_client.get(
+                "/memory",
+                headers={**session_headers, "If-None-Match": second.headers["ETag"]},
+            )
+            stats = admin_client.get("/admin/memory/backend").json()
+        finally:
+            set_backend(original)
+            cache.close()
+        assert second.status_code == 200
+        assert second.json()["value"] == 3.0
+        assert third.status_code == 304
+        assert stats["layers"] == ["RecallNearCache", "LocalMemoryBackend"]
+        # One lookup per recall: two cold fills, then one reuse.
+        assert stats["near_cache"]["hits"] == 1
+        assert stats["near_cache"]["misses"] == 2
+        assert stats["near_cache"]["hit_ratio"] == pytest.approx(1 / 3)
+        assert stats["coalescer"] is None
+
+    def test_memory_backend_defaults_to_local_store(
+        self, admin_client: TestClient
+    ) -> None:
+        """Without layers configured only the in-process store is listed."""
+        stats = admin_client.get("/admin/memory/backend").json()
+        assert stats == {
+            "layers": ["LocalMemoryBackend"],
+            "near_cache": None,
+            "coalescer": None,
+        }
+
+    def test_admin_requires_token(
+        self, client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Admin routes are refused without the configured token."""
+        from src import config
+
+        disabled = client.get("/admin/memory/export")
+        assert disabled.status_code == 403
+        assert disabled.json()["code"] == "ADMIN_FORBIDDEN"
+
+        monkeypatch.setattr(
+            config, "settings", replace(config.settings, admin_token="secret")
+        )
+        wrong = client.post(
+            "/admin/memory/import", content=b"", headers={"X-Admin-Token": "guess"}
+        )
+        assert wrong.status_code == 403
+        allowed = client.get("/admin/startup", headers={"X-Admin-Token": "secret"})
+        assert allowed.status_code == 200
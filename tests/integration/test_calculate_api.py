@@ -57,3 +57,43 @@ class TestCalculateAPI:
         elapsed = (time.time() - start) * 1000
         assert response.status_code == 200
         assert elapsed < 100, f"Response took {elapsed:.1f}ms, expected <100ms"
+
+    def test_calculate_get_is_cacheable(self, client: TestClient) -> None:
+        """GET /calculate returns the POST body with long-lived cache headers."""
+        response = client.get(
+            "/calculate?operand1=10.0&operand2=5.0&operator=%2A",
+        )
+        assert response.status_code == 200
+        assert (
+            response.json()
+            == client.post(
+                "/calculate", json={"operand1": 10, "operand2": 5, "operator": "*"}
+            ).json()
+        )
+        assert "max-age=31536000" in response.headers["cache-control"]
+        assert response.headers["etag"].startswith('"')
+
+        revalidated = client.get(
+            response.url, headers={"If-None-Match": response.headers["etag"]}
+        )
+        assert revalidated.status_code == 304
+        assert revalidated.headers["etag"] == response.headers["etag"]
+
+    def test_calculate_get_redirects_to_canonical_query(
+        self, client: TestClient
+    ) -> None:
+        """Non-canonical spellings redirect to one canonical URL."""
+        response = client.get(
+            "/calculate?operator=%2B&operand2=2&operand1=1e0", follow_redirects=False
+        )
+        assert response.status_code == 308
+        assert (
+            response.headers["location"]
+            == "/calculate?operand1=1.0&operand2=2.0&operator=%2B"
+        )
+
+    def test_calculate_get_error_returns_400(self, client: TestClient) -> None:
+        """Calculation errors on GET use the standard error body."""
+        response = client.get("/calculate?operand1=1.0&operand2=0.0&operator=%2F")
+        assert response.status_code == 400
+        assert response.json()["code"] == "DIVISION_BY_ZERO"
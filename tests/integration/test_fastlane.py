@@ -0,0 +1,90 @@
+"""Integration tests for the raw-ASGI /calculate fast lane."""
+
+from collections.abc import Generator
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+CASES: list[dict[str, Any]] = [
+    {"operand1": 10.0, "operand2": 5.0, "operator": "+"},
+    {"operand1": 1e20, "operand2": 3, "operator": "*"},
+    {"operand1": 1e308, "operand2": 1e308, "operator": "+"},
+    {"operand1": "5", "operand2": 3, "operator": "-"},
+    {"operand1": 10.0, "operand2": 0.0, "operator": "/"},
+    {"operand1": 10.0, "operand2": 5.0, "operator": "^"},
+    {"operand1": 10.0},
+    {"operand1": "abc", "operand2": 1, "operator": "+"},
+]
+
+
+@pytest.fixture
+def fast_lane(app: Any) -> Any:
+    """Fast lane wrapping the application."""
+    from src.fastlane import CalculateFastLane
+
+    return CalculateFastLane(app)
+
+
+@pytest.fixture
+def fast_client(fast_lane: Any) -> Generator[TestClient, None, None]:
+    """Test client that goes through the fast lane."""
+    with TestClient(fast_lane) as c:
+        yield c
+
+
+class TestCalculateFastLane:
+    """Tests for CalculateFastLane."""
+
+    @pytest.mark.parametrize("body", CASES)
+    def test_identical_to_router(
+        self, client: TestClient, fast_client: TestClient, body: dict[str, Any]
+    ) -> None:
+        """Status, headers and body bytes match the FastAPI route."""
+        expected = client.post("/calculate", json=body)
+        actual = fast_client.post("/calculate", json=body)
+        assert actual.status_code == expected.status_code
+        assert actual.content == expected.content
+        assert actual.headers["content-type"] == expected.headers["content-type"]
+
+    def test_valid_request_skips_router(
+        self, fast_lane: Any, fast_client: TestClient
+    ) -> None:
+        """Successful and CalculatorError requests are answered directly."""
+        fast_client.post(
+            "/calculate", json={"operand1": 1.0, "operand2": 2.0, "operator": "+"}
+        )
+        fast_client.post(
+            "/calculate", json={"operand1": 1.0, "operand2": 0.0, "operator": "/"}
+        )
+        assert fast_lane.handled == 2
+        assert fast_lane.delegated == 0
+
+    def test_invalid_request_is_delegated(
+        self, fast_lane: Any, fast_client: TestClient
+    ) -> None:
+        """Validation failures and non-JSON bodies go through the router."""
+        fast_client.post("/calculate", json={"operand1": 1.0})
+        fast_client.post(
+            "/calculate",
+            content=b'{"operand1":1,"operand2":2,"operator":"+"}',
+            headers={"content-type": "text/plain"},
+        )
+        assert fast_lane.handled == 0
+        assert fast_lane.delegated == 2
+
+    def test_records_history(
+        self, fast_client: TestClient, session_headers: dict[str, str]
+    ) -> None:
+        """Fast-lane calculations with a session are recorded in history."""
+        fast_client.post(
+            "/calculate",
+            json={"operand1": 2.0, "operand2": 3.0, "operator": "*"},
+            headers=session_headers,
+        )
+        history = fast_client.get("/history", headers=session_headers).json()
+        assert history["entries"][0]["result"] == 6.0
+
+    def test_other_routes_pass_through(self, fast_client: TestClient) -> None:
+        """Requests for other paths reach the application unchanged."""
+        assert fast_client.get("/health").json() == {"status": "healthy"}
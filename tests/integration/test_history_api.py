@@ -0,0 +1,73 @@
+"""Integration tests for history API endpoints."""
+
+from fastapi.testclient import TestClient
+
+
+class TestHistoryAPI:
+    """Tests for GET/DELETE /history."""
+
+    def test_calculate_is_recorded_in_history(
+        self, client: TestClient, session_headers: dict[str, str]
+    ) -> None:
+        """POST /calculate with a session appears in GET /history."""
+        client.post(
+            "/calculate",
+            json={"operand1": 10.0, "operand2": 5.0, "operator": "-"},
+            headers=session_headers,
+        )
+        response = client.get("/history", headers=session_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 1
+        assert data["entries"][0] == {
+            "operand1": 10.0,
+            "operand2": 5.0,
+            "operator": "-",
+            "result": 5.0,
+        }
+
+    def test_failed_calculation_is_not_recorded(
+        self, client: TestClient, session_headers: dict[str, str]
+    ) -> None:
+        """Errors such as division by zero leave history untouched."""
+        client.post(
+            "/calculate",
+            json={"operand1": 1.0, "operand2": 0.0, "operator": "/"},
+            headers=session_headers,
+        )
+        assert client.get("/history", headers=session_headers).json()["total"] == 0
+
+    def test_history_pagination_params(
+        self, client: TestClient, session_headers: dict[str, str]
+    ) -> None:
+        """offset and limit page through history."""
+        for i in range(3):
+            client.post(
+                "/calculate",
+                json={"operand1": float(i), "operand2": 1.0, "operator": "+"},
+                headers=session_headers,
+            )
+        response = client.get(
+            "/history", params={"offset": 1, "limit": 1}, headers=session_headers
+        )
+        data = response.json()
+        assert data["total"] == 3
+        assert [e["operand1"] for e in data["entries"]] == [1.0]
+
+    def test_history_clear(
+        self, client: TestClient, session_headers: dict[str, str]
+    ) -> None:
+        """DELETE /history empties the session's history."""
+        client.post(
+            "/calculate",
+            json={"operand1": 1.0, "operand2": 1.0, "operator": "+"},
+            headers=session_headers,
+        )
+        client.delete("/history", headers=session_headers)
+        assert client.get("/history", headers=session_headers).json()["total"] == 0
+
+    def test_history_anonymous_is_empty(self, client: TestClient) -> None:
+        """Anonymous callers get an empty history."""
+        response = client.get("/history")
+        assert response.status_code == 200
+        assert response.json()["entries"] == []
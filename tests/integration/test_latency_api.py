@@ -0,0 +1,43 @@
+"""Integration tests for the rolling latency percentiles endpoint."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+class TestLatencyAPI:
+    """Tests for GET /admin/latency."""
+
+    def test_latency_report_percentiles_and_slo_breaches(
+        self, admin_client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Requests feed per-route percentiles and SLO breach counters."""
+        from src import latency
+
+        recorder = latency.RollingLatency(
+            slos=[latency.SLO("instant", "/calculate", 0.0)]
+        )
+        monkeypatch.setattr(latency, "recorder", recorder)
+        for _ in range(5):
+            admin_client.post(
+                "/calculate", json={"operand1": 1, "operand2": 2, "operator": "+"}
+            )
+
+        report = admin_client.get("/admin/latency").json()
+        calculate = report["routes"]["/calculate"]
+        assert calculate["count"] == 5
+        assert 0 < calculate["p50_ms"] <= calculate["p99_ms"] <= calculate["max_ms"]
+        slo = report["slos"]["instant"]
+        assert slo["window_requests"] == 5
+        assert slo["window_breaches"] == 5
+        assert slo["total_breaches"] == 5
+
+        metrics = admin_client.get("/metrics").text
+        assert 'calc_slo_breaches_total{slo="instant"}' in metrics
+
+    def test_default_slos_follow_acceptance_budgets(
+        self, admin_client: TestClient
+    ) -> None:
+        """AC-P01 and AC-P02 budgets are tracked by default."""
+        slos = admin_client.get("/admin/latency").json()["slos"]
+        assert slos["AC-P01"]["budget_ms"] == 100
+        assert slos["AC-P02"]["route_prefix"] == "/memory"
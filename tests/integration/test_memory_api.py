@@ -1,7 +1,9 @@
 """Integration tests for memory API endpoints."""
 
 import time
+from collections.abc import Sequence
 
+import pytest
 from fastapi.testclient import TestClient
 
 
@@ -58,6 +60,39 @@ class TestMemoryAPI:
         recall = client.get("/memory", headers=session_headers)
         assert recall.json()["value"] == 0.0
 
+    def test_clearing_unknown_session_leaves_no_state(
+        self, client: TestClient, session_headers: dict[str, str]
+    ) -> None:
+        """DELETE /memory on an empty session journals nothing."""
+        from src.services.session import active_session_count
+
+        before = active_session_count()
+        response = client.delete("/memory", headers=session_headers)
+        assert response.status_code == 200
+        assert active_session_count() == before
+        undo = client.post("/memory/undo", headers=session_headers)
+        assert undo.json()["code"] == "NOTHING_TO_UNDO"
+
+    def test_add_without_journal(
+        self,
+        client: TestClient,
+        session_headers: dict[str, str],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """journal_depth=0 turns undo off without failing writes."""
+        from dataclasses import replace
+
+        from src import config
+
+        monkeypatch.setattr(
+            config, "settings", replace(config.settings, journal_depth=0)
+        )
+        response = client.post(
+            "/memory/add", json={"value": 1.0}, headers=session_headers
+        )
+        assert response.status_code == 200
+        assert client.get("/memory", headers=session_headers).json()["value"] == 1.0
+
     def test_memory_new_session_returns_zero(self, client: TestClient) -> None:
         """New session with no prior memory returns zero."""
         import uuid
@@ -67,6 +102,201 @@ class TestMemoryAPI:
         assert response.status_code == 200
         assert response.json()["value"] == 0.0
 
+    def test_memory_batch_applies_per_session(
+        self, client: TestClient, session_headers: dict[str, str]
+    ) -> None:
+        """POST /memory/batch returns final values for every session."""
+        import uuid
+
+        other_session = str(uuid.uuid4())
+        client.delete("/memory", headers=session_headers)
+        response = client.post(
+            "/memory/batch",
+            json={
+                "operations": [
+                    {"op": "add", "value": 10.0},
+                    {"op": "subtract", "value": 2.5},
+                    {"op": "add", "value": 7.0, "session_id": other_session},
+                ]
+            },
+            headers=session_headers,
+        )
+        assert response.status_code == 200
+        values = response.json()["values"]
+        assert values[session_headers["X-Session-ID"]] == 7.5
+        assert values[other_session] == 7.0
+        recall = client.get("/memory", headers=session_headers)
+        assert recall.json()["value"] == 7.5
+
+    def test_memory_batch_invalid_op_returns_422(
+        self, client: TestClient, session_headers: dict[str, str]
+    ) -> None:
+        """POST /memory/batch rejects unknown operations."""
+        response = client.post(
+            "/memory/batch",
+            json={"operations": [{"op": "multiply", "value": 2.0}]},
+            headers=session_headers,
+        )
+        assert response.status_code == 422
+
+    def test_register_add_and_bulk_recall(
+        self, client: TestClient, session_headers: dict[str, str]
+    ) -> None:
+        """Register endpoints update and recall M1..Mn."""
+        client.delete("/memory/registers", headers=session_headers)
+        client.post(
+            "/memory/registers/1/add", json={"value": 8.0}, headers=session_headers
+        )
+        response = client.post(
+            "/memory/registers/1/subtract",
+            json={"value": 3.0},
+            headers=session_headers,
+        )
+        assert response.status_code == 200
+        assert response.json()["value"] == 5.0
+        single = client.get("/memory/registers/1", headers=session_headers)
+        assert single.json()["value"] == 5.0
+        bulk = client.get("/memory/registers", headers=session_headers)
+        assert bulk.status_code == 200
+        assert bulk.json()["values"][0] == 5.0
+
+    def test_register_out_of_range_returns_400(
+        self, client: TestClient, session_headers: dict[str, str]
+    ) -> None:
+        """Register index beyond the cap returns 400 INVALID_REGISTER."""
+        response = client.post(
+            "/memory/registers/999/add", json={"value": 1.0}, headers=session_headers
+        )
+        assert response.status_code == 400
+        assert response.json()["code"] == "INVALID_REGISTER"
+
+    def test_memory_routes_use_configured_backend(
+        self, client: TestClient, session_headers: dict[str, str]
+    ) -> None:
+        """Memory routes await the backend installed with set_backend."""
+        from src.services.memory_backend import (
+            LocalMemoryBackend,
+            get_backend,
+            set_backend,
+        )
+
+        class RecordingBackend(LocalMemoryBackend):
+            calls: list[str] = []
+
+            async def recall(self, session_id: str) -> tuple[float, int]:
+                self.calls.append("recall")
+                return await super().recall(session_id)
+
+            async def apply_batch(
+                self, operations: Sequence[tuple[str, str, float]]
+            ) -> dict[str, float]:
+                self.calls.append("apply_batch")
+                return await super().apply_batch(operations)
+
+            async def increment_register(
+                self, session_id: str, index: int, delta: float
+            ) -> float:
+                self.calls.append("increment_register")
+                return await super().increment_register(session_id, index, delta)
+
+            async def get_registers(self, session_id: str | None) -> list[float]:
+                self.calls.append("get_registers")
+                return await super().get_registers(session_id)
+
+        original = get_backend()
+        set_backend(RecordingBackend())
+        try:
+            client.get("/memory", headers=session_headers)
+            client.post(
+                "/memory/batch",
+                json={"operations": [{"op": "add", "value": 1.0}]},
+                headers=session_headers,
+            )
+            client.post(
+                "/memory/registers/2/subtract",
+                json={"value": 1.0},
+                headers=session_headers,
+            )
+            registers = client.get("/memory/registers", headers=session_headers)
+        finally:
+            set_backend(original)
+        assert RecordingBackend.calls == [
+            "recall",
+            "apply_batch",
+            "increment_register",
+            "get_registers",
+        ]
+        assert registers.json()["values"][1] == -1.0
+
+    def test_anonymous_write_issues_session(self, client: TestClient) -> None:
+        """Header-less writes return a new session id the client can reuse."""
+        response = client.post("/memory/add", json={"value": 4.0})
+        assert response.status_code == 200
+        session_id = response.headers["X-Session-ID"]
+        assert response.cookies["calc_session"] == session_id
+        recall = client.get("/memory", headers={"X-Session-ID": session_id})
+        assert recall.json()["value"] == 4.0
+
+    def test_anonymous_read_allocates_nothing(self, client: TestClient) -> None:
+        """Header-less reads are stateless and issue no session."""
+        from src.services.session import active_session_count
+
+        before = active_session_count()
+        response = client.get("/memory")
+        assert response.status_code == 200
+        assert response.json()["value"] == 0.0
+        assert "X-Session-ID" not in response.headers
+        assert active_session_count() == before
+
+    def test_anonymous_write_rejected_when_configured(
+        self, client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """anonymous_writes=reject answers header-less writes with 400."""
+        from dataclasses import replace
+
+        from src import config
+
+        monkeypatch.setattr(
+            config, "settings", replace(config.settings, anonymous_writes="reject")
+        )
+        response = client.post("/memory/add", json={"value": 1.0})
+        assert response.status_code == 400
+        assert response.json()["code"] == "SESSION_REQUIRED"
+
+    def test_memory_undo_redo(
+        self, client: TestClient, session_headers: dict[str, str]
+    ) -> None:
+        """POST /memory/undo and /memory/redo reverse and reapply operations."""
+        client.post("/memory/add", json={"value": 10.0}, headers=session_headers)
+        client.post("/memory/subtract", json={"value": 4.0}, headers=session_headers)
+
+        undo = client.post("/memory/undo", headers=session_headers)
+        assert undo.status_code == 200
+        assert undo.json()["value"] == 10.0
+        redo = client.post("/memory/redo", headers=session_headers)
+        assert redo.json()["value"] == 6.0
+
+    def test_memory_undo_clear_restores_value(
+        self, client: TestClient, session_headers: dict[str, str]
+    ) -> None:
+        """Undoing a clear restores the discarded value."""
+        client.post("/memory/add", json={"value": 42.0}, headers=session_headers)
+        client.delete("/memory", headers=session_headers)
+        undo = client.post("/memory/undo", headers=session_headers)
+        assert undo.json()["value"] == 42.0
+        assert client.get("/memory", headers=session_headers).json()["value"] == 42.0
+
+    def test_memory_undo_empty_returns_400(
+        self, client: TestClient, session_headers: dict[str, str]
+    ) -> None:
+        """Undo and redo with nothing journaled return 400."""
+        undo = client.post("/memory/undo", headers=session_headers)
+        assert undo.status_code == 400
+        assert undo.json()["code"] == "NOTHING_TO_UNDO"
+        redo = client.post("/memory/redo", headers=session_headers)
+        assert redo.status_code == 400
+        assert redo.json()["code"] == "NOTHING_TO_REDO"
+
     def test_memory_response_time_under_50ms(
         self, client: TestClient, session_headers: dict[str, str]
     ) -> None:
@@ -76,3 +306,62 @@ class TestMemoryAPI:
         elapsed = (time.time() - start) * 1000
         assert response.status_code == 200
         assert elapsed < 50, f"Response took {elapsed:.1f}ms, expected <50ms"
+
+    def test_idempotency_key_replays_add(
+        self, client: TestClient, session_headers: dict[str, str]
+    ) -> None:
+        """A retried add with the same Idempotency-Key is applied once."""
+        headers = {**session_headers, "Idempotency-Key": "retry-1"}
+        first = client.post("/memory/add", json={"value": 4.0}, headers=headers)
+        retry = client.post("/memory/add", json={"value": 4.0}, headers=headers)
+        assert first.json() == retry.json()
+        assert retry.headers["idempotent-replayed"] == "true"
+        assert "idempotent-replayed" not in first.headers
+        assert client.get("/memory", headers=session_headers).json()["value"] == 4.0
+
+        subtract = client.post("/memory/subtract", json={"value": 4.0}, headers=headers)
+        assert subtract.json()["value"] == 0.0
+
+        conflict = client.post("/memory/add", json={"value": 5.0}, headers=headers)
+        assert conflict.status_code == 400
+        assert conflict.json()["code"] == "IDEMPOTENCY_KEY_CONFLICT"
+
+    def test_idempotency_key_requires_session(self, client: TestClient) -> None:
+        """Anonymous keyed writes are rejected instead of applied per retry."""
+        headers = {"Idempotency-Key": "anonymous-retry"}
+        client.cookies.clear()
+        response = client.post("/memory/add", json={"value": 1.0}, headers=headers)
+        assert response.status_code == 400
+        assert response.json()["code"] == "SESSION_REQUIRED"
+        assert "x-session-id" not in response.headers
+
+        anonymous = client.post("/memory/subtract", json={"value": 1.0})
+        assert anonymous.status_code == 200
+        assert anonymous.headers["x-session-id"]
+
+    def test_memory_recall_conditional_get(
+        self, client: TestClient, session_headers: dict[str, str]
+    ) -> None:
+        """An unchanged recall answers If-None-Match with 304 and no body."""
+        client.post("/memory/add", json={"value": 2.0}, headers=session_headers)
+        first = client.get("/memory", headers=session_headers)
+        etag = first.headers["etag"]
+        conditional = {**session_headers, "If-None-Match": etag}
+
+        unchanged = client.get("/memory", headers=conditional)
+        assert unchanged.status_code == 304
+        assert unchanged.content == b""
+        assert unchanged.headers["etag"] == etag
+
+        client.post("/memory/add", json={"value": 1.0}, headers=session_headers)
+        changed = client.get("/memory", headers=conditional)
+        assert changed.status_code == 200
+        assert changed.json()["value"] == 3.0
+        assert changed.headers["etag"] != etag
+
+        client.delete("/memory", headers=session_headers)
+        cleared = client.get(
+            "/memory", headers={**session_headers, "If-None-Match": etag}
+        )
+        assert cleared.status_code == 200
+        assert cleared.json()["value"] == 0.0
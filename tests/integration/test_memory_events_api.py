@@ -0,0 +1,169 @@
+"""Integration tests for the memory Server-Sent Events stream."""
+
+import asyncio
+import json
+from dataclasses import replace
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.types import Message
+
+
+async def _open_stream(
+    session_id: str,
+    messages: asyncio.Queue[Message],
+    disconnect: asyncio.Event,
+    headers: list[tuple[bytes, bytes]] | None = None,
+) -> None:
+    """Run GET /memory/events through the ASGI app until disconnected."""
+    from src.main import app
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/memory/events",
+        "raw_path": b"/memory/events",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"x-session-id", session_id.encode()), *(headers or [])],
+        "client": ("127.0.0.1", 0),
+        "server": ("127.0.0.1", 80),
+    }
+    requested = False
+
+    async def receive() -> Message:
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnect.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        await messages.put(message)
+
+    await app(scope, receive, send)
+
+
+async def _next_body(messages: asyncio.Queue[Message]) -> bytes:
+    """Return the next non-empty body chunk sent by the stream."""
+    while True:
+        message = await asyncio.wait_for(messages.get(), 5.0)
+        if message["type"] == "http.response.body" and message.get("body"):
+            return bytes(message["body"])
+
+
+def _event_data(chunk: bytes) -> dict[str, float]:
+    """Decode the data line of a single SSE event."""
+    for line in chunk.decode().splitlines():
+        if line.startswith("data: "):
+            data: dict[str, float] = json.loads(line.removeprefix("data: "))
+            return data
+    raise AssertionError(f"no data line in {chunk!r}")
+
+
+class TestMemoryEventsAPI:
+    """Tests for GET /memory/events."""
+
+    def test_stream_pushes_current_value_then_changes(self, session_id: str) -> None:
+        """Subscribers get the current value, then one event per change."""
+        from src.services.memory import add_to_memory, clear_memory
+
+        async def run() -> tuple[Message, list[bytes]]:
+            messages: asyncio.Queue[Message] = asyncio.Queue()
+            disconnect = asyncio.Event()
+            stream = asyncio.create_task(_open_stream(session_id, messages, disconnect))
+            start = await asyncio.wait_for(messages.get(), 5.0)
+            chunks = [await _next_body(messages)]
+            add_to_memory(session_id, 4.0)
+            chunks.append(await _next_body(messages))
+            clear_memory(session_id)
+            chunks.append(await _next_body(messages))
+            disconnect.set()
+            await asyncio.wait_for(stream, 5.0)
+            return start, chunks
+
+        start, chunks = asyncio.run(run())
+        headers = dict(start["headers"])
+        assert start["status"] == 200
+        assert headers[b"content-type"].startswith(b"text/event-stream")
+        assert [_event_data(chunk)["value"] for chunk in chunks] == [0.0, 4.0, 0.0]
+        assert chunks[1].startswith(b"id: ")
+
+        from src.services.memory_events import broker
+
+        assert broker.stats().subscribers == 0
+
+    def test_stream_sends_heartbeats(
+        self, session_id: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Idle streams emit keep-alive comments."""
+        from src import config
+
+        monkeypatch.setattr(
+            config,
+            "settings",
+            replace(config.settings, memory_events_heartbeat_s=0.01),
+        )
+
+        async def run() -> bytes:
+            messages: asyncio.Queue[Message] = asyncio.Queue()
+            disconnect = asyncio.Event()
+            stream = asyncio.create_task(_open_stream(session_id, messages, disconnect))
+            await _next_body(messages)
+            heartbeat = await _next_body(messages)
+            disconnect.set()
+            await asyncio.wait_for(stream, 5.0)
+            return heartbeat
+
+        assert asyncio.run(run()) == b": keep-alive\n\n"
+
+    def test_stream_requires_session(self, client: TestClient) -> None:
+        """Anonymous subscribers are rejected."""
+        response = client.get("/memory/events")
+        assert response.status_code == 400
+        assert response.json()["code"] == "SESSION_REQUIRED"
+
+    def test_reconnect_with_current_id_skips_snapshot(self, session_id: str) -> None:
+        """A Last-Event-ID equal to the current version resumes with changes."""
+        from src.services.memory import add_to_memory, get_memory_version
+
+        add_to_memory(session_id, 2.0)
+        current = str(get_memory_version(session_id)).encode()
+
+        async def run() -> bytes:
+            messages: asyncio.Queue[Message] = asyncio.Queue()
+            disconnect = asyncio.Event()
+            stream = asyncio.create_task(
+                _open_stream(
+                    session_id, messages, disconnect, [(b"last-event-id", current)]
+                )
+            )
+            await asyncio.wait_for(messages.get(), 5.0)
+            await asyncio.sleep(0.05)
+            add_to_memory(session_id, 1.0)
+            chunk = await _next_body(messages)
+            disconnect.set()
+            await asyncio.wait_for(stream, 5.0)
+            return chunk
+
+        chunk = asyncio.run(run())
+        assert _event_data(chunk)["value"] == 3.0
+        assert not chunk.startswith(b"id: " + current + b"\n")
+
+    def test_never_written_session_has_no_event_id(self, session_id: str) -> None:
+        """The version-0 snapshot carries no id to resume from."""
+
+        async def run() -> bytes:
+            messages: asyncio.Queue[Message] = asyncio.Queue()
+            disconnect = asyncio.Event()
+            stream = asyncio.create_task(_open_stream(session_id, messages, disconnect))
+            chunk = await _next_body(messages)
+            disconnect.set()
+            await asyncio.wait_for(stream, 5.0)
+            return chunk
+
+        assert asyncio.run(run()).startswith(b"event: memory\n")
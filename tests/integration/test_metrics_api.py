@@ -0,0 +1,50 @@
+"""Integration tests for the /metrics endpoint."""
+
+import re
+
+from fastapi.testclient import TestClient
+
+
+def _sample(text: str, line_prefix: str) -> float:
+    """Return the value of the first sample starting with line_prefix."""
+    for line in text.splitlines():
+        if line.startswith(line_prefix):
+            return float(line.rsplit(" ", 1)[1])
+    return 0.0
+
+
+class TestMetricsAPI:
+    """Tests for GET /metrics."""
+
+    def test_metrics_cover_requests_operators_and_errors(
+        self, client: TestClient, session_headers: dict[str, str]
+    ) -> None:
+        """Requests, calculations and error codes are counted."""
+        before = client.get("/metrics").text
+        client.post("/calculate", json={"operand1": 6, "operand2": 3, "operator": "/"})
+        client.post("/calculate", json={"operand1": 6, "operand2": 0, "operator": "/"})
+        client.post(
+            "/memory/registers/2/add", json={"value": 1.0}, headers=session_headers
+        )
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        after = response.text
+
+        def delta(prefix: str) -> float:
+            return _sample(after, prefix) - _sample(before, prefix)
+
+        assert delta('calc_calculations_total{operator="/"}') == 1
+        assert delta('calc_errors_total{code="DIVISION_BY_ZERO"}') == 1
+        count = "calc_http_request_duration_seconds_count"
+        assert delta(f'{count}{{method="POST",route="/calculate",status="200"}}') == 1
+        assert (
+            delta(
+                f'{count}{{method="POST",route="/memory/registers/{{index}}/add",'
+                'status="200"}'
+            )
+            == 1
+        )
+        assert _sample(after, "calc_http_requests_in_flight") == 1
+        assert _sample(after, "calc_memory_entries") >= 0
+        assert re.search(r"^calc_register_entries \d+", after, re.MULTILINE)
@@ -0,0 +1,62 @@
+"""Integration tests for the precomputed OpenAPI schema."""
+
+import json
+
+from fastapi.testclient import TestClient
+
+
+class TestOpenAPI:
+    """Tests for GET /openapi.json and the docs pages."""
+
+    def test_openapi_includes_models(self, client: TestClient) -> None:
+        """The schema documents the calculation and memory models."""
+        response = client.get("/openapi.json")
+        assert response.status_code == 200
+        schemas = response.json()["components"]["schemas"]
+        for model in ("CalculationRequest", "CalculationResponse", "MemoryResponse"):
+            assert model in schemas
+
+    def test_openapi_is_gzipped_when_accepted(self, client: TestClient) -> None:
+        """Clients accepting gzip get the precompressed bytes."""
+        response = client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        raw = client.get("/openapi.json", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in raw.headers
+        assert json.loads(raw.content) == response.json()
+        assert raw.headers["vary"] == "Accept-Encoding"
+
+    def test_openapi_etag_differs_per_encoding(self, client: TestClient) -> None:
+        """gzip and identity bodies have distinct ETags that validate separately."""
+        gzip_etag = client.get(
+            "/openapi.json", headers={"Accept-Encoding": "gzip"}
+        ).headers["etag"]
+        identity_etag = client.get(
+            "/openapi.json", headers={"Accept-Encoding": "identity"}
+        ).headers["etag"]
+        assert gzip_etag == identity_etag[:-1] + '-gzip"'
+        mismatched = client.get(
+            "/openapi.json",
+            headers={"Accept-Encoding": "identity", "If-None-Match": gzip_etag},
+        )
+        assert mismatched.status_code == 200
+        matched = client.get(
+            "/openapi.json",
+            headers={"Accept-Encoding": "gzip", "If-None-Match": gzip_etag},
+        )
+        assert matched.status_code == 304
+
+    def test_openapi_etag_returns_304(self, client: TestClient) -> None:
+        """A matching If-None-Match yields 304 with no body."""
+        etag = client.get("/openapi.json").headers["etag"]
+        response = client.get("/openapi.json", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_docs_pages_served(self, client: TestClient) -> None:
+        """Swagger UI and ReDoc point at the precomputed schema."""
+        for path in ("/docs", "/redoc"):
+            response = client.get(path)
+            assert response.status_code == 200
+            assert "/openapi.json" in response.text
@@ -0,0 +1,67 @@
+"""Integration tests for startup warmup and readiness."""
+
+from typing import Any
+
+from fastapi.testclient import TestClient
+
+
+class TestReadiness:
+    """Tests for GET /ready and the warmup lifespan."""
+
+    def test_ready_after_warmup(self, client: TestClient) -> None:
+        """GET /ready reports ready with the warmup duration."""
+        response = client.get("/ready")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "ready"
+        assert data["warmup_ms"] > 0
+
+    def test_not_ready_before_warmup(self, app: Any) -> None:
+        """GET /ready returns 503 until the lifespan warmup has finished."""
+        app.state.ready = False
+        try:
+            response = TestClient(app).get("/ready")
+        finally:
+            app.state.ready = True
+        assert response.status_code == 503
+        assert response.json()["status"] == "starting"
+
+    def test_warmup_leaves_no_session_state(self, client: TestClient) -> None:
+        """The warmup session is dropped once warmup completes."""
+        from src.warmup import WARMUP_SESSION
+
+        headers = {"X-Session-ID": WARMUP_SESSION}
+        assert client.get("/memory", headers=headers).json()["value"] == 0.0
+        assert client.get("/history", headers=headers).json()["total"] == 0
+
+    def test_warmup_leaves_no_stats(self, app: Any) -> None:
+        """Counters and client state touched by warmup are reset afterwards."""
+        import asyncio
+
+        from src import latency
+        from src.admission import controller
+        from src.ratelimit import limiter
+        from src.services.memory import memory_store_stats
+        from src.services.session import session_stats
+        from src.warmup import warm_up
+
+        asyncio.run(warm_up(app))
+
+        store = memory_store_stats()
+        assert (store.inserts, store.updates, store.deletes) == (0, 0, 0)
+        assert session_stats().ended == 0
+        assert latency.recorder.snapshot() == {}
+        assert controller.stats() == {}
+        assert all(rule.tracked_clients == 0 for rule in limiter.stats())
+
+    def test_warmup_leaves_no_metrics(self, app: Any) -> None:
+        """Calculations and errors made by warmup are not exposed."""
+        import asyncio
+
+        from src.metrics import CALCULATIONS, ERRORS
+        from src.warmup import warm_up
+
+        asyncio.run(warm_up(app))
+
+        assert CALCULATIONS.value("+") == 0
+        assert ERRORS.value("DIVISION_BY_ZERO") == 0
@@ -0,0 +1,62 @@
+"""Integration tests for cold-start instrumentation."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# Optional subsystems that must only be imported on first use.
+LAZY_MODULES = (
+    "numpy",
+    "brotli",
+    "zstandard",
+    "prometheus_client",
+    "src.services.coalescer",
+    "src.services.near_cache",
+)
+
+
+class TestStartup:
+    """Tests for startup phases and lazy imports."""
+
+    def test_startup_report_lists_phases(self, admin_client: TestClient) -> None:
+        """GET /admin/startup reports each cold-start phase."""
+        response = admin_client.get("/admin/startup")
+        assert response.status_code == 200
+        phases = response.json()
+        assert set(phases) == {"imports", "app", "routers", "warmup"}
+        assert all(duration >= 0 for duration in phases.values())
+
+    def test_startup_report_is_documented(self, client: TestClient) -> None:
+        """The startup report's schema is published in the OpenAPI document."""
+        schema = client.get("/openapi.json").json()
+        response = schema["paths"]["/admin/startup"]["get"]["responses"]["200"]
+        content = response["content"]["application/json"]["schema"]
+        assert content == {"$ref": "#/components/schemas/StartupReportResponse"}
+
+    def test_optional_subsystems_not_imported_at_startup(self) -> None:
+        """Importing the app does not load optional heavy modules."""
+        code = (
+            "import json, sys\n"
+            "import src.main\n"
+            f"print(json.dumps([m for m in {LAZY_MODULES!r} if m in sys.modules]))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=ROOT,
+        )
+        assert json.loads(result.stdout) == []
+
+    def test_optional_module_missing_returns_none(self) -> None:
+        """optional_module returns None for uninstalled modules."""
+        from src.startup import optional_module
+
+        assert optional_module("definitely_not_installed_module") is None
+        assert optional_module("json") is not None
@@ -0,0 +1,204 @@
+"""Unit tests for the memory write coalescer."""
+
+import asyncio
+from dataclasses import replace
+
+import pytest
+
+
+class CountingBackend:
+    """In-memory backend that counts increment round-trips."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, float] = {}
+        self.increments = 0
+
+    async def get(self, session_id: str) -> float:
+        return self.values.get(session_id, 0.0)
+
+    async def version(self, session_id: str) -> int:
+        return self.increments
+
+    async def increment(self, session_id: str, delta: float) -> float:
+        self.increments += 1
+        await asyncio.sleep(0)
+        self.values[session_id] = self.values.get(session_id, 0.0) + delta
+        return self.values[session_id]
+
+    async def clear(self, session_id: str) -> float:
+        return self.values.pop(session_id, 0.0)
+
+
+class TestWriteCoalescer:
+    """Tests for WriteCoalescer."""
+
+    def test_burst_is_flushed_as_one_increment(self) -> None:
+        """Concurrent deltas for a session hit the backend once."""
+        from src.services.coalescer import WriteCoalescer
+
+        backend = CountingBackend()
+        coalescer = WriteCoalescer(backend, window=0.01, max_pending=1000)
+
+        async def burst() -> list[float]:
+            adds = [coalescer.increment("s", 2.0) for _ in range(50)]
+            subs = [coalescer.increment("s", -1.0) for _ in range(50)]
+            return await asyncio.gather(*adds, *subs)
+
+        results = asyncio.run(burst())
+        assert backend.increments == 1
+        assert backend.values["s"] == 50.0
+        assert results == [50.0] * 100
+        assert coalescer.stats.operations == 100
+        assert coalescer.stats.backend_calls == 1
+
+    def test_size_threshold_flushes_early(self) -> None:
+        """Reaching max_pending flushes without waiting for the window."""
+        from src.services.coalescer import WriteCoalescer
+
+        backend = CountingBackend()
+        coalescer = WriteCoalescer(backend, window=60.0, max_pending=10)
+
+        async def burst() -> list[float]:
+            return await asyncio.gather(
+                *(coalescer.increment("s", 1.0) for _ in range(30))
+            )
+
+        results = asyncio.run(burst())
+        assert backend.increments == 3
+        assert sorted(set(results)) == [10.0, 20.0, 30.0]
+
+    def test_sessions_are_flushed_independently(self) -> None:
+        """Each session gets its own combined increment."""
+        from src.services.coalescer import WriteCoalescer
+
+        backend = CountingBackend()
+        coalescer = WriteCoalescer(backend, window=0.01, max_pending=1000)
+
+        async def burst() -> list[float]:
+            return await asyncio.gather(
+                coalescer.increment("a", 1.0),
+                coalescer.increment("b", 5.0),
+                coalescer.increment("a", 1.0),
+            )
+
+        assert asyncio.run(burst()) == [2.0, 5.0, 2.0]
+        assert backend.increments == 2
+
+    def test_backend_error_propagates_to_all_callers(self) -> None:
+        """Every caller in a failed flush sees the backend exception."""
+        from src.services.coalescer import WriteCoalescer
+
+        class FailingBackend(CountingBackend):
+            async def increment(self, session_id: str, delta: float) -> float:
+                raise ConnectionError("backend down")
+
+        coalescer = WriteCoalescer(FailingBackend(), window=0.01, max_pending=1000)
+
+        async def burst() -> list[float | BaseException]:
+            return await asyncio.gather(
+                coalescer.increment("s", 1.0),
+                coalescer.increment("s", 1.0),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(burst())
+        assert all(isinstance(r, ConnectionError) for r in results)
+
+    def test_flush_all_drains_pending(self) -> None:
+        """flush_all writes pending deltas without waiting for the window."""
+        from src.services.coalescer import WriteCoalescer
+
+        backend = CountingBackend()
+        coalescer = WriteCoalescer(backend, window=60.0, max_pending=1000)
+
+        async def run() -> float:
+            task = asyncio.ensure_future(coalescer.increment("s", 4.0))
+            await asyncio.sleep(0)
+            await coalescer.flush_all()
+            return await task
+
+        assert asyncio.run(run()) == 4.0
+
+    def test_local_backend_round_trip(self) -> None:
+        """Coalescer works over the in-process store."""
+        from src.services.coalescer import WriteCoalescer
+        from src.services.memory import clear_memory, get_memory
+        from src.services.memory_backend import LocalMemoryBackend
+
+        session_id = "test-coalescer-local"
+        clear_memory(session_id)
+        coalescer = WriteCoalescer(LocalMemoryBackend(), window=0.001)
+
+        async def run() -> list[float]:
+            return await asyncio.gather(
+                *(coalescer.increment(session_id, 1.5) for _ in range(4))
+            )
+
+        assert asyncio.run(run()) == [6.0] * 4
+        assert get_memory(session_id) == 6.0
+
+    def test_clear_waits_for_earlier_increments(self) -> None:
+        """A clear is applied after deltas submitted before it."""
+        from src.services.coalescer import WriteCoalescer
+
+        backend = CountingBackend()
+        coalescer = WriteCoalescer(backend, window=60.0, max_pending=1000)
+
+        async def run() -> tuple[float, float]:
+            task = asyncio.ensure_future(coalescer.increment("s", 3.0))
+            await asyncio.sleep(0)
+            cleared = await coalescer.clear("s")
+            return await task, cleared
+
+        assert asyncio.run(run()) == (3.0, 3.0)
+        assert "s" not in backend.values
+
+    def test_cancelled_flush_cancels_waiting_callers(self) -> None:
+        """Callers of a write cancelled mid-flight are not left waiting."""
+        from src.services.coalescer import WriteCoalescer
+
+        class HangingBackend(CountingBackend):
+            async def increment(self, session_id: str, delta: float) -> float:
+                await asyncio.Event().wait()
+                raise AssertionError("unreachable")
+
+        coalescer = WriteCoalescer(HangingBackend(), window=60.0, max_pending=1000)
+
+        async def run() -> BaseException | float:
+            caller = asyncio.ensure_future(coalescer.increment("s", 1.0))
+            await asyncio.sleep(0)
+            flush = asyncio.ensure_future(coalescer.flush_all())
+            await asyncio.sleep(0)
+            flush.cancel()
+            results = await asyncio.wait_for(
+                asyncio.gather(caller, return_exceptions=True), 1.0
+            )
+            return results[0]
+
+        assert isinstance(asyncio.run(run()), asyncio.CancelledError)
+
+    def test_reads_pass_through(self) -> None:
+        """get and version are answered by the wrapped backend."""
+        from src.services.coalescer import WriteCoalescer
+
+        backend = CountingBackend()
+        backend.values["s"] = 2.5
+        coalescer = WriteCoalescer(backend)
+
+        assert asyncio.run(coalescer.get("s")) == 2.5
+        assert asyncio.run(coalescer.version("s")) == 0
+
+    def test_enabled_by_settings(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """layered_backend adds the coalescer when configured."""
+        from src import config
+        from src.services.coalescer import WriteCoalescer
+        from src.services.memory_backend import LocalMemoryBackend, layered_backend
+
+        base = LocalMemoryBackend()
+        assert layered_backend(base) is base
+        monkeypatch.setattr(
+            config, "settings", replace(config.settings, memory_coalesce_writes=True)
+        )
+        layered = layered_backend(base)
+        assert isinstance(layered, WriteCoalescer)
+        assert layered.backend is base
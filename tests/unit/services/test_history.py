@@ -0,0 +1,71 @@
+"""Unit tests for calculation history."""
+
+from dataclasses import replace
+
+import pytest
+
+
+class TestCalculationHistory:
+    """Tests for the per-session history ring buffer."""
+
+    def test_history_is_newest_first(self) -> None:
+        """Entries are returned most recent first."""
+        from src.services.history import clear_history, get_history, record_calculation
+
+        session_id = "test-history-order"
+        clear_history(session_id)
+        record_calculation(session_id, 1.0, 2.0, "+", 3.0)
+        record_calculation(session_id, 6.0, 3.0, "/", 2.0)
+        entries, total = get_history(session_id, 0, 10)
+        assert total == 2
+        assert entries == [(6.0, "/", 3.0, 2.0), (1.0, "+", 2.0, 3.0)]
+
+    def test_history_is_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Oldest entries are overwritten once the ring is full."""
+        from src import config
+        from src.services.history import clear_history, get_history, record_calculation
+
+        monkeypatch.setattr(
+            config, "settings", replace(config.settings, history_size=3)
+        )
+        session_id = "test-history-bounded"
+        clear_history(session_id)
+        for i in range(5):
+            record_calculation(session_id, float(i), 1.0, "*", float(i))
+        entries, total = get_history(session_id, 0, 10)
+        assert total == 3
+        assert [entry[0] for entry in entries] == [4.0, 3.0, 2.0]
+
+    def test_zero_size_disables_history(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """history_size=0 records nothing instead of failing."""
+        from src import config
+        from src.services.history import get_history, record_calculation
+
+        monkeypatch.setattr(
+            config, "settings", replace(config.settings, history_size=0)
+        )
+        session_id = "test-history-off"
+        record_calculation(session_id, 1.0, 2.0, "+", 3.0)
+        assert get_history(session_id, 0, 10) == ([], 0)
+
+    def test_history_pagination(self) -> None:
+        """Offset and limit select a window of the history."""
+        from src.services.history import clear_history, get_history, record_calculation
+
+        session_id = "test-history-page"
+        clear_history(session_id)
+        for i in range(5):
+            record_calculation(session_id, float(i), 1.0, "-", float(i) - 1)
+        entries, total = get_history(session_id, 1, 2)
+        assert total == 5
+        assert [entry[0] for entry in entries] == [3.0, 2.0]
+
+    def test_history_shares_session_eviction(self) -> None:
+        """Ending a session drops its history."""
+        from src.services.history import get_history, record_calculation
+        from src.services.session import end_session
+
+        session_id = "test-history-evict"
+        record_calculation(session_id, 1.0, 1.0, "+", 2.0)
+        end_session(session_id)
+        assert get_history(session_id, 0, 10) == ([], 0)
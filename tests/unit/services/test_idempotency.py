@@ -0,0 +1,121 @@
+"""Unit tests for the Idempotency-Key replay cache."""
+
+import asyncio
+
+import pytest
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestIdempotencyCache:
+    """Tests for IdempotencyCache."""
+
+    def test_duplicate_replays_without_executing(self) -> None:
+        """A repeated key returns the first result and runs nothing."""
+        from src.services.idempotency import IdempotencyCache
+
+        cache = IdempotencyCache(max_size=10, ttl=60.0)
+        calls = 0
+
+        async def operation() -> float:
+            nonlocal calls
+            calls += 1
+            return 5.0
+
+        async def run() -> list[tuple[float, bool]]:
+            return [await cache.run("k", 5.0, operation) for _ in range(3)]
+
+        assert asyncio.run(run()) == [(5.0, False), (5.0, True), (5.0, True)]
+        assert calls == 1
+        assert cache.stats.replayed == 2
+
+    def test_concurrent_duplicate_waits_for_original(self) -> None:
+        """A duplicate arriving mid-flight waits instead of re-executing."""
+        from src.services.idempotency import IdempotencyCache
+
+        cache = IdempotencyCache(max_size=10, ttl=60.0)
+        calls = 0
+
+        async def operation() -> float:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return 1.0
+
+        async def run() -> list[tuple[float, bool]]:
+            return list(
+                await asyncio.gather(
+                    cache.run("k", 1.0, operation), cache.run("k", 1.0, operation)
+                )
+            )
+
+        assert sorted(asyncio.run(run())) == [(1.0, False), (1.0, True)]
+        assert calls == 1
+
+    def test_conflicting_reuse_raises(self) -> None:
+        """Reusing a key with different parameters is rejected."""
+        from src.exceptions import IdempotencyKeyConflictError
+        from src.services.idempotency import IdempotencyCache
+
+        cache = IdempotencyCache(max_size=10, ttl=60.0)
+
+        async def operation() -> float:
+            return 1.0
+
+        async def run() -> None:
+            await cache.run("k", 1.0, operation)
+            await cache.run("k", 2.0, operation)
+
+        with pytest.raises(IdempotencyKeyConflictError):
+            asyncio.run(run())
+
+    def test_entries_expire_and_are_bounded(self) -> None:
+        """Expired keys execute again; the cache never exceeds max_size."""
+        from src.services.idempotency import IdempotencyCache
+
+        clock = FakeClock()
+        cache = IdempotencyCache(max_size=2, ttl=10.0, clock=clock)
+
+        async def operation() -> float:
+            return 1.0
+
+        async def run() -> None:
+            await cache.run("a", 1.0, operation)
+            clock.now = 11.0
+            assert await cache.run("a", 1.0, operation) == (1.0, False)
+            await cache.run("b", 1.0, operation)
+            await cache.run("c", 1.0, operation)
+
+        asyncio.run(run())
+        assert len(cache) == 2
+        assert cache.stats.executed == 4
+
+    def test_failed_operation_can_be_retried(self) -> None:
+        """A failure is not cached, so a retry runs the operation again."""
+        from src.services.idempotency import IdempotencyCache
+
+        cache = IdempotencyCache(max_size=10, ttl=60.0)
+        attempts = 0
+
+        async def operation() -> float:
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                raise RuntimeError("backend unavailable")
+            return 3.0
+
+        async def run() -> tuple[float, bool]:
+            with pytest.raises(RuntimeError):
+                await cache.run("k", 3.0, operation)
+            return await cache.run("k", 3.0, operation)
+
+        assert asyncio.run(run()) == (3.0, False)
+        assert attempts == 2
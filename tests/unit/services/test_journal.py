@@ -0,0 +1,105 @@
+"""Unit tests for the memory undo/redo journal."""
+
+from dataclasses import replace
+
+import pytest
+
+
+class TestMemoryJournal:
+    """Tests for journal recording, undo and redo."""
+
+    def test_undo_returns_newest_operation(self) -> None:
+        """Undo pops operations in reverse order."""
+        from src.services.journal import (
+            OP_ADD,
+            OP_SUBTRACT,
+            clear_journal,
+            pop_undo,
+            record_operation,
+        )
+
+        session_id = "test-journal-undo"
+        clear_journal(session_id)
+        record_operation(session_id, OP_ADD, 5.0)
+        record_operation(session_id, OP_SUBTRACT, -2.0)
+        assert pop_undo(session_id) == (OP_SUBTRACT, -2.0)
+        assert pop_undo(session_id) == (OP_ADD, 5.0)
+        assert pop_undo(session_id) is None
+
+    def test_redo_after_undo(self) -> None:
+        """Redo reapplies undone operations and they can be undone again."""
+        from src.services.journal import (
+            OP_ADD,
+            clear_journal,
+            pop_redo,
+            pop_undo,
+            record_operation,
+        )
+
+        session_id = "test-journal-redo"
+        clear_journal(session_id)
+        record_operation(session_id, OP_ADD, 1.0)
+        pop_undo(session_id)
+        assert pop_redo(session_id) == (OP_ADD, 1.0)
+        assert pop_redo(session_id) is None
+        assert pop_undo(session_id) == (OP_ADD, 1.0)
+
+    def test_new_operation_discards_redo(self) -> None:
+        """Recording after an undo empties the redo stack."""
+        from src.services.journal import (
+            OP_ADD,
+            clear_journal,
+            pop_redo,
+            pop_undo,
+            record_operation,
+        )
+
+        session_id = "test-journal-discard"
+        clear_journal(session_id)
+        record_operation(session_id, OP_ADD, 1.0)
+        pop_undo(session_id)
+        record_operation(session_id, OP_ADD, 2.0)
+        assert pop_redo(session_id) is None
+
+    def test_depth_drops_oldest(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Only the newest journal_depth operations can be undone."""
+        from src import config
+        from src.services.journal import (
+            OP_ADD,
+            clear_journal,
+            pop_undo,
+            record_operation,
+        )
+
+        monkeypatch.setattr(
+            config, "settings", replace(config.settings, journal_depth=2)
+        )
+        session_id = "test-journal-depth"
+        clear_journal(session_id)
+        for value in (1.0, 2.0, 3.0):
+            record_operation(session_id, OP_ADD, value)
+        assert pop_undo(session_id) == (OP_ADD, 3.0)
+        assert pop_undo(session_id) == (OP_ADD, 2.0)
+        assert pop_undo(session_id) is None
+
+    def test_zero_depth_disables_journal(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """journal_depth=0 records nothing instead of failing."""
+        from src import config
+        from src.services.journal import OP_ADD, pop_undo, record_operation
+
+        monkeypatch.setattr(
+            config, "settings", replace(config.settings, journal_depth=0)
+        )
+        session_id = "test-journal-off"
+        record_operation(session_id, OP_ADD, 1.0)
+        assert pop_undo(session_id) is None
+
+    def test_journaled_session_is_tracked(self) -> None:
+        """Journaling touches the session so eviction drops the journal."""
+        from src.services.journal import OP_ADD, pop_undo, record_operation
+        from src.services.session import end_session
+
+        session_id = "test-journal-tracked"
+        record_operation(session_id, OP_ADD, 1.0)
+        end_session(session_id)
+        assert pop_undo(session_id) is None
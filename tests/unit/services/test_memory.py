@@ -1,5 +1,9 @@
 """Unit tests for memory service."""
 
+from types import SimpleNamespace
+
+import pytest
+
 
 class TestMemoryService:
     """Tests for memory management functions."""
@@ -43,8 +47,9 @@ class TestMemoryService:
 
         session_id = "test-session-clear"
         add_to_memory(session_id, 100.0)
-        clear_memory(session_id)
+        assert clear_memory(session_id) == 100.0
         assert get_memory(session_id) == 0.0
+        assert clear_memory(session_id) == 0.0
 
     def test_new_session_memory_zero(self) -> None:
         """New session starts with zero memory (AC-B02)."""
@@ -52,3 +57,132 @@ class TestMemoryService:
 
         session_id = "brand-new-session-12345"
         assert get_memory(session_id) == 0.0
+
+    def test_apply_memory_batch_groups_by_session(self) -> None:
+        """Batch folds each session's operations into one final value."""
+        from src.services.memory import apply_memory_batch, clear_memory, get_memory
+
+        clear_memory("test-batch-a")
+        clear_memory("test-batch-b")
+        values = apply_memory_batch(
+            [
+                ("test-batch-a", "add", 10.0),
+                ("test-batch-b", "add", 3.0),
+                ("test-batch-a", "subtract", 4.0),
+                ("test-batch-a", "add", 1.5),
+            ]
+        )
+        assert values == {"test-batch-a": 7.5, "test-batch-b": 3.0}
+        assert get_memory("test-batch-a") == 7.5
+        assert get_memory("test-batch-b") == 3.0
+
+    def test_apply_memory_batch_builds_on_existing_value(self) -> None:
+        """Batch deltas are applied on top of stored memory."""
+        from src.services.memory import add_to_memory, apply_memory_batch, clear_memory
+
+        session_id = "test-batch-existing"
+        clear_memory(session_id)
+        add_to_memory(session_id, 100.0)
+        values = apply_memory_batch([(session_id, "subtract", 25.0)])
+        assert values == {session_id: 75.0}
+
+    def test_memory_store_stats_counts_writes(self) -> None:
+        """Store stats count inserts, updates and deletes."""
+        from src.services.memory import (
+            add_to_memory,
+            clear_memory,
+            memory_store_stats,
+        )
+
+        session_id = "test-store-stats"
+        clear_memory(session_id)
+        before = memory_store_stats()
+        add_to_memory(session_id, 1.0)
+        add_to_memory(session_id, 1.0)
+        clear_memory(session_id)
+        after = memory_store_stats()
+        assert after.inserts - before.inserts == 1
+        assert after.updates - before.updates == 1
+        assert after.deletes - before.deletes == 1
+        assert after.insert_rate >= 0.0
+
+    def test_write_rates_use_shared_fixed_windows(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Rates come from the last full window, whoever asks and how often."""
+        from dataclasses import replace
+
+        from src.services import memory
+
+        clock = SimpleNamespace(monotonic=lambda: 1000.0)
+        monkeypatch.setattr(memory, "time", clock)
+        monkeypatch.setattr(
+            memory,
+            "_rate_window",
+            memory._RateWindow(started=1000.0, base=replace(memory._counters)),
+        )
+        for i in range(20):
+            memory.add_to_memory(f"test-rate-window-{i}", 1.0)
+            memory.clear_memory(f"test-rate-window-{i}")
+
+        clock.monotonic = lambda: 1005.0
+        assert memory.memory_store_stats().insert_rate == 4.0
+        clock.monotonic = lambda: 1010.0
+        assert memory.memory_store_stats().insert_rate == 2.0
+        clock.monotonic = lambda: 1011.0
+        second_caller = memory.memory_store_stats()
+        assert second_caller.insert_rate == 2.0
+        assert second_caller.delete_rate == 2.0
+
+    def test_iter_memory_records_chunks(self) -> None:
+        """Export yields chunks no larger than chunk_size."""
+        from src.services.memory import add_to_memory, iter_memory_records
+
+        for i in range(5):
+            add_to_memory(f"test-export-{i}", float(i))
+        chunks = list(iter_memory_records(chunk_size=2))
+        assert all(len(chunk) <= 2 for chunk in chunks)
+        records = {r[0]: r for chunk in chunks for r in chunk}
+        assert records["test-export-3"] == ("test-export-3", 3.0, None)
+
+    def test_import_memory_records_overwrites(self) -> None:
+        """Import replaces memory and pads registers to the configured size."""
+        from src import config
+        from src.services.memory import (
+            add_to_memory,
+            get_memory,
+            get_registers,
+            import_memory_records,
+        )
+
+        session_id = "test-import"
+        add_to_memory(session_id, 100.0)
+        count = import_memory_records([(session_id, 7.0, [1.0, 2.0])])
+        assert count == 1
+        assert get_memory(session_id) == 7.0
+        registers = get_registers(session_id)
+        assert registers[:3] == [1.0, 2.0, 0.0]
+        assert len(registers) == config.settings.memory_registers
+
+    def test_memory_version_changes_with_every_write(self) -> None:
+        """Versions increase with every write, including clears."""
+        from src.services.memory import (
+            add_to_memory,
+            apply_memory_batch,
+            clear_memory,
+            get_memory_version,
+            subtract_from_memory,
+        )
+
+        session_id = "test-session-version"
+        assert get_memory_version(session_id) == 0
+        versions = []
+        add_to_memory(session_id, 1.0)
+        versions.append(get_memory_version(session_id))
+        subtract_from_memory(session_id, 1.0)
+        versions.append(get_memory_version(session_id))
+        apply_memory_batch([(session_id, "add", 2.0)])
+        versions.append(get_memory_version(session_id))
+        clear_memory(session_id)
+        versions.append(get_memory_version(session_id))
+        assert 0 < versions[0] < versions[1] < versions[2] < versions[3]
@@ -0,0 +1,84 @@
+"""Unit tests for memory backends."""
+
+import asyncio
+import threading
+
+import pytest
+
+
+class TestLocalMemoryBackend:
+    """Tests for LocalMemoryBackend."""
+
+    def test_large_batch_runs_off_the_event_loop(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Batches above the inline limit are applied on a worker thread."""
+        from src.services import memory_backend
+
+        threads: list[int] = []
+
+        def apply(operations: list[tuple[str, str, float]]) -> dict[str, float]:
+            threads.append(threading.get_ident())
+            return {}
+
+        monkeypatch.setattr(memory_backend, "apply_memory_batch", apply)
+        backend = memory_backend.LocalMemoryBackend()
+        small = [("s", "add", 1.0)]
+        large = small * 1000
+
+        async def run() -> int:
+            await backend.apply_batch(small)
+            await backend.apply_batch(large)
+            return threading.get_ident()
+
+        loop_thread = asyncio.run(run())
+        assert threads[0] == loop_thread
+        assert threads[1] != loop_thread
+
+    def test_registers_round_trip(self) -> None:
+        """Register operations reach the in-process register store."""
+        from src.services.memory_backend import LocalMemoryBackend
+
+        backend = LocalMemoryBackend()
+        session_id = "test-backend-registers"
+
+        async def run() -> tuple[float, list[float], float]:
+            await backend.clear_registers(session_id)
+            value = await backend.increment_register(session_id, 3, 2.5)
+            registers = await backend.get_registers(session_id)
+            await backend.clear_registers(session_id)
+            return value, registers, await backend.get_register(session_id, 3)
+
+        value, registers, cleared = asyncio.run(run())
+        assert value == 2.5
+        assert registers[2] == 2.5
+        assert cleared == 0.0
+
+    def test_export_import_round_trip_skips_empty_records(self) -> None:
+        """Records are moved through the backend; empty ones are not applied."""
+        from src.services.memory_backend import LocalMemoryBackend
+        from src.services.session import active_session_count
+
+        backend = LocalMemoryBackend()
+        session_id = "test-backend-export"
+        empty_id = "test-backend-export-empty"
+
+        async def run() -> tuple[list[tuple[str, float | None]], int]:
+            await backend.increment(session_id, 4.0)
+            exported = [
+                (record[0], record[1])
+                async for chunk in backend.export_records(100)
+                for record in chunk
+                if record[0] == session_id
+            ]
+            sessions = active_session_count()
+            imported = await backend.import_records(
+                [(session_id, 6.0, None), (empty_id, None, None)]
+            )
+            assert active_session_count() == sessions
+            assert await backend.get(session_id) == 6.0
+            return exported, imported
+
+        exported, imported = asyncio.run(run())
+        assert exported == [(session_id, 4.0)]
+        assert imported == 1
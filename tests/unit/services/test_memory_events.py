@@ -0,0 +1,179 @@
+"""Unit tests for memory change fan-out."""
+
+import asyncio
+import threading
+from collections.abc import Callable
+
+
+class TestMemoryEventBroker:
+    """Tests for MemoryEventBroker and Subscription."""
+
+    def test_change_reaches_every_session_subscriber(self) -> None:
+        """One change is delivered to all subscribers of its session only."""
+        from src.services.memory_events import MemoryEventBroker
+
+        broker = MemoryEventBroker()
+
+        async def run() -> list[list[tuple[int, float]]]:
+            first = broker.subscribe("s1")
+            second = broker.subscribe("s1")
+            other = broker.subscribe("s2")
+            broker.publish("s1", 5.0, 7)
+            return [
+                await first.next_events(1.0),
+                await second.next_events(1.0),
+                await other.next_events(0.01),
+            ]
+
+        assert asyncio.run(run()) == [[(7, 5.0)], [(7, 5.0)], []]
+        assert broker.stats().published == 1
+
+    def test_full_queue_drops_oldest(self) -> None:
+        """A slow subscriber keeps only the newest events."""
+        from src.services.memory_events import MemoryEventBroker
+
+        broker = MemoryEventBroker()
+
+        async def run() -> list[tuple[int, float]]:
+            subscription = broker.subscribe("s", max_queue=2)
+            for version in range(1, 5):
+                broker.publish("s", float(version), version)
+            return await subscription.next_events(1.0)
+
+        assert asyncio.run(run()) == [(3, 3.0), (4, 4.0)]
+        assert broker.stats().dropped == 2
+
+    def test_change_from_worker_thread_wakes_loop(self) -> None:
+        """Changes made off the event loop are handed over thread-safely."""
+        from src.services.memory_events import MemoryEventBroker
+
+        broker = MemoryEventBroker()
+
+        async def run() -> list[tuple[int, float]]:
+            subscription = broker.subscribe("s")
+            thread = threading.Thread(target=broker.publish, args=("s", 1.5, 3))
+            thread.start()
+            events = await subscription.next_events(5.0)
+            thread.join()
+            return events
+
+        assert asyncio.run(run()) == [(3, 1.5)]
+
+    def test_unsubscribe_stops_delivery(self) -> None:
+        """Unsubscribed sessions are forgotten by the broker."""
+        from src.services.memory_events import MemoryEventBroker
+
+        broker = MemoryEventBroker()
+
+        async def run() -> None:
+            subscription = broker.subscribe("s")
+            broker.unsubscribe(subscription)
+            broker.publish("s", 1.0, 1)
+
+        asyncio.run(run())
+        stats = broker.stats()
+        assert (stats.sessions, stats.subscribers, stats.published) == (0, 0, 0)
+
+    def test_memory_service_publishes_changes(self) -> None:
+        """add, subtract and clear all notify the module broker."""
+        from src.services.memory import (
+            add_to_memory,
+            clear_memory,
+            subtract_from_memory,
+        )
+        from src.services.memory_events import broker
+
+        session_id = "test-session-events"
+
+        async def run() -> list[float]:
+            subscription = broker.subscribe(session_id)
+            try:
+                add_to_memory(session_id, 2.0)
+                subtract_from_memory(session_id, 0.5)
+                clear_memory(session_id)
+                events = await subscription.next_events(1.0)
+            finally:
+                broker.unsubscribe(subscription)
+            return [value for _, value in events]
+
+        assert asyncio.run(run()) == [2.0, 1.5, 0.0]
+
+    def test_out_of_order_event_is_dropped(self) -> None:
+        """An event that lost a race with a newer one is never delivered."""
+        from src.services.memory_events import MemoryEventBroker
+
+        broker = MemoryEventBroker()
+
+        async def run() -> list[list[tuple[int, float]]]:
+            subscription = broker.subscribe("s")
+            broker.publish("s", 2.0, 5)
+            broker.publish("s", 1.0, 4)
+            first = await subscription.next_events(1.0)
+            broker.publish("s", 1.0, 4)
+            broker.publish("s", 3.0, 6)
+            return [first, await subscription.next_events(1.0)]
+
+        assert asyncio.run(run()) == [[(5, 2.0)], [(6, 3.0)]]
+
+    def test_clear_and_eviction_ids_keep_increasing(self) -> None:
+        """Clearing or evicting a session never reuses an earlier version."""
+        from src.services.memory import add_to_memory, clear_memory
+        from src.services.memory_events import broker
+        from src.services.session import end_session
+
+        session_id = "test-session-event-ids"
+
+        async def run() -> list[int]:
+            subscription = broker.subscribe(session_id)
+            try:
+                add_to_memory(session_id, 1.0)
+                clear_memory(session_id)
+                add_to_memory(session_id, 2.0)
+                end_session(session_id)
+                add_to_memory(session_id, 3.0)
+                events = await subscription.next_events(1.0)
+            finally:
+                broker.unsubscribe(subscription)
+                clear_memory(session_id)
+            return [version for version, _ in events]
+
+        versions = asyncio.run(run())
+        assert len(versions) == 5
+        assert versions == sorted(set(versions))
+
+    def test_changes_follow_the_active_backend(self) -> None:
+        """Changes reported by a replacement backend reach the broker."""
+        from src.services.memory_backend import (
+            ChangeListener,
+            LocalMemoryBackend,
+            get_backend,
+            set_backend,
+        )
+        from src.services.memory_events import broker
+
+        class RemoteBackend(LocalMemoryBackend):
+            def __init__(self) -> None:
+                self.listeners: list[ChangeListener] = []
+
+            def subscribe(self, listener: ChangeListener) -> Callable[[], None]:
+                self.listeners.append(listener)
+                return lambda: self.listeners.remove(listener)
+
+        remote = RemoteBackend()
+        original = get_backend()
+
+        async def run() -> list[tuple[int, float]]:
+            subscription = broker.subscribe("test-session-remote")
+            try:
+                for listener in remote.listeners:
+                    listener("test-session-remote", 9.0, 1)
+                return await subscription.next_events(1.0)
+            finally:
+                broker.unsubscribe(subscription)
+
+        set_backend(remote)
+        try:
+            assert asyncio.run(run()) == [(1, 9.0)]
+        finally:
+            set_backend(original)
+        assert remote.listeners == []
@@ -0,0 +1,89 @@
+"""Unit tests for multi-register memory."""
+
+from dataclasses import replace
+
+import pytest
+
+
+class TestMemoryRegisters:
+    """Tests for M1..Mn register functions."""
+
+    def test_add_and_subtract_register(self) -> None:
+        """Registers accumulate independently of each other."""
+        from src.services.memory import (
+            add_to_register,
+            clear_registers,
+            get_register,
+            subtract_from_register,
+        )
+
+        session_id = "test-registers-add"
+        clear_registers(session_id)
+        add_to_register(session_id, 1, 10.0)
+        add_to_register(session_id, 2, 3.0)
+        subtract_from_register(session_id, 1, 4.0)
+        assert get_register(session_id, 1) == 6.0
+        assert get_register(session_id, 2) == 3.0
+
+    def test_registers_independent_of_main_memory(self) -> None:
+        """Register writes do not touch the main memory value."""
+        from src.services.memory import (
+            add_to_register,
+            clear_memory,
+            clear_registers,
+            get_memory,
+        )
+
+        session_id = "test-registers-main"
+        clear_memory(session_id)
+        clear_registers(session_id)
+        add_to_register(session_id, 1, 5.0)
+        assert get_memory(session_id) == 0.0
+
+    def test_get_registers_returns_all(self) -> None:
+        """Bulk recall returns every register in order."""
+        from src import config
+        from src.services.memory import add_to_register, clear_registers, get_registers
+
+        session_id = "test-registers-bulk"
+        clear_registers(session_id)
+        assert get_registers(session_id) == [0.0] * config.settings.memory_registers
+        add_to_register(session_id, 3, 7.5)
+        values = get_registers(session_id)
+        assert len(values) == config.settings.memory_registers
+        assert values[2] == 7.5
+
+    def test_clear_registers(self) -> None:
+        """Clearing resets every register to zero."""
+        from src.services.memory import add_to_register, clear_registers, get_register
+
+        session_id = "test-registers-clear"
+        add_to_register(session_id, 1, 9.0)
+        clear_registers(session_id)
+        assert get_register(session_id, 1) == 0.0
+
+    @pytest.mark.parametrize("index", [0, -1, 9])
+    def test_invalid_register_raises(self, index: int) -> None:
+        """Index outside 1..n raises InvalidRegisterError."""
+        from src.exceptions import InvalidRegisterError
+        from src.services.memory import add_to_register
+
+        with pytest.raises(InvalidRegisterError):
+            add_to_register("test-registers-invalid", index, 1.0)
+
+    def test_register_cap_is_configurable(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Per-session register count follows settings."""
+        from src import config
+        from src.exceptions import InvalidRegisterError
+        from src.services.memory import add_to_register, get_registers
+
+        monkeypatch.setattr(
+            config, "settings", replace(config.settings, memory_registers=2)
+        )
+        session_id = "test-registers-cap"
+        add_to_register(session_id, 2, 1.0)
+        assert get_registers(session_id) == [0.0, 1.0]
+        with pytest.raises(InvalidRegisterError):
+            add_to_register(session_id, 3, 1.0)
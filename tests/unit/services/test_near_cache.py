@@ -0,0 +1,207 @@
+"""Unit tests for the memory recall near-cache."""
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import replace
+
+import pytest
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingBackend:
+    """In-memory backend that counts recall round-trips."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, float] = {}
+        self.versions: dict[str, int] = {}
+        self.gets = 0
+        self.listeners: list[Callable[[str, float, int], None]] = []
+
+    async def get(self, session_id: str) -> float:
+        self.gets += 1
+        return self.values.get(session_id, 0.0)
+
+    async def version(self, session_id: str) -> int:
+        return self.versions.get(session_id, 0)
+
+    async def recall(self, session_id: str) -> tuple[float, int]:
+        self.gets += 1
+        return self.values.get(session_id, 0.0), self.versions.get(session_id, 0)
+
+    async def increment(self, session_id: str, delta: float) -> float:
+        self.values[session_id] = self.values.get(session_id, 0.0) + delta
+        self.versions[session_id] = self.versions.get(session_id, 0) + 1
+        return self.values[session_id]
+
+    def subscribe(
+        self, listener: Callable[[str, float, int], None]
+    ) -> Callable[[], None]:
+        self.listeners.append(listener)
+        return lambda: self.listeners.remove(listener)
+
+    def remote_write(self, session_id: str, value: float) -> None:
+        """Simulate another worker's write and its change notification."""
+        self.values[session_id] = value
+        self.versions[session_id] = self.versions.get(session_id, 0) + 1
+        for listener in self.listeners:
+            listener(session_id, value, self.versions[session_id])
+
+    async def clear(self, session_id: str) -> float:
+        return self.values.pop(session_id, 0.0)
+
+
+class TestRecallNearCache:
+    """Tests for RecallNearCache."""
+
+    def test_repeat_recall_is_served_from_cache(self) -> None:
+        """Second recall within the TTL does not reach the backend."""
+        from src.services.near_cache import RecallNearCache
+
+        backend = CountingBackend()
+        backend.values["s"] = 3.0
+        clock = FakeClock()
+        cache = RecallNearCache(backend, max_size=10, ttl=1.0, clock=clock)
+
+        assert asyncio.run(cache.get("s")) == 3.0
+        clock.now = 0.5
+        assert asyncio.run(cache.get("s")) == 3.0
+        assert backend.gets == 1
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.hit_ratio == 0.5
+        assert cache.stats.served_age_max == 0.5
+
+    def test_entry_expires_after_ttl(self) -> None:
+        """Recall after the TTL goes back to the backend."""
+        from src.services.near_cache import RecallNearCache
+
+        backend = CountingBackend()
+        clock = FakeClock()
+        cache = RecallNearCache(backend, max_size=10, ttl=1.0, clock=clock)
+
+        asyncio.run(cache.get("s"))
+        backend.values["s"] = 9.0
+        clock.now = 1.0
+        assert asyncio.run(cache.get("s")) == 9.0
+        assert cache.stats.expired == 1
+
+    def test_local_write_invalidates(self) -> None:
+        """Writes through the cache are visible on the next recall."""
+        from src.services.near_cache import RecallNearCache
+
+        backend = CountingBackend()
+        cache = RecallNearCache(backend, max_size=10, ttl=60.0, clock=FakeClock())
+
+        async def run() -> float:
+            await cache.get("s")
+            await cache.increment("s", 5.0)
+            return await cache.get("s")
+
+        assert asyncio.run(run()) == 5.0
+        assert cache.stats.invalidations == 1
+
+    def test_remote_invalidation(self) -> None:
+        """invalidate() drops the entry written by another worker."""
+        from src.services.near_cache import RecallNearCache
+
+        backend = CountingBackend()
+        cache = RecallNearCache(backend, max_size=10, ttl=60.0, clock=FakeClock())
+
+        asyncio.run(cache.get("s"))
+        backend.values["s"] = 2.0
+        cache.invalidate("s")
+        assert asyncio.run(cache.get("s")) == 2.0
+
+    def test_fill_racing_invalidation_is_not_cached(self) -> None:
+        """A recall that overlaps an invalidation does not store its value."""
+        from src.services.near_cache import RecallNearCache
+
+        class SlowBackend(CountingBackend):
+            async def recall(self, session_id: str) -> tuple[float, int]:
+                entry = await super().recall(session_id)
+                cache.invalidate(session_id)
+                return entry
+
+        backend = SlowBackend()
+        cache = RecallNearCache(backend, max_size=10, ttl=60.0, clock=FakeClock())
+        asyncio.run(cache.get("s"))
+        assert len(cache) == 0
+
+    def test_size_is_bounded(self) -> None:
+        """Least recently used entries are evicted beyond max_size."""
+        from src.services.near_cache import RecallNearCache
+
+        cache = RecallNearCache(
+            CountingBackend(), max_size=2, ttl=60.0, clock=FakeClock()
+        )
+
+        async def run() -> None:
+            for session_id in ("a", "b", "a", "c"):
+                await cache.get(session_id)
+
+        asyncio.run(run())
+        assert len(cache) == 2
+        assert cache.stats.evictions == 1
+
+    def test_remote_write_invalidates_through_change_feed(self) -> None:
+        """Changes announced by the backend drop the cached entry."""
+        from src.services.near_cache import RecallNearCache
+
+        backend = CountingBackend()
+        cache = RecallNearCache(backend, max_size=10, ttl=60.0, clock=FakeClock())
+
+        asyncio.run(cache.get("s"))
+        backend.remote_write("s", 7.0)
+        assert asyncio.run(cache.get("s")) == 7.0
+        assert cache.stats.invalidations == 1
+        cache.close()
+        assert backend.listeners == []
+
+    def test_version_is_served_with_its_value(self) -> None:
+        """A cached value is never labelled with a newer version."""
+        from src.services.near_cache import RecallNearCache
+
+        backend = CountingBackend()
+        cache = RecallNearCache(backend, max_size=10, ttl=60.0, clock=FakeClock())
+
+        async def run() -> tuple[int, float]:
+            await cache.get("s")
+            # A write whose notification has not arrived yet.
+            backend.values["s"] = 5.0
+            backend.versions["s"] = 1
+            return await cache.version("s"), await cache.get("s")
+
+        assert asyncio.run(run()) == (0, 0.0)
+
+    def test_enabled_by_settings(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """layered_backend adds the near-cache when configured."""
+        from src import config
+        from src.services.memory_backend import LocalMemoryBackend, layered_backend
+        from src.services.near_cache import RecallNearCache
+
+        monkeypatch.setattr(
+            config, "settings", replace(config.settings, memory_near_cache=True)
+        )
+        layered = layered_backend(LocalMemoryBackend())
+        assert isinstance(layered, RecallNearCache)
+        layered.close()
+
+    def test_cold_recall_counts_one_miss(self) -> None:
+        """recall() answers value and version with a single lookup."""
+        from src.services.near_cache import RecallNearCache
+
+        backend = CountingBackend()
+        backend.values["s"] = 4.0
+        backend.versions["s"] = 2
+        cache = RecallNearCache(backend, max_size=10, ttl=60.0, clock=FakeClock())
+        assert asyncio.run(cache.recall("s")) == (4.0, 2)
+        assert (cache.stats.hits, cache.stats.misses) == (0, 1)
@@ -0,0 +1,76 @@
+"""Unit tests for session lifecycle management."""
+
+from dataclasses import replace
+
+import pytest
+
+
+class TestSessionLifecycle:
+    """Tests for session tracking and eviction."""
+
+    def test_issue_session_id_is_unique(self) -> None:
+        """Issued session ids do not repeat."""
+        from src.services.session import issue_session_id
+
+        assert issue_session_id() != issue_session_id()
+
+    def test_eviction_over_max_drops_memory(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Least recently written sessions are evicted beyond session_max."""
+        from src import config
+        from src.services.memory import add_to_memory, add_to_register, get_memory
+        from src.services.session import active_session_count
+
+        add_to_memory("test-evict-a", 1.0)
+        add_to_register("test-evict-a", 1, 1.0)
+        monkeypatch.setattr(config, "settings", replace(config.settings, session_max=1))
+        add_to_memory("test-evict-b", 2.0)
+
+        assert active_session_count() == 1
+        assert get_memory("test-evict-b") == 2.0
+        assert get_memory("test-evict-a") == 0.0
+
+    def test_idle_sessions_are_swept(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Sessions idle past session_idle_ttl_s are evicted on the next write."""
+        from src import config
+        from src.services import session
+        from src.services.memory import add_to_memory, get_memory
+
+        now = [1_000_000.0]
+        monkeypatch.setattr(session.time, "monotonic", lambda: now[0])
+        monkeypatch.setattr(
+            config, "settings", replace(config.settings, session_idle_ttl_s=10.0)
+        )
+        add_to_memory("test-idle-old", 5.0)
+        now[0] += 11.0
+        add_to_memory("test-idle-new", 1.0)
+
+        assert get_memory("test-idle-old") == 0.0
+        assert get_memory("test-idle-new") == 1.0
+
+    def test_end_session_drops_state(self) -> None:
+        """end_session removes every store's entry for the session."""
+        from src.services.memory import add_to_memory, get_memory
+        from src.services.session import end_session
+
+        add_to_memory("test-end-session", 3.0)
+        end_session("test-end-session")
+        assert get_memory("test-end-session") == 0.0
+
+    def test_session_stats_age_distribution(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Session ages are bucketed by creation minute."""
+        from src.services import session
+        from src.services.memory import add_to_memory
+
+        now = [2_000_000.0]
+        monkeypatch.setattr(session.time, "monotonic", lambda: now[0])
+        add_to_memory("test-age-bucket", 1.0)
+        now[0] += 10 * 60
+        before = session.session_stats().age_distribution
+        session.end_session("test-age-bucket")
+        after = session.session_stats().age_distribution
+        assert before["lt_15m"] - after["lt_15m"] == 1
+        assert sum(before.values()) - sum(after.values()) == 1
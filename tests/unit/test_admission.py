@@ -0,0 +1,212 @@
+"""Unit tests for admission control."""
+
+import asyncio
+from dataclasses import replace
+
+import pytest
+from starlette.types import Receive, Scope, Send
+
+
+@pytest.fixture
+def tight_limits(monkeypatch: pytest.MonkeyPatch) -> None:
+    """One request per class, one queued, short queue timeout."""
+    from src import config
+
+    monkeypatch.setattr(
+        config,
+        "settings",
+        replace(
+            config.settings,
+            admission_max_in_flight=1,
+            admission_max_queue=1,
+            admission_queue_timeout_ms=20.0,
+            admission_limits="memory=2",
+        ),
+    )
+
+
+class TestAdmissionController:
+    """Tests for AdmissionController."""
+
+    def test_parse_limits(self) -> None:
+        """class=limit pairs are parsed, blanks ignored."""
+        from src.admission import parse_limits
+
+        assert parse_limits("calculate=64, memory=8,") == {
+            "calculate": 64,
+            "memory": 8,
+        }
+        assert parse_limits("") == {}
+
+    def test_route_class_is_first_segment(self) -> None:
+        """Route class is the first path segment."""
+        from src.admission import route_class
+
+        assert route_class("/memory/registers/1/add") == "memory"
+        assert route_class("/calculate") == "calculate"
+        assert route_class("/memory/events") == "memory-events"
+
+    def test_unknown_paths_share_one_class(self) -> None:
+        """Paths outside the known prefixes never create their own class."""
+        from src.admission import UNMATCHED, route_class
+
+        assert route_class("/wp-admin/setup.php") == UNMATCHED
+        assert route_class("/") == UNMATCHED
+        assert route_class("/calculator") == UNMATCHED
+
+    @pytest.mark.usefixtures("tight_limits")
+    def test_queue_timeout_sheds(self) -> None:
+        """A request waiting past the queue timeout is shed."""
+        from src.admission import AdmissionController
+
+        controller = AdmissionController()
+
+        async def run() -> tuple[bool, bool]:
+            first = await controller.acquire("calculate")
+            second = await controller.acquire("calculate")
+            return first, second
+
+        assert asyncio.run(run()) == (True, False)
+        stats = controller.stats()["calculate"]
+        assert stats.shed == 1
+        assert stats.in_flight == 1
+
+    @pytest.mark.usefixtures("tight_limits")
+    def test_full_queue_sheds_immediately(self) -> None:
+        """Requests beyond the queue length are shed without waiting."""
+        from src.admission import AdmissionController
+
+        controller = AdmissionController()
+
+        async def run() -> list[bool]:
+            await controller.acquire("calculate")
+            queued = asyncio.ensure_future(controller.acquire("calculate"))
+            await asyncio.sleep(0)
+            rejected = await controller.acquire("calculate")
+            controller.release("calculate")
+            return [await queued, rejected]
+
+        assert asyncio.run(run()) == [True, False]
+
+    @pytest.mark.usefixtures("tight_limits")
+    def test_release_hands_slot_to_waiter(self) -> None:
+        """Releasing a slot admits the oldest queued request."""
+        from src.admission import AdmissionController
+
+        controller = AdmissionController()
+
+        async def run() -> bool:
+            await controller.acquire("calculate")
+            waiter = asyncio.ensure_future(controller.acquire("calculate"))
+            await asyncio.sleep(0)
+            controller.release("calculate")
+            return await waiter
+
+        assert asyncio.run(run()) is True
+        stats = controller.stats()["calculate"]
+        assert stats.in_flight == 1
+        assert stats.admitted == 2
+
+    @pytest.mark.usefixtures("tight_limits")
+    def test_cancel_after_handoff_releases_slot(self) -> None:
+        """A waiter cancelled after being handed a slot passes it on."""
+        from src.admission import AdmissionController
+
+        controller = AdmissionController()
+
+        async def run() -> bool:
+            await controller.acquire("calculate")
+            cancelled = asyncio.ensure_future(controller.acquire("calculate"))
+            await asyncio.sleep(0)
+            controller.release("calculate")
+            cancelled.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await cancelled
+            return await controller.acquire("calculate")
+
+        assert asyncio.run(run()) is True
+        stats = controller.stats()["calculate"]
+        assert (stats.in_flight, stats.queued) == (1, 0)
+
+    @pytest.mark.usefixtures("tight_limits")
+    def test_cancelled_waiter_leaves_queue(self) -> None:
+        """A waiter cancelled before its turn is removed from the queue."""
+        from src.admission import AdmissionController
+
+        controller = AdmissionController()
+
+        async def run() -> None:
+            await controller.acquire("calculate")
+            cancelled = asyncio.ensure_future(controller.acquire("calculate"))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await cancelled
+
+        asyncio.run(run())
+        stats = controller.stats()["calculate"]
+        assert (stats.in_flight, stats.queued) == (1, 0)
+
+    @pytest.mark.usefixtures("tight_limits")
+    def test_per_class_limit_override(self) -> None:
+        """admission_limits overrides the default for a class."""
+        from src.admission import AdmissionController
+
+        controller = AdmissionController()
+
+        async def run() -> list[bool]:
+            return [await controller.acquire("memory") for _ in range(2)]
+
+        assert asyncio.run(run()) == [True, True]
+        assert controller.stats()["memory"].limit == 2
+
+
+class TestAdmissionMiddleware:
+    """Tests for AdmissionMiddleware."""
+
+    @pytest.mark.usefixtures("tight_limits")
+    def test_overload_returns_503_and_health_is_exempt(self) -> None:
+        """Shed requests get 503 with Retry-After; /health is never shed."""
+        from src.admission import AdmissionController, AdmissionMiddleware
+
+        release = asyncio.Event()
+
+        async def slow_app(scope: Scope, receive: Receive, send: Send) -> None:
+            if scope["path"] == "/calculate":
+                await release.wait()
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"ok"})
+
+        middleware = AdmissionMiddleware(slow_app, AdmissionController())
+
+        async def request(path: str) -> tuple[int, dict[bytes, bytes]]:
+            result: dict[str, object] = {}
+
+            async def receive() -> dict[str, object]:
+                return {"type": "http.request", "body": b"", "more_body": False}
+
+            async def send(message: dict[str, object]) -> None:
+                if message["type"] == "http.response.start":
+                    result.update(message)
+
+            scope = {"type": "http", "path": path, "method": "POST", "headers": []}
+            await middleware(scope, receive, send)  # type: ignore[arg-type]
+            headers = dict(result["headers"])  # type: ignore[call-overload]
+            return result["status"], headers  # type: ignore[return-value]
+
+        async def run() -> list[tuple[int, dict[bytes, bytes]]]:
+            running = asyncio.ensure_future(request("/calculate"))
+            await asyncio.sleep(0)
+            queued = asyncio.ensure_future(request("/calculate"))
+            await asyncio.sleep(0)
+            shed = await request("/calculate")
+            health = await request("/health")
+            release.set()
+            return [await running, await queued, shed, health]
+
+        running, queued, shed, health = asyncio.run(run())
+        assert running[0] == 200
+        assert queued[0] == 200
+        assert shed[0] == 503
+        assert shed[1][b"retry-after"] == b"1"
+        assert health[0] == 200
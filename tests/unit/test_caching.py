@@ -0,0 +1,49 @@
+"""Unit tests for HTTP validator helpers."""
+
+import pytest
+
+
+class TestEtagMatches:
+    """Tests for etag_matches."""
+
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [
+            (None, False),
+            ('"abc"', True),
+            ('W/"abc"', True),
+            ('"xyz", "abc"', True),
+            ('"xyz"', False),
+            ("*", True),
+        ],
+    )
+    def test_if_none_match(self, header: str | None, expected: bool) -> None:
+        """If-None-Match uses weak comparison and supports lists and *."""
+        from src.caching import etag_matches
+
+        assert etag_matches(header, '"abc"') is expected
+
+
+class TestAcceptsEncoding:
+    """Tests for accepts_encoding."""
+
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [
+            (None, False),
+            ("gzip", True),
+            ("br, gzip;q=0.5", True),
+            ("gzip;q=0", False),
+            ("*", True),
+            ("br", False),
+            ("*;q=0, gzip", True),
+            ("*, gzip;q=0", False),
+            ("br, *;q=0.1", True),
+            ("GZIP; Q=0", False),
+        ],
+    )
+    def test_accept_encoding(self, header: str | None, expected: bool) -> None:
+        """Codings listed with non-zero quality are accepted."""
+        from src.caching import accepts_encoding
+
+        assert accepts_encoding(header, "gzip") is expected
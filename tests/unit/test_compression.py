@@ -0,0 +1,125 @@
+"""Unit tests for response compression."""
+
+import asyncio
+import gzip
+import zlib
+from dataclasses import replace
+
+import pytest
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+def _app(
+    chunks: list[bytes],
+    content_type: bytes = b"application/json",
+    extra_headers: list[tuple[bytes, bytes]] | None = None,
+) -> ASGIApp:
+    """ASGI app sending the given body chunks."""
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        headers = [(b"content-type", content_type), *(extra_headers or [])]
+        if len(chunks) == 1:
+            headers.append((b"content-length", str(len(chunks[0])).encode()))
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        for index, chunk in enumerate(chunks):
+            more = index < len(chunks) - 1
+            await send({"type": "http.response.body", "body": chunk, "more_body": more})
+
+    return app
+
+
+def _call(
+    app: ASGIApp, path: str = "/memory/batch", accept: bytes = b"gzip"
+) -> tuple[dict[bytes, bytes], list[bytes]]:
+    """Run one request through CompressionMiddleware."""
+    from src.compression import CompressionMiddleware
+
+    middleware = CompressionMiddleware(app)
+    messages: list[Message] = []
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    scope = {"type": "http", "path": path, "headers": [(b"accept-encoding", accept)]}
+    asyncio.run(middleware(scope, receive, send))
+    headers = {name.lower(): value for name, value in messages[0]["headers"]}
+    return headers, [message["body"] for message in messages[1:]]
+
+
+BODY = b'{"values": [' + b", ".join(b"1234.5" for _ in range(500)) + b"]}"
+
+
+class TestCompressionMiddleware:
+    """Tests for CompressionMiddleware."""
+
+    def test_large_body_is_gzipped(self) -> None:
+        """Bodies over the threshold are compressed with a valid length."""
+        headers, bodies = _call(_app([BODY]))
+        assert headers[b"content-encoding"] == b"gzip"
+        assert headers[b"vary"] == b"Accept-Encoding"
+        assert int(headers[b"content-length"]) == len(bodies[0])
+        assert gzip.decompress(bodies[0]) == BODY
+
+    def test_small_body_is_not_compressed(self) -> None:
+        """Bodies below the threshold are sent unchanged."""
+        body = b'{"result":3.0,"expression":"1.0 + 2.0 = 3.0"}'
+        headers, bodies = _call(_app([body]), path="/calculate")
+        assert b"content-encoding" not in headers
+        assert bodies == [body]
+
+    def test_stream_is_compressed_incrementally(self) -> None:
+        """Each streamed chunk is flushed as decodable output."""
+        chunks = [b'{"n": %d}\n' % n * 50 for n in range(3)]
+        headers, bodies = _call(_app(chunks, b"application/x-ndjson"))
+        assert headers[b"content-encoding"] == b"gzip"
+        assert b"content-length" not in headers
+        assert len(bodies) == 3
+        decoder = zlib.decompressobj(31)
+        assert decoder.decompress(bodies[0]) == chunks[0]
+        assert gzip.decompress(b"".join(bodies)) == b"".join(chunks)
+
+    def test_existing_encoding_and_event_streams_pass_through(self) -> None:
+        """Pre-encoded responses and SSE are never recompressed."""
+        encoded = _app([BODY], extra_headers=[(b"content-encoding", b"gzip")])
+        assert _call(encoded)[1] == [BODY]
+        events = _app([BODY], b"text/event-stream")
+        assert b"content-encoding" not in _call(events)[0]
+
+    def test_unsupported_coding_and_strong_etag(self) -> None:
+        """Unacceptable codings pass through; compressed ETags become weak."""
+        headers, bodies = _call(_app([BODY]), accept=b"gzip;q=0, identity")
+        assert b"content-encoding" not in headers
+        assert bodies == [BODY]
+        tagged = _app([BODY], extra_headers=[(b"etag", b'"abc"')])
+        assert _call(tagged)[0][b"etag"] == b'W/"abc"'
+
+    def test_route_level_overrides(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Longest matching prefix sets the level; 0 disables compression."""
+        from src import config
+        from src.compression import route_level
+
+        monkeypatch.setattr(
+            config,
+            "settings",
+            replace(config.settings, compression_levels="memory=0,memory/batch=9"),
+        )
+        assert route_level("/memory/batch") == 9
+        assert route_level("/memory/add") == 0
+        assert route_level("/admin/memory/export") == config.settings.compression_level
+        headers, bodies = _call(_app([BODY]), path="/memory/add")
+        assert b"content-encoding" not in headers
+
+    def test_negotiate_skips_missing_codecs(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Codecs whose optional package is missing fall back to gzip."""
+        from src import compression
+
+        monkeypatch.setattr(compression, "optional_module", lambda name: None)
+        negotiated = compression.negotiate("zstd, br, gzip", 6)
+        assert negotiated is not None
+        assert negotiated[0] == "gzip"
+        assert compression.negotiate("identity", 6) is None
@@ -0,0 +1,40 @@
+"""Unit tests for settings loading."""
+
+import pytest
+
+
+class TestSettingsFromEnv:
+    """Tests for Settings.from_env."""
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"), [("1", True), ("true", True), ("0", False), ("no", False)]
+    )
+    def test_bool_settings(
+        self, monkeypatch: pytest.MonkeyPatch, raw: str, expected: bool
+    ) -> None:
+        """Boolean settings parse common true/false spellings."""
+        from src.config import Settings
+
+        monkeypatch.setenv("CALC_FAST_LANE", raw)
+        assert Settings.from_env().fast_lane is expected
+
+    def test_float_settings(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Float settings are converted from their string value."""
+        from src.config import Settings
+
+        monkeypatch.setenv("CALC_NEAR_CACHE_TTL_MS", "12.5")
+        assert Settings.from_env().near_cache_ttl_ms == 12.5
+
+    def test_history_size(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """CALC_HISTORY_SIZE sets the history ring capacity."""
+        from src.config import Settings
+
+        monkeypatch.setenv("CALC_HISTORY_SIZE", "7")
+        assert Settings.from_env().history_size == 7
+
+    def test_journal_depth(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """CALC_JOURNAL_DEPTH sets the undo journal depth."""
+        from src.config import Settings
+
+        monkeypatch.setenv("CALC_JOURNAL_DEPTH", "4")
+        assert Settings.from_env().journal_depth == 4
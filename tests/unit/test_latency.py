@@ -0,0 +1,103 @@
+"""Unit tests for HDR latency histograms and rolling SLO tracking."""
+
+import random
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram."""
+
+    def test_percentiles_within_precision(self) -> None:
+        """Percentiles are within 1% of the exact values, never below."""
+        from src.latency import LatencyHistogram
+
+        rng = random.Random(1)
+        values = sorted(rng.randint(1, 500_000) for _ in range(20_000))
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+        for percentile, reported in histogram.percentiles(
+            (50.0, 90.0, 99.0, 99.9)
+        ).items():
+            exact = values[-(-len(values) * int(percentile * 10) // 1000) - 1]
+            assert exact <= reported <= exact * 1.01
+
+    def test_empty_histogram_reports_zero(self) -> None:
+        """An empty histogram reports 0 for every percentile."""
+        from src.latency import LatencyHistogram
+
+        assert LatencyHistogram().percentiles((50.0, 99.0)) == {50.0: 0, 99.0: 0}
+
+    def test_values_beyond_range_are_clamped(self) -> None:
+        """Huge latencies are recorded at the maximum, keeping memory fixed."""
+        from src.latency import MAX_MICROS, LatencyHistogram
+
+        histogram = LatencyHistogram()
+        size = len(histogram.counts)
+        histogram.record(10**12)
+        assert len(histogram.counts) == size
+        assert histogram.percentiles((100.0,))[100.0] == MAX_MICROS
+
+    def test_merge_and_serialization(self) -> None:
+        """Merged or deserialized histograms match recording everything once."""
+        from src.latency import LatencyHistogram
+
+        first, second, combined = (LatencyHistogram() for _ in range(3))
+        for value in range(1, 1000):
+            (first if value % 2 else second).record(value)
+            combined.record(value)
+        first.merge(LatencyHistogram.from_bytes(second.to_bytes()))
+        assert first.counts == combined.counts
+        assert first.total == combined.total
+        assert first.percentiles((50.0, 99.0)) == combined.percentiles((50.0, 99.0))
+
+    def test_count_above(self) -> None:
+        """count_above counts values beyond a threshold's slot."""
+        from src.latency import LatencyHistogram
+
+        histogram = LatencyHistogram()
+        for value in (10, 20, 50_000, 200_000):
+            histogram.record(value)
+        assert histogram.count_above(100_000) == 1
+        assert histogram.count_above(1_000) == 2
+
+
+class TestRollingLatency:
+    """Tests for RollingLatency."""
+
+    def test_window_drops_old_slices(self) -> None:
+        """Samples older than the window stop contributing."""
+        from src.latency import RollingLatency
+
+        clock = FakeClock()
+        rolling = RollingLatency(window=60.0, slices=6, slos=[], clock=clock)
+        rolling.record("/calculate", 0.001)
+        clock.now = 30.0
+        rolling.record("/calculate", 0.002)
+        assert rolling.snapshot()["/calculate"].total == 2
+        clock.now = 65.0
+        assert rolling.snapshot()["/calculate"].total == 1
+        clock.now = 125.0
+        assert rolling.snapshot() == {}
+
+    def test_slo_breaches_use_route_prefix(self) -> None:
+        """Requests over their budget are counted against the covering SLO."""
+        from src.latency import SLO, RollingLatency, parse_slos
+
+        slos = parse_slos("AC-P01:/calculate=100,AC-P02:/memory=50")
+        assert slos[1] == SLO("AC-P02", "/memory", 50.0)
+        rolling = RollingLatency(window=60.0, slos=slos, clock=FakeClock())
+        assert rolling.record("/calculate", 0.099) is None
+        assert rolling.record("/memory/add", 0.051) == slos[1]
+        assert rolling.record("/memoryx", 0.5) is None
+        assert rolling.record("/history", 5.0) is None
+        assert rolling.breaches == {"AC-P01": 0, "AC-P02": 1}
@@ -0,0 +1,104 @@
+"""Unit tests for the server launcher."""
+
+from dataclasses import replace
+
+import pytest
+
+
+class TestServerOptions:
+    """Tests for server_options."""
+
+    def test_defaults_bind_host_and_port(self) -> None:
+        """Default settings bind TCP host/port with no concurrency limit."""
+        from main import server_options
+        from src.config import Settings
+
+        options = server_options(Settings())
+        assert options["host"] == "127.0.0.1"
+        assert options["port"] == 8000
+        assert "uds" not in options
+        assert "limit_concurrency" not in options
+        assert options["workers"] == 1
+        assert options["timeout_keep_alive"] == 5
+        assert options["backlog"] == 2048
+        assert options["timeout_graceful_shutdown"] == 30
+        assert options["proxy_headers"] is True
+        assert options["forwarded_allow_ips"] == "127.0.0.1,::1"
+
+    def test_unix_socket_replaces_host_port(self) -> None:
+        """Configuring a Unix socket drops host/port."""
+        from main import server_options
+        from src.config import Settings
+
+        options = server_options(
+            replace(
+                Settings(), server_uds="/tmp/calc.sock", server_limit_concurrency=500
+            )
+        )
+        assert options["uds"] == "/tmp/calc.sock"
+        assert "host" not in options
+        assert options["limit_concurrency"] == 500
+
+    def test_accelerators_used_when_installed(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """uvloop and httptools are selected when importable."""
+        import main
+        from src.config import Settings
+
+        monkeypatch.setattr(main, "_installed", lambda module: True)
+        options = main.server_options(Settings())
+        assert options["loop"] == "uvloop"
+        assert options["http"] == "httptools"
+
+    def test_falls_back_without_accelerators(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """asyncio and h11 are used when the accelerators are missing."""
+        import main
+        from src.config import Settings
+
+        monkeypatch.setattr(main, "_installed", lambda module: False)
+        options = main.server_options(Settings())
+        assert options["loop"] == "asyncio"
+        assert options["http"] == "h11"
+
+    def test_settings_read_from_environment(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """CALC_SERVER_* variables override defaults."""
+        from src.config import Settings
+
+        monkeypatch.setenv("CALC_SERVER_WORKERS", "4")
+        monkeypatch.setenv("CALC_SERVER_PORT", "9000")
+        settings = Settings.from_env()
+        assert settings.server_workers == 4
+        assert settings.server_port == 9000
+
+    def test_multiple_workers_warn_about_per_process_state(
+        self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Starting several workers warns that state is not shared."""
+        import main
+        from src import config
+
+        calls: list[dict[str, object]] = []
+        monkeypatch.setattr(
+            config, "settings", replace(config.settings, server_workers=4)
+        )
+        monkeypatch.setattr(
+            main.uvicorn, "run", lambda app, **options: calls.append(options)
+        )
+        main.main()
+        assert calls[0]["workers"] == 4
+        assert "per worker" in caplog.text
+
+    def test_single_worker_does_not_warn(
+        self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """The default single worker starts silently."""
+        import main
+
+        monkeypatch.setattr(main.uvicorn, "run", lambda app, **options: None)
+        main.main()
+        assert caplog.text == ""
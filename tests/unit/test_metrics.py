@@ -0,0 +1,96 @@
+"""Unit tests for the metrics collectors and exposition format."""
+
+import pytest
+
+
+@pytest.fixture
+def registry(monkeypatch: pytest.MonkeyPatch) -> list[object]:
+    """Give each test an empty registry."""
+    from src import metrics
+
+    fresh: list[object] = []
+    monkeypatch.setattr(metrics, "REGISTRY", fresh)
+    return fresh
+
+
+@pytest.mark.usefixtures("registry")
+class TestMetrics:
+    """Tests for Counter, Gauge, Histogram and render()."""
+
+    def test_counter_renders_total_per_label_set(self) -> None:
+        """Counters expose one sample per label set under their HELP/TYPE name."""
+        from src.metrics import Counter, render
+
+        counter = Counter("ops_total", "Operations.", ("operator",))
+        counter.inc("+")
+        counter.inc("+")
+        counter.inc("/", amount=3.0)
+        text = render()
+        assert "# HELP ops_total Operations." in text
+        assert "# TYPE ops_total counter" in text
+        assert 'ops_total{operator="+"} 2.0' in text
+        assert 'ops_total{operator="/"} 3.0' in text
+
+    def test_histogram_buckets_are_cumulative(self) -> None:
+        """Bucket counts include every smaller bucket; +Inf equals _count."""
+        from src.metrics import Histogram, render
+
+        histogram = Histogram("lat", "Latency.", ("route",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.5, 5.0):
+            histogram.observe(value, "/x")
+        text = render()
+        assert 'lat_bucket{route="/x",le="0.1"} 1' in text
+        assert 'lat_bucket{route="/x",le="1.0"} 3' in text
+        assert 'lat_bucket{route="/x",le="+Inf"} 4' in text
+        assert 'lat_count{route="/x"} 4' in text
+        assert 'lat_sum{route="/x"} 6.05' in text
+        assert histogram.count("/x") == 4
+
+    def test_gauge_reads_callback(self) -> None:
+        """Callback gauges are evaluated at scrape time."""
+        from src.metrics import Gauge, render
+
+        size = [3]
+        Gauge("size", "Size.", lambda: size[0])
+        size[0] = 7
+        assert "size 7" in render()
+
+    def test_special_values_use_exposition_spelling(self) -> None:
+        """Infinities and NaN render as +Inf, -Inf and NaN."""
+        from src.metrics import Gauge, render
+
+        Gauge("up", "Up.", lambda: float("inf"))
+        Gauge("down", "Down.", lambda: float("-inf"))
+        Gauge("unknown", "Unknown.", lambda: float("nan"))
+        lines = render().splitlines()
+        assert {"up +Inf", "down -Inf", "unknown NaN"} <= set(lines)
+
+    def test_label_values_are_escaped(self) -> None:
+        """Quotes, backslashes and newlines in labels are escaped."""
+        from src.metrics import Counter, render
+
+        Counter("c_total", "C.", ("v",)).inc('a"b\\c\nd')
+        assert 'c_total{v="a\\"b\\\\c\\nd"} 1.0' in render()
+
+    def test_reset_keeps_gauges(self) -> None:
+        """reset() drops counts and observations but not gauge state."""
+        from src.metrics import Counter, Gauge, Histogram, render, reset
+
+        counter = Counter("ops_total", "Operations.")
+        histogram = Histogram("lat", "Latency.")
+        gauge = Gauge("busy", "Busy.")
+        counter.inc()
+        histogram.observe(0.1)
+        gauge.inc()
+        reset()
+        text = render()
+        assert "ops_total 1.0" not in text
+        assert histogram.count() == 0
+        assert "busy 1.0" in text
+
+    def test_metric_requires_samples(self) -> None:
+        """Collectors must implement samples()."""
+        from src.metrics import _Metric
+
+        with pytest.raises(TypeError):
+            _Metric("m", "M.")  # type: ignore[abstract]
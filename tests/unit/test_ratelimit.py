@@ -0,0 +1,165 @@
+"""Unit tests for token-bucket rate limiting."""
+
+from dataclasses import replace
+
+import pytest
+
+
+class TestTokenBuckets:
+    """Tests for TokenBuckets."""
+
+    def test_burst_then_limited(self) -> None:
+        """A client may spend its burst, then waits for a refill."""
+        from src.ratelimit import TokenBuckets
+
+        buckets = TokenBuckets(rate=2.0, burst=3)
+        assert [buckets.take("a", 0.0) for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert buckets.take("a", 0.0) == pytest.approx(0.5)
+        assert buckets.limited == 1
+
+    def test_lazy_refill(self) -> None:
+        """Tokens accrue with elapsed time, capped at the burst size."""
+        from src.ratelimit import TokenBuckets
+
+        buckets = TokenBuckets(rate=2.0, burst=2)
+        buckets.take("a", 0.0)
+        buckets.take("a", 0.0)
+        assert buckets.take("a", 0.5) == 0.0
+        assert buckets.take("a", 0.5) > 0.0
+        assert [buckets.take("a", 100.0) for _ in range(2)] == [0.0, 0.0]
+        assert buckets.take("a", 100.0) > 0.0
+
+    def test_clients_are_independent(self) -> None:
+        """Each client key has its own bucket."""
+        from src.ratelimit import TokenBuckets
+
+        buckets = TokenBuckets(rate=1.0, burst=1)
+        assert buckets.take("a", 0.0) == 0.0
+        assert buckets.take("b", 0.0) == 0.0
+        assert buckets.take("a", 0.0) > 0.0
+
+    def test_refilled_buckets_are_reclaimed(self) -> None:
+        """Slots of fully refilled buckets are reused by new clients."""
+        from src.ratelimit import TokenBuckets
+
+        buckets = TokenBuckets(rate=1.0, burst=2)
+        buckets.take("a", 0.0)
+        buckets.take("b", 0.0)
+        assert len(buckets) == 2
+        buckets.take("c", 10.0)
+        assert len(buckets) == 1
+        assert len(buckets._tokens) == 2
+
+    def test_reset_refills(self) -> None:
+        """reset() gives a client a full bucket."""
+        from src.ratelimit import TokenBuckets
+
+        buckets = TokenBuckets(rate=1.0, burst=1)
+        buckets.take("a", 0.0)
+        buckets.reset("a")
+        assert buckets.take("a", 0.0) == 0.0
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter rule matching."""
+
+    def test_parse_rules(self) -> None:
+        """prefix=rate:burst pairs are parsed; burst defaults to the rate."""
+        from src.ratelimit import parse_rules
+
+        assert parse_rules("/memory/add=20:40, calculate=5") == {
+            "memory/add": (20.0, 40),
+            "calculate": (5.0, 5),
+        }
+
+    def test_defaults_limit_only_memory_writes(self) -> None:
+        """Out of the box, calculations and reads are never rate limited."""
+        from src.ratelimit import RateLimiter
+
+        limiter = RateLimiter()
+        assert all(limiter.check("/calculate", "k") == 0.0 for _ in range(1000))
+        assert all(limiter.check("/memory", "k") == 0.0 for _ in range(1000))
+        assert {stats.rule for stats in limiter.stats()} == {
+            "memory/add",
+            "memory/subtract",
+            "memory/batch",
+        }
+
+    def test_longest_prefix_wins(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Per-route rules override the default; rate 0 disables a rule."""
+        from src import config
+        from src.ratelimit import RateLimiter
+
+        monkeypatch.setattr(
+            config,
+            "settings",
+            replace(
+                config.settings,
+                rate_limit_rate=100.0,
+                rate_limit_burst=100,
+                rate_limit_routes="memory=0,memory/add=1:1",
+            ),
+        )
+        limiter = RateLimiter()
+        assert limiter.check("/memory/add", "k") == 0.0
+        assert limiter.check("/memory/add", "k") > 0.0
+        assert limiter.check("/memory/additional", "k") == 0.0
+        assert all(limiter.check("/memory", "k") == 0.0 for _ in range(200))
+        assert limiter.check("/calculate", "k") == 0.0
+        rules = {stats.rule: stats for stats in limiter.stats()}
+        assert set(rules) == {"memory/add", "*"}
+        assert rules["memory/add"].limited == 1
+
+
+class TestClientKey:
+    """Tests for client_key."""
+
+    @staticmethod
+    def _scope(headers: dict[str, str], peer: str = "127.0.0.1") -> dict[str, object]:
+        return {
+            "type": "http",
+            "headers": [(k.encode(), v.encode()) for k, v in headers.items()],
+            "client": (peer, 1234),
+        }
+
+    def test_session_header_then_cookie(self) -> None:
+        """Sessions from the header win over the cookie, which wins over IP."""
+        from src.ratelimit import client_key
+
+        cookie = {"cookie": "theme=dark; calc_session=abc"}
+        assert client_key(self._scope({"x-session-id": "h", **cookie})) == "s:h"
+        assert client_key(self._scope(cookie)) == "s:abc"
+        assert client_key(self._scope({})) == "ip:127.0.0.1"
+
+    def test_forwarded_for_from_trusted_proxy(self) -> None:
+        """A trusted proxy's X-Forwarded-For names the client."""
+        from src.ratelimit import client_key
+
+        forwarded = {"x-forwarded-for": "198.51.100.7, 203.0.113.9, 127.0.0.1"}
+        assert client_key(self._scope(forwarded)) == "ip:203.0.113.9"
+
+    def test_forwarded_for_from_untrusted_peer_is_ignored(self) -> None:
+        """Clients cannot pick their own bucket by spoofing the header."""
+        from src.ratelimit import client_key
+
+        forwarded = {"x-forwarded-for": "198.51.100.7"}
+        scope = self._scope(forwarded, peer="203.0.113.50")
+        assert client_key(scope) == "ip:203.0.113.50"
+
+    def test_trusted_networks(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Proxies may be listed as networks, or all trusted with "*"."""
+        from src import config
+        from src.ratelimit import client_address
+
+        forwarded = "198.51.100.7, 10.1.2.3"
+        monkeypatch.setattr(
+            config,
+            "settings",
+            replace(config.settings, server_forwarded_allow_ips="10.0.0.0/8"),
+        )
+        scope = self._scope({}, peer="10.9.9.9")
+        assert client_address(scope, forwarded) == "198.51.100.7"
+        monkeypatch.setattr(
+            config, "settings", replace(config.settings, server_forwarded_allow_ips="*")
+        )
+        assert client_address(scope, forwarded) == "198.51.100.7"